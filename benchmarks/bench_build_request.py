@@ -0,0 +1,73 @@
+"""
+Measures the overhead of `BaseClient.build_request` for typical operations.
+
+Usage:
+    python -m benchmarks.bench_build_request [--number N]
+"""
+
+import argparse
+import timeit
+import typing
+
+import httpx
+
+from pets_py.core import AuthKey, PathTemplate, SyncBaseClient
+
+
+def report(label: str, stmt: typing.Callable[[], typing.Any], number: int) -> None:
+    elapsed = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+    print(f"{label:40} {elapsed * 1e9:10.0f} ns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    client = SyncBaseClient(
+        base_url="https://petstore.example.com/api/v3/",
+        httpx_client=httpx.Client(),
+    )
+    client.register_auth(
+        "api_key", AuthKey(name="api_key", location="header", val="secret")
+    )
+
+    pet_path = PathTemplate("/pet/{petId}")
+    report(
+        "GET /pet/{petId}",
+        lambda: client.build_request(
+            method="GET",
+            path=pet_path,
+            path_params={"petId": 10},
+            auth_names=["api_key"],
+            request_options={},
+        ),
+        args.number,
+    )
+    report(
+        "GET /pet/findByStatus?status=sold",
+        lambda: client.build_request(
+            method="GET",
+            path="/pet/findByStatus",
+            auth_names=["api_key"],
+            query_params={"status": "sold"},
+            request_options={},
+        ),
+        args.number,
+    )
+    report(
+        "POST /pet (json)",
+        lambda: client.build_request(
+            method="POST",
+            path="/pet",
+            auth_names=["api_key"],
+            json={"name": "doggie", "photoUrls": []},
+            content_type="application/json",
+            request_options={"additional_headers": {"x-trace": "1"}},
+        ),
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures request body compression: compressed size, compression time and the
+time saved sending the body over a link of the given bandwidth, for a bulk
+`pet.create` JSON body and a (poorly compressible) image upload.
+
+Usage:
+    python -m benchmarks.bench_compression [--mbit N]
+"""
+
+import argparse
+import json
+import os
+import timeit
+import typing
+
+from pets_py.core import CompressionAlgorithm, compress_bytes, compression
+
+
+def algorithms() -> typing.List[CompressionAlgorithm]:
+    available: typing.List[CompressionAlgorithm] = ["gzip"]
+    try:
+        compression.check_compression("zstd")
+        available.append("zstd")
+    except ImportError:
+        print("zstandard is not installed, only gzip is measured")
+    return available
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mbit", type=float, default=100.0)
+    args = parser.parse_args()
+    bytes_per_second = args.mbit * 1e6 / 8
+
+    pet = {
+        "id": 10,
+        "name": "doggie",
+        "category": {"id": 1, "name": "Dogs"},
+        "photoUrls": [f"https://img.example.com/pets/10/{i}.jpg" for i in range(500)],
+        "tags": [{"id": i, "name": f"tag-{i % 20}"} for i in range(500)],
+        "status": "available",
+    }
+    bodies = [
+        ("pet JSON", json.dumps(pet).encode()),
+        ("image", os.urandom(256 * 1024) + bytes(768 * 1024)),
+    ]
+
+    available = algorithms()
+    print(
+        f"{'body':<10}{'algorithm':<10}{'size (KB)':>11}{'compress (ms)':>15}"
+        f"{f'saved @ {args.mbit:g} Mbit/s (ms)':>28}"
+    )
+    for label, body in bodies:
+        print(f"{label:<10}{'-':<10}{len(body) / 1e3:>11.1f}")
+        for algorithm in available:
+            compressed = compress_bytes(body, algorithm)
+            elapsed = (
+                min(
+                    timeit.repeat(
+                        lambda: compress_bytes(body, algorithm), number=5, repeat=3
+                    )
+                )
+                / 5
+            )
+            saved = (len(body) - len(compressed)) / bytes_per_second - elapsed
+            print(
+                f"{'':<10}{algorithm:<10}{len(compressed) / 1e3:>11.1f}"
+                f"{elapsed * 1e3:>15.2f}{saved * 1e3:>28.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
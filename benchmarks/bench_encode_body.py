@@ -0,0 +1,63 @@
+"""
+Compares encoding request bodies into JSON bytes through `to_encodable` plus
+httpx-style `json.dumps` against the compiled encoders of `to_json_bytes`.
+
+Usage:
+    python -m benchmarks.bench_encode_body [--number N]
+"""
+
+import argparse
+import timeit
+import typing
+
+from pets_py.core import json_dumps, to_encodable, to_json_bytes
+from pets_py.types import params
+
+PET = {
+    "category": {"id": 1, "name": "Dogs"},
+    "id": 10,
+    "status": "available",
+    "tags": [{"id": i, "name": f"tag-{i}"} for i in range(5)],
+    "name": "doggie",
+    "photo_urls": [f"https://img.example.com/pets/10/{i}.jpg" for i in range(3)],
+}
+ORDER = {"id": 10, "pet_id": 198772, "quantity": 7, "status": "approved"}
+
+CASES: typing.List[typing.Tuple[str, typing.Any, typing.Any]] = [
+    ("_SerializerPet", PET, params._SerializerPet),
+    ("_SerializerOrder", ORDER, params._SerializerOrder),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'case':<20}{'pydantic (us)':>16}{'compiled (us)':>16}{'speedup':>10}")
+    for name, item, dump_with in CASES:
+        assert to_json_bytes(item=item, dump_with=dump_with) == json_dumps(
+            to_encodable(item=item, dump_with=dump_with)
+        )
+        before = min(
+            timeit.repeat(
+                lambda: json_dumps(to_encodable(item=item, dump_with=dump_with)),
+                number=args.number,
+                repeat=3,
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda: to_json_bytes(item=item, dump_with=dump_with),
+                number=args.number,
+                repeat=3,
+            )
+        )
+        print(
+            f"{name:<20}{before / args.number * 1e6:>16.1f}"
+            f"{after / args.number * 1e6:>16.1f}{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Compares HTTP/1.1 and HTTP/2 for a fan-out of concurrent `pet.get` calls from an
+`AsyncClient` against local servers.
+
+HTTP/1.1 opens a connection per in-flight request (up to the pool limit), HTTP/2
+multiplexes them as streams of one connection. Both servers run in their own
+process and answer after `--delay-ms`. The servers are cleartext, so the TLS
+handshake HTTP/2 saves on every extra HTTP/1.1 connection is not part of the
+numbers: against a real `https` endpoint the gap for cold fan-outs is larger.
+
+Usage:
+    python -m benchmarks.bench_http2 [--requests N] [--concurrency N] [--delay-ms N]
+        [--streams N]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+import typing
+
+import httpx
+
+from benchmarks.bench_pool import PET, run_server
+from pets_py import AsyncClient
+from pets_py.core import AsyncStreamLimitTransport, pool_limits
+
+
+def run_h2_server(sock: socket.socket, delay: float) -> None:
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    headers = [
+        (":status", "200"),
+        ("content-type", "application/json"),
+        ("content-length", str(len(PET))),
+    ]
+
+    async def respond(
+        conn: typing.Any, writer: asyncio.StreamWriter, stream_id: int
+    ) -> None:
+        await asyncio.sleep(delay)
+        conn.send_headers(stream_id, headers)
+        conn.send_data(stream_id, PET, end_stream=True)
+        writer.write(conn.data_to_send())
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        while data := await reader.read(65536):
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    asyncio.ensure_future(respond(conn, writer, event.stream_id))
+            writer.write(conn.data_to_send())
+        writer.close()
+
+    async def serve() -> None:
+        server = await asyncio.start_server(handle, sock=sock)
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def start(
+    target: typing.Callable[..., None], delay: float
+) -> typing.Tuple[str, typing.Any]:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1024)
+    process = multiprocessing.Process(target=target, args=(sock, delay), daemon=True)
+    process.start()
+    return f"http://127.0.0.1:{sock.getsockname()[1]}", process
+
+
+async def run(
+    client: AsyncClient, requests: int, concurrency: int
+) -> typing.Tuple[float, float, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: typing.List[float] = []
+
+    async def call() -> None:
+        async with semaphore:
+            begin = time.perf_counter()
+            await client.pet.get(pet_id=10)
+            latencies.append(time.perf_counter() - begin)
+
+    # the first (cold) fan-out includes connection setup
+    start_time = time.perf_counter()
+    await asyncio.gather(*[call() for _ in range(requests)])
+    elapsed = time.perf_counter() - start_time
+    await client._base_client.httpx_client.aclose()
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    return requests / elapsed, statistics.median(latencies), p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--streams", type=int, default=100)
+    args = parser.parse_args()
+
+    delay = args.delay_ms / 1e3
+    h1_url, h1_server = start(run_server, delay)
+    h2_url, h2_server = start(run_h2_server, delay)
+    limits = pool_limits()
+    clients = {
+        "HTTP/1.1": lambda: AsyncClient(base_url=h1_url),
+        # cleartext HTTP/2 with prior knowledge, https endpoints negotiate it
+        # with AsyncClient(http2=True)
+        "HTTP/2": lambda: AsyncClient(
+            base_url=h2_url,
+            httpx_client=httpx.AsyncClient(
+                transport=AsyncStreamLimitTransport(
+                    httpx.AsyncHTTPTransport(http1=False, http2=True, limits=limits),
+                    max_concurrent_streams=args.streams,
+                )
+            ),
+        ),
+    }
+
+    print(f"{'':10}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    try:
+        for label, client in clients.items():
+            rps, p50, p99 = asyncio.run(run(client(), args.requests, args.concurrency))
+            print(f"{label:10}{rps:>10.0f}{p50 * 1e3:>10.1f}{p99 * 1e3:>10.1f}")
+    finally:
+        h1_server.terminate()
+        h2_server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares the memory held by decoded pets with and without an Interner.
+
+Usage:
+    python -m benchmarks.bench_interning [--pets N]
+"""
+
+import argparse
+import time
+import typing
+
+from benchmarks.bench_pet_frame import make_payload, measure
+from pets_py.core import Interner, from_json_bytes, record_from_encodable
+from pets_py.types import models, records
+
+
+def timed(build: typing.Callable[[], typing.Any]) -> float:
+    # measure() runs under tracemalloc, which inflates allocation heavy timings
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=100_000)
+    args = parser.parse_args()
+    payload = make_payload(args.pets)
+
+    def decode_models() -> typing.Any:
+        return from_json_bytes(data=payload, load_with=typing.List[models.Pet])
+
+    def decode_records() -> typing.Any:
+        return record_from_encodable(
+            data=decode_models(), load_with=typing.List[models.Pet]
+        )
+
+    print(f"pets: {args.pets}, payload: {len(payload) / 1e6:.1f} MB")
+    for label, decode, flyweight_types in [
+        ("models", decode_models, [models.Category, models.Tag]),
+        ("records", decode_records, [records.Category, records.Tag]),
+    ]:
+        plain, plain_size, _ = measure(decode)
+        del plain
+        plain_time = timed(decode)
+        interner = Interner(flyweight_types=flyweight_types)
+        interned, interned_size, _ = measure(lambda: interner.intern(decode()))
+        del interned
+        stats = interner.stats()
+        interned_time = timed(lambda: interner.intern(decode()))
+        print(
+            f"{label:8} plain:    {plain_size / 1e6:8.1f} MB held, "
+            f"built in {plain_time:.2f}s"
+        )
+        print(
+            f"{label:8} interned: {interned_size / 1e6:8.1f} MB held, "
+            f"built in {interned_time:.2f}s "
+            f"(hit rate {stats['hit_rate']:.1%}, {stats['size']} table entries)"
+        )
+        print(f"{label:8} reduction: {plain_size / interned_size:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares the available JSON codecs encoding and decoding a single `Pet` and a
+10k-pet `findByStatus` payload.
+
+Usage:
+    python -m benchmarks.bench_json_codecs [--pets N]
+"""
+
+import argparse
+import json
+import timeit
+import typing
+
+from benchmarks.bench_pet_frame import make_payload
+from pets_py.core import JsonCodec, get_json_codec
+
+
+def codecs() -> typing.List[JsonCodec]:
+    available = [get_json_codec("stdlib")]
+    try:
+        available.append(get_json_codec("orjson"))
+    except ImportError:
+        print("orjson is not installed, only the stdlib codec is measured")
+    return available
+
+
+def report(label: str, stmt: typing.Callable[[], typing.Any], number: int) -> float:
+    elapsed = min(timeit.repeat(stmt, number=number, repeat=3)) / number
+    print(f"  {label:24} {elapsed * 1e6:12.1f} us")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=10_000)
+    args = parser.parse_args()
+
+    pet_bytes = make_payload(1)[1:-1]
+    bulk_bytes = make_payload(args.pets)
+    payloads = [
+        (f"Pet ({len(pet_bytes)} B)", pet_bytes, 20_000),
+        (f"{args.pets} pets ({len(bulk_bytes) / 1e6:.1f} MB)", bulk_bytes, 5),
+    ]
+
+    for label, raw, number in payloads:
+        data = json.loads(raw)
+        print(label)
+        baseline: typing.Dict[str, float] = {}
+        for codec in codecs():
+            for op, stmt in [
+                ("dumps", lambda: codec.dumps(data)),
+                ("loads", lambda: codec.loads(raw)),
+            ]:
+                elapsed = report(f"{codec.name} {op}", stmt, number)
+                if op in baseline:
+                    print(f"  {'':24} {baseline[op] / elapsed:11.1f}x")
+                else:
+                    baseline[op] = elapsed
+
+
+if __name__ == "__main__":
+    main()
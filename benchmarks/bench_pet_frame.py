@@ -0,0 +1,84 @@
+"""
+Compares the memory held by a list of `models.Pet` with the equivalent `PetFrame`.
+
+Usage:
+    python -m benchmarks.bench_pet_frame [--pets N]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import typing
+
+from pets_py.core import from_json_bytes
+from pets_py.types import models
+from pets_py.types.frames import PetFrame
+
+
+def make_payload(n: int) -> bytes:
+    statuses = ["available", "pending", "sold"]
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "name": f"pet-{i}",
+                "category": {"id": i % 7, "name": f"category-{i % 7}"},
+                "photoUrls": [
+                    f"https://img.example.com/pets/{i}/{j}.jpg" for j in range(2)
+                ],
+                "tags": [{"id": i % 11, "name": f"tag-{i % 11}"}],
+                "status": statuses[i % 3],
+            }
+            for i in range(n)
+        ]
+    ).encode()
+
+
+def measure(
+    build: typing.Callable[[], typing.Any],
+) -> typing.Tuple[typing.Any, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=100_000)
+    args = parser.parse_args()
+    payload = make_payload(args.pets)
+
+    pets, pets_size, pets_time = measure(
+        lambda: from_json_bytes(data=payload, load_with=typing.List[models.Pet])
+    )
+    del pets
+    frame, frame_size, frame_time = measure(
+        lambda: PetFrame.from_json(json.loads(payload))
+    )
+
+    print(f"pets: {args.pets}, payload: {len(payload) / 1e6:.1f} MB")
+    print(
+        f"List[models.Pet]: {pets_size / 1e6:8.1f} MB held, built in {pets_time:.2f}s"
+    )
+    print(
+        f"PetFrame:         {frame_size / 1e6:8.1f} MB held, built in {frame_time:.2f}s"
+    )
+    print(f"reduction:        {pets_size / frame_size:8.1f}x")
+
+    start = time.perf_counter()
+    sold = frame.where(status=["sold"], tag_names=["tag-3"])
+    print(
+        f"where(status, tag_names): {len(sold)} rows in {time.perf_counter() - start:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
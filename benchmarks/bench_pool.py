@@ -0,0 +1,112 @@
+"""
+Measures throughput and latency of concurrent `pet.get` calls against a local
+server as the client's connection pool size changes.
+
+The server runs in its own process and answers each request after
+`--delay-ms`, like a remote API would. Requests are sent from an `AsyncClient`
+with `--concurrency` in flight; when the pool is smaller than that, requests
+queue for a connection and the tail latency is mostly pool wait. Past the point
+where the client's CPU is saturated, larger pools stop helping (and the pool's
+own bookkeeping grows), so measure on hardware like production's.
+
+Usage:
+    python -m benchmarks.bench_pool [--requests N] [--concurrency N] [--delay-ms N]
+        [--pool-sizes N [N ...]]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+import typing
+
+from pets_py import AsyncClient
+
+PET = b'{"id":10,"name":"doggie","photoUrls":["string"],"status":"available"}'
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+    b"content-length: %d\r\n\r\n%s" % (len(PET), PET)
+)
+
+
+def run_server(sock: socket.socket, delay: float) -> None:
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(delay)
+                writer.write(RESPONSE)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def serve() -> None:
+        server = await asyncio.start_server(handle, sock=sock)
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+async def run(
+    base_url: str, pool_size: int, requests: int, concurrency: int
+) -> typing.Tuple[float, float, float]:
+    client = AsyncClient(
+        base_url=base_url,
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: typing.List[float] = []
+
+    async def call() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.pet.get(pet_id=10)
+            latencies.append(time.perf_counter() - start)
+
+    # open the pool's connections before measuring
+    await asyncio.gather(*[call() for _ in range(min(pool_size, requests))])
+    latencies.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*[call() for _ in range(requests)])
+    elapsed = time.perf_counter() - start
+    await client._base_client.httpx_client.aclose()
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    return requests / elapsed, statistics.median(latencies), p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument(
+        "--pool-sizes", type=int, nargs="+", default=[8, 20, 50, 100, 200]
+    )
+    args = parser.parse_args()
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1024)
+    server = multiprocessing.Process(
+        target=run_server, args=(sock, args.delay_ms / 1e3), daemon=True
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    print(f"{'max_connections':>16}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    try:
+        for size in args.pool_sizes:
+            rps, p50, p99 = asyncio.run(
+                run(base_url, size, args.requests, args.concurrency)
+            )
+            print(f"{size:>16}{rps:>10.0f}{p50 * 1e3:>10.1f}{p99 * 1e3:>10.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures the per-response dispatch overhead of `BaseClient.process_response`:
+content type classification, cast type resolution and raw response detection,
+with and without memoization, plus a full `process_response` call.
+
+Usage:
+    python -m benchmarks.bench_process_response [--number N]
+"""
+
+import argparse
+import json
+import timeit
+import typing
+
+import httpx
+
+from pets_py.core import BinaryResponse, SyncBaseClient
+from pets_py.core.utils import (
+    _classify_content_type,
+    _filter_binary_response,
+    filter_binary_response,
+    get_response_type,
+    is_raw_response_type,
+)
+from pets_py.types import models
+
+PET = {"id": 10, "name": "doggie", "photoUrls": [], "status": "available"}
+
+
+def report(label: str, stmt: typing.Callable[[], typing.Any], number: int) -> float:
+    elapsed = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+    print(f"{label:48} {elapsed * 1e9:10.0f} ns")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+    number = args.number
+
+    headers = httpx.Headers({"content-type": "application/json; charset=utf-8"})
+    cast_to = typing.Union[models.Pet, BinaryResponse]
+
+    print("dispatch helpers (per call)")
+    uncached = report(
+        "classify content type (uncached)",
+        lambda: _classify_content_type(headers.get("content-type")),
+        number,
+    )
+    cached = report(
+        "get_response_type (memoized)", lambda: get_response_type(headers), number
+    )
+    print(f"{'':48} {uncached / cached:10.1f}x")
+    uncached = report(
+        "filter_binary_response (uncached)",
+        lambda: _filter_binary_response(cast_to),
+        number,
+    )
+    cached = report(
+        "filter_binary_response (memoized)",
+        lambda: filter_binary_response(cast_to=cast_to),
+        number,
+    )
+    print(f"{'':48} {uncached / cached:10.1f}x")
+
+    def issubclass_check() -> bool:
+        try:
+            return issubclass(cast_to, httpx.Response)  # type: ignore[arg-type]
+        except TypeError:
+            return False
+
+    uncached = report("raw response check (issubclass)", issubclass_check, number)
+    cached = report(
+        "is_raw_response_type (memoized)", lambda: is_raw_response_type(cast_to), number
+    )
+    print(f"{'':48} {uncached / cached:10.1f}x")
+
+    client = SyncBaseClient(
+        base_url="http://petstore.test", httpx_client=httpx.Client()
+    )
+    response = httpx.Response(200, content=json.dumps(PET).encode(), headers=headers)
+    print("\nprocess_response (per response)")
+    report(
+        "Pet JSON body",
+        lambda: client.process_response(response=response, cast_to=cast_to),
+        number // 10,
+    )
+    report(
+        "typing.Any JSON body",
+        lambda: client.process_response(response=response, cast_to=typing.Any),
+        number // 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Measures query parameter encoding: the compiled `QueryParamEncoder` against
+`encode_query_param`, and building httpx requests from `params=` against the
+final query string of `encode_query_string`.
+
+Usage:
+    python -m benchmarks.bench_query [--number N]
+"""
+
+import argparse
+import timeit
+import typing
+
+import httpx
+
+from pets_py.core import QueryParamEncoder, encode_query_param, encode_query_string
+
+URL = "http://petstore.test/v3/pet/findByStatus"
+VALUES: typing.List[typing.Tuple[str, typing.Any, typing.Any, bool]] = [
+    ("form scalar", "available", "form", True),
+    ("form list", ["available", "pending", 3, True], "form", False),
+    ("deepObject", {"a": {"b": 1, "c": [1, 2]}, "d": "e"}, "deepObject", True),
+]
+
+
+def report(label: str, before: float, after: float, number: int) -> None:
+    print(
+        f"{label:<24}{before / number * 1e6:>12.2f}"
+        f"{after / number * 1e6:>12.2f}{before / after:>9.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50000)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'case':<24}{'before (us)':>12}{'after (us)':>12}{'speedup':>10}")
+    for label, value, style, explode in VALUES:
+        encoder = QueryParamEncoder("q", style=style, explode=explode)
+        before = min(
+            timeit.repeat(
+                lambda: encode_query_param({}, "q", value, style, explode),
+                number=number,
+                repeat=3,
+            )
+        )
+        after = min(
+            timeit.repeat(lambda: encoder.encode({}, value), number=number, repeat=3)
+        )
+        report(label, before, after, number)
+
+    client = httpx.Client()
+    params = {"status": ["available", "sold"], "api_key": "k", "page": 2}
+    assert (
+        client.build_request("GET", URL, params=params).url
+        == client.build_request("GET", URL + "?" + encode_query_string(params)).url
+    )
+    number //= 10
+    before = min(
+        timeit.repeat(
+            lambda: client.build_request("GET", URL, params=params),
+            number=number,
+            repeat=3,
+        )
+    )
+    after = min(
+        timeit.repeat(
+            lambda: client.build_request(
+                "GET", URL + "?" + encode_query_string(params)
+            ),
+            number=number,
+            repeat=3,
+        )
+    )
+    report("httpx request", before, after, number)
+
+
+if __name__ == "__main__":
+    main()
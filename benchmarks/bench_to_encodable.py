@@ -0,0 +1,65 @@
+"""
+Measures the per-call cost of `to_encodable` with a freshly built TypeAdapter
+(the previous behavior) against the cached adapters in `serializer_registry`.
+
+Usage:
+    python -m benchmarks.bench_to_encodable [--number N]
+"""
+
+import argparse
+import timeit
+import typing
+
+import typing_extensions
+from pydantic import TypeAdapter
+
+from pets_py.core import filter_not_given, serializer_registry, to_encodable
+from pets_py.core.request import model_dump
+from pets_py.types import params
+
+PET = {
+    "category": {"id": 1, "name": "Dogs"},
+    "id": 10,
+    "status": "available",
+    "tags": [{"id": 123, "name": "string"}],
+    "name": "doggie",
+    "photo_urls": ["string"],
+}
+ORDER = {"id": 10, "pet_id": 198772, "quantity": 7, "status": "approved"}
+STATUS = typing_extensions.Literal["available", "pending", "sold"]
+
+CASES: typing.List[typing.Tuple[str, typing.Any, typing.Any]] = [
+    ("_SerializerPet", PET, params._SerializerPet),
+    ("_SerializerOrder", ORDER, params._SerializerOrder),
+    ("status literal", "available", STATUS),
+]
+
+
+def uncached_to_encodable(*, item: typing.Any, dump_with: typing.Any) -> typing.Any:
+    adapter: TypeAdapter = TypeAdapter(dump_with)
+    return model_dump(adapter.validate_python(filter_not_given(item)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'case':<20}{'uncached (us)':>16}{'cached (us)':>14}{'speedup':>10}")
+    for name, item, dump_with in CASES:
+        before = timeit.timeit(
+            lambda: uncached_to_encodable(item=item, dump_with=dump_with),
+            number=args.number,
+        )
+        after = timeit.timeit(
+            lambda: to_encodable(item=item, dump_with=dump_with), number=args.number
+        )
+        print(
+            f"{name:<20}{before / args.number * 1e6:>16.1f}"
+            f"{after / args.number * 1e6:>14.1f}{before / after:>9.1f}x"
+        )
+    print(f"serializer_registry: {serializer_registry.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Compares uploading a file through `pet.upload_image.create` when it is read
+into memory up front (`to_content`), streamed from a file object in chunks, and
+sent from a memory-mapped path.
+
+Two measurements are taken:
+
+* a draining transport that consumes the body chunk by chunk, like a real
+  connection, reporting the peak memory and the bytes the client copied into
+  Python `bytes` objects (memory-mapped chunks are `memoryview`s and copy none);
+* uploads to a local HTTP server over loopback, reporting the throughput.
+
+Usage:
+    python -m benchmarks.bench_upload [--mb N] [--rounds N]
+"""
+
+import argparse
+import http.server
+import os
+import pathlib
+import tempfile
+import threading
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from pets_py import Client
+from pets_py.core import to_content
+
+
+class DrainTransport(httpx.BaseTransport):
+    def __init__(self) -> None:
+        self.copied = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if isinstance(request.stream, httpx.ByteStream):
+            chunks: typing.Iterable[typing.Any] = [request.content]
+        else:
+            chunks = request.stream  # type: ignore[assignment]
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                self.copied += len(chunk)
+        return httpx.Response(
+            200, json={"code": 200}, headers={"content-type": "application/json"}
+        )
+
+
+class DrainHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        remaining = int(self.headers["content-length"])
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+        body = b'{"code":200}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+def strategies(
+    path: pathlib.Path,
+) -> typing.List[typing.Tuple[str, typing.Callable[[Client], typing.Any]]]:
+    def read_whole(client: Client) -> None:
+        with open(path, "rb") as file:
+            client.pet.upload_image.create(data=to_content(file=file), pet_id=1)
+
+    def streamed(client: Client) -> None:
+        with open(path, "rb") as file:
+            client.pet.upload_image.create(data=file, pet_id=1)
+
+    def mapped(client: Client) -> None:
+        client.pet.upload_image.create(data=path, pet_id=1)
+
+    return [("read()", read_whole), ("streamed", streamed), ("mmap", mapped)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), DrainHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "upload.bin"
+        path.write_bytes(os.urandom(1024 * 1024) * args.mb)
+
+        print(f"{args.mb} MB upload{'peak (MB)':>12}{'copied (MB)':>14}{'MB/s':>10}")
+        for label, upload in strategies(path):
+            drain = DrainTransport()
+            tracemalloc.start()
+            upload(
+                Client(
+                    httpx_client=httpx.Client(transport=drain),
+                    base_url="http://petstore.test",
+                )
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            client = Client(httpx_client=httpx.Client(), base_url=base_url)
+            upload(client)  # warm the connection
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                upload(client)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<14}{peak / 1e6:>12.1f}{drain.copied / 1e6:>14.1f}"
+                f"{args.mb * args.rounds / elapsed:>10.0f}"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
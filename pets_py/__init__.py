@@ -1,6 +1,14 @@
 from .client import AsyncClient, Client
 from .core import ApiError, BinaryResponse
 from .environment import Environment
+from .types.frames import PetFrame
 
 
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BinaryResponse",
+    "Client",
+    "Environment",
+    "PetFrame",
+]
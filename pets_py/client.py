@@ -1,7 +1,33 @@
 import httpx
 import typing
 
-from pets_py.core import AsyncBaseClient, AuthKey, SyncBaseClient
+from pets_py.core import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONCURRENT_STREAMS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncBaseClient,
+    AuthKey,
+    CompressionAlgorithm,
+    ConnectionSetup,
+    DnsCache,
+    DriftHandler,
+    Interner,
+    JsonCodec,
+    JsonCodecName,
+    ResponseFormat,
+    ResponseValidator,
+    SyncBaseClient,
+    ValidationMode,
+    async_client_transport,
+    async_shared_transport,
+    client_timeout,
+    get_json_codec,
+    client_transport,
+    pool_limits,
+    shared_transport,
+)
 from pets_py.environment import Environment, _get_base_url
 from pets_py.resources.pet import AsyncPetClient, PetClient
 from pets_py.resources.store import AsyncStoreClient, StoreClient
@@ -16,13 +42,70 @@ class Client:
         base_url: typing.Optional[str] = None,
         environment: Environment = Environment.ENVIRONMENT_1,
         api_key: typing.Optional[str] = None,
+        validation: ValidationMode = "lax",
+        validation_sample_rate: int = 100,
+        on_validation_drift: typing.Optional[DriftHandler] = None,
+        response_format: ResponseFormat = "model",
+        interner: typing.Optional[Interner] = None,
+        default_headers: typing.Optional[typing.Dict[str, str]] = None,
+        json_codec: typing.Union[JsonCodecName, JsonCodec] = "stdlib",
+        request_compression: typing.Optional[CompressionAlgorithm] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        max_connections: typing.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[
+            int
+        ] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: typing.Optional[float] = None,
+        http2: bool = False,
+        max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+        dns_cache: typing.Optional[DnsCache] = None,
+        share_transport: bool = False,
     ):
         """Initialize root client"""
+        codec = get_json_codec(json_codec)
+        limits = pool_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        url = _get_base_url(base_url=base_url, environment=environment)
+        # clients only close the httpx client they built
+        self._owns_httpx_client = httpx_client is None
         self._base_client = SyncBaseClient(
-            base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.Client(timeout=timeout)
+            base_url=url,
+            httpx_client=httpx.Client(
+                timeout=client_timeout(timeout, pool_timeout),
+                limits=limits,
+                transport=shared_transport(
+                    url,
+                    limits=limits,
+                    http2=http2,
+                    max_concurrent_streams=max_concurrent_streams,
+                    dns_cache=dns_cache,
+                )
+                if share_transport
+                else client_transport(
+                    limits=limits,
+                    http2=http2,
+                    max_concurrent_streams=max_concurrent_streams,
+                    dns_cache=dns_cache,
+                ),
+            )
             if httpx_client is None
             else httpx_client,
+            response_validator=ResponseValidator(
+                mode=validation,
+                sample_rate=validation_sample_rate,
+                on_drift=on_validation_drift,
+                codec=codec,
+            ),
+            response_format=response_format,
+            interner=interner,
+            default_headers=default_headers,
+            json_codec=codec,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
         )
         self._base_client.register_auth(
             "api_key", AuthKey(name="api_key", location="header", val=api_key)
@@ -30,6 +113,28 @@ class Client:
         self.pet = PetClient(base_client=self._base_client)
         self.store = StoreClient(base_client=self._base_client)
 
+    def warmup(self, *, connections: int = 1) -> typing.List[ConnectionSetup]:
+        """
+        Opens `connections` pooled connections to each base URL (DNS, TCP and TLS
+        setup) before traffic arrives, and returns how long each took to set up.
+        At most `max_keepalive_connections` of them stay open.
+        """
+        return self._base_client.warmup(connections=connections)
+
+    def close(self) -> None:
+        """
+        Closes the client's connections, or releases its lease of a shared
+        transport. A client given an `httpx_client` leaves it open.
+        """
+        if self._owns_httpx_client:
+            self._base_client.httpx_client.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
 
 class AsyncClient:
     def __init__(
@@ -40,16 +145,95 @@ class AsyncClient:
         base_url: typing.Optional[str] = None,
         environment: Environment = Environment.ENVIRONMENT_1,
         api_key: typing.Optional[str] = None,
+        validation: ValidationMode = "lax",
+        validation_sample_rate: int = 100,
+        on_validation_drift: typing.Optional[DriftHandler] = None,
+        response_format: ResponseFormat = "model",
+        interner: typing.Optional[Interner] = None,
+        default_headers: typing.Optional[typing.Dict[str, str]] = None,
+        json_codec: typing.Union[JsonCodecName, JsonCodec] = "stdlib",
+        request_compression: typing.Optional[CompressionAlgorithm] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        max_connections: typing.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[
+            int
+        ] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: typing.Optional[float] = None,
+        http2: bool = False,
+        max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+        dns_cache: typing.Optional[DnsCache] = None,
+        share_transport: bool = False,
     ):
         """Initialize root client"""
+        codec = get_json_codec(json_codec)
+        limits = pool_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        url = _get_base_url(base_url=base_url, environment=environment)
+        # clients only close the httpx client they built
+        self._owns_httpx_client = httpx_client is None
         self._base_client = AsyncBaseClient(
-            base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.AsyncClient(timeout=timeout)
+            base_url=url,
+            httpx_client=httpx.AsyncClient(
+                timeout=client_timeout(timeout, pool_timeout),
+                limits=limits,
+                transport=async_shared_transport(
+                    url,
+                    limits=limits,
+                    http2=http2,
+                    max_concurrent_streams=max_concurrent_streams,
+                    dns_cache=dns_cache,
+                )
+                if share_transport
+                else async_client_transport(
+                    limits=limits,
+                    http2=http2,
+                    max_concurrent_streams=max_concurrent_streams,
+                    dns_cache=dns_cache,
+                ),
+            )
             if httpx_client is None
             else httpx_client,
+            response_validator=ResponseValidator(
+                mode=validation,
+                sample_rate=validation_sample_rate,
+                on_drift=on_validation_drift,
+                codec=codec,
+            ),
+            response_format=response_format,
+            interner=interner,
+            default_headers=default_headers,
+            json_codec=codec,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
         )
         self._base_client.register_auth(
             "api_key", AuthKey(name="api_key", location="header", val=api_key)
         )
         self.pet = AsyncPetClient(base_client=self._base_client)
         self.store = AsyncStoreClient(base_client=self._base_client)
+
+    async def warmup(self, *, connections: int = 1) -> typing.List[ConnectionSetup]:
+        """
+        Opens `connections` pooled connections to each base URL (DNS, TCP and TLS
+        setup) before traffic arrives, and returns how long each took to set up.
+        At most `max_keepalive_connections` of them stay open.
+        """
+        return await self._base_client.warmup(connections=connections)
+
+    async def close(self) -> None:
+        """
+        Closes the client's connections, or releases its lease of a shared
+        transport. A client given an `httpx_client` leaves it open.
+        """
+        if self._owns_httpx_client:
+            await self._base_client.httpx_client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.close()
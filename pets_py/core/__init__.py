@@ -1,3 +1,9 @@
+from .adapters import (
+    AdapterRegistryStats,
+    TypeAdapterRegistry,
+    serializer_registry,
+    validator_registry,
+)
 from .api_error import ApiError
 from .auth import (
     AuthKey,
@@ -11,23 +17,178 @@ from .auth import (
 )
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
 from .binary_response import BinaryResponse
-from .query import encode_query_param, QueryParams
+from .paths import PathTemplate, path_template
+from .query import (
+    encode_query_param,
+    encode_query_string,
+    query_param_encoder,
+    QueryParamEncoder,
+    QueryParams,
+)
 from .request import (
     filter_not_given,
     to_content,
     to_encodable,
     to_form_urlencoded,
     RequestOptions,
+    ResponseFormat,
     default_request_options,
 )
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .lazy import LazyModel, lazy_from_encodable
+from .columns import Frame, frame_for, frame_for_type, frame_from_encodable
+from .records import Record, record_for, record_from_encodable
+from .interning import Interner, InternerStats
+from .codecs import (
+    JsonCodec,
+    JsonCodecName,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
+from .encoders import (
+    FormEncoder,
+    ModelEncoder,
+    encoder_for,
+    json_dumps,
+    to_json_bytes,
+    urlencode_form,
+)
+from .compression import (
+    CompressionAlgorithm,
+    DEFAULT_COMPRESSION_THRESHOLD,
+    compress_bytes,
+    compress_stream,
+    compress_async_stream,
+)
+from .http2 import (
+    AsyncStreamLimitTransport,
+    DEFAULT_MAX_CONCURRENT_STREAMS,
+    SyncStreamLimitTransport,
+    check_http2,
+)
+from .dns import (
+    AsyncDnsCacheTransport,
+    DEFAULT_DNS_TTL,
+    DnsCache,
+    DnsCacheStats,
+    DnsCacheTransport,
+)
+from .pool import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    async_client_transport,
+    client_timeout,
+    client_transport,
+    pool_limits,
+)
+from .uploads import (
+    AsyncUpload,
+    AsyncUploadContent,
+    SyncUpload,
+    Upload,
+    UploadContent,
+    UPLOAD_CHUNK_SIZE,
+    to_async_upload,
+    to_upload,
+)
+from .transports import (
+    AsyncSharedTransport,
+    SharedTransport,
+    TransportRegistry,
+    async_shared_transport,
+    shared_transport,
+    shared_transports,
+)
+from .warmup import ConnectionSetup, async_warmup_connections, warmup_connections
+from .validation import (
+    construct,
+    DriftHandler,
+    ResponseValidator,
+    ValidationDriftWarning,
+    ValidationMode,
+    ValidationStats,
+)
+from .response import (
+    from_encodable,
+    from_json_bytes,
+    json_loads,
+    AsyncJsonArrayStreamResponse,
+    AsyncStreamResponse,
+    JsonArrayDecoder,
+    JsonArrayStreamResponse,
+    StreamFormat,
+    StreamResponse,
+)
 
 __all__ = [
+    "AdapterRegistryStats",
     "ApiError",
     "AsyncBaseClient",
     "BaseClient",
     "BinaryResponse",
     "RequestOptions",
+    "ResponseFormat",
+    "LazyModel",
+    "Frame",
+    "frame_for",
+    "frame_for_type",
+    "frame_from_encodable",
+    "Record",
+    "record_for",
+    "record_from_encodable",
+    "Interner",
+    "InternerStats",
+    "JsonCodec",
+    "JsonCodecName",
+    "OrjsonCodec",
+    "StdlibJsonCodec",
+    "get_json_codec",
+    "ModelEncoder",
+    "FormEncoder",
+    "encoder_for",
+    "json_dumps",
+    "to_json_bytes",
+    "urlencode_form",
+    "CompressionAlgorithm",
+    "DEFAULT_COMPRESSION_THRESHOLD",
+    "compress_bytes",
+    "compress_stream",
+    "compress_async_stream",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_KEEPALIVE_CONNECTIONS",
+    "DEFAULT_KEEPALIVE_EXPIRY",
+    "pool_limits",
+    "client_timeout",
+    "ConnectionSetup",
+    "warmup_connections",
+    "async_warmup_connections",
+    "DEFAULT_MAX_CONCURRENT_STREAMS",
+    "SyncStreamLimitTransport",
+    "AsyncStreamLimitTransport",
+    "check_http2",
+    "client_transport",
+    "async_client_transport",
+    "DEFAULT_DNS_TTL",
+    "DnsCache",
+    "DnsCacheStats",
+    "DnsCacheTransport",
+    "AsyncDnsCacheTransport",
+    "TransportRegistry",
+    "SharedTransport",
+    "AsyncSharedTransport",
+    "shared_transport",
+    "async_shared_transport",
+    "shared_transports",
+    "Upload",
+    "SyncUpload",
+    "AsyncUpload",
+    "UploadContent",
+    "AsyncUploadContent",
+    "UPLOAD_CHUNK_SIZE",
+    "to_upload",
+    "to_async_upload",
+    "lazy_from_encodable",
     "default_request_options",
     "SyncBaseClient",
     "AuthKey",
@@ -42,9 +203,29 @@ __all__ = [
     "to_form_urlencoded",
     "filter_not_given",
     "to_content",
+    "PathTemplate",
+    "path_template",
     "encode_query_param",
+    "encode_query_string",
+    "query_param_encoder",
+    "QueryParamEncoder",
     "from_encodable",
+    "from_json_bytes",
+    "json_loads",
+    "AsyncJsonArrayStreamResponse",
     "AsyncStreamResponse",
+    "JsonArrayDecoder",
+    "JsonArrayStreamResponse",
+    "StreamFormat",
     "StreamResponse",
     "QueryParams",
+    "TypeAdapterRegistry",
+    "construct",
+    "DriftHandler",
+    "ResponseValidator",
+    "ValidationDriftWarning",
+    "ValidationMode",
+    "ValidationStats",
+    "serializer_registry",
+    "validator_registry",
 ]
@@ -0,0 +1,103 @@
+import threading
+from typing import Any, Dict
+
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+"""
+Process-wide caching of pydantic TypeAdapters.
+
+Building a TypeAdapter compiles a core schema and validator for the target type,
+which is far more expensive than the validation itself. Adapters are immutable once
+built, so a single instance per type can be shared across threads and event loops.
+"""
+
+
+class AdapterRegistryStats(TypedDict):
+    """
+    Snapshot of a TypeAdapterRegistry's counters.
+
+    Attributes:
+        hits: Lookups served by an already built adapter
+        misses: Lookups that had to build a new adapter
+        size: Number of adapters currently held by the registry
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class TypeAdapterRegistry:
+    """
+    Builds a pydantic TypeAdapter once per target type and reuses it.
+
+    Lookups are keyed by the type object itself, so parametrized generics and
+    unions such as `typing.Union[models.Pet, BinaryResponse]` resolve to the same
+    adapter on every call. Types that cannot be hashed are still supported but
+    are never cached.
+    """
+
+    def __init__(self) -> None:
+        self._adapters: Dict[Any, TypeAdapter] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, tp: Any) -> TypeAdapter:
+        """
+        Returns the cached TypeAdapter for `tp`, building it on first use.
+        """
+        try:
+            adapter = self._adapters.get(tp)
+        except TypeError:
+            # unhashable type hint (e.g. Annotated with unhashable metadata)
+            with self._lock:
+                self._misses += 1
+            return TypeAdapter(tp)
+
+        if adapter is not None:
+            with self._lock:
+                self._hits += 1
+            return adapter
+
+        with self._lock:
+            adapter = self._adapters.get(tp)
+            if adapter is None:
+                self._misses += 1
+                adapter = TypeAdapter(tp)
+                self._adapters[tp] = adapter
+            else:
+                self._hits += 1
+        return adapter
+
+    def stats(self) -> AdapterRegistryStats:
+        """
+        Returns the current hit/miss counters and registry size.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._adapters),
+            }
+
+    def clear(self) -> None:
+        """
+        Drops all cached adapters and resets the counters.
+        """
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+validator_registry = TypeAdapterRegistry()
+"""
+Registry of the adapters used to validate response data
+"""
+
+serializer_registry = TypeAdapterRegistry()
+"""
+Registry of the adapters used to validate and dump request data
+"""
@@ -15,8 +15,30 @@ class AuthProvider(abc.ABC):
 
     Each concrete implementation handles a specific authentication method
     and modifies the request configuration accordingly.
+
+    Every attribute assignment (including through `set_value`) bumps the
+    provider's `revision`, which lets clients cache what the provider adds
+    to requests until it changes.
     """
 
+    revision: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "revision":
+            super().__setattr__("revision", self.revision + 1)
+
+    def static_headers(self) -> Optional[Dict[str, str]]:
+        """
+        Returns the headers this provider adds to every request, if adding
+        them is all it does until its next revision.
+
+        Providers that set anything else, or whose output may change without
+        an attribute assignment (e.g. expiring tokens), return None and are
+        applied through `add_to_request` on every request.
+        """
+        return None
+
     @abc.abstractmethod
     def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
         """
@@ -95,11 +117,19 @@ class AuthBearer(AuthProvider):
         Only modifies the configuration if a token value is provided.
         """
         if self.token is not None:
-            headers = cfg.get("headers", dict())
+            headers = dict(cfg.get("headers", {}))
             headers["Authorization"] = f"Bearer {self.token}"
             cfg["headers"] = headers
         return cfg
 
+    def static_headers(self) -> Optional[Dict[str, str]]:
+        """
+        Returns the Authorization header, or no headers without a token
+        """
+        if self.token is None:
+            return {}
+        return {"Authorization": f"Bearer {self.token}"}
+
     def set_value(self, val: Optional[str]) -> None:
         """
         Sets value as the bearer token
@@ -141,7 +171,7 @@ class AuthKey(AuthProvider):
             params[self.name] = self.val
             cfg["params"] = params
         elif self.location == "header":
-            headers = cfg.get("headers", {})
+            headers = dict(cfg.get("headers", {}))
             headers[self.name] = self.val
             cfg["headers"] = headers
         else:
@@ -151,6 +181,14 @@ class AuthKey(AuthProvider):
 
         return cfg
 
+    def static_headers(self) -> Optional[Dict[str, str]]:
+        """
+        Returns the key header when the key is sent as a header
+        """
+        if self.location != "header":
+            return None
+        return {} if self.val is None else {self.name: self.val}
+
     def set_value(self, val: Optional[str]) -> None:
         """
         Sets value as the key
@@ -1,23 +1,61 @@
 from typing import (
     Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
     List,
     TypeVar,
     Dict,
+    Mapping,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
 )
+from types import MappingProxyType
 from typing_extensions import TypeGuard
 
+import anyio
+import anyio.to_thread
 import httpx
 from pydantic import BaseModel
 
 from .api_error import ApiError
 from .auth import AuthProvider
-from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
-from .utils import get_response_type, filter_binary_response
+from .request import (
+    RequestConfig,
+    RequestOptions,
+    ResponseFormat,
+    default_request_options,
+    QueryParams,
+)
+from .columns import frame_for_type, frame_from_encodable
+from .compression import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    CompressionAlgorithm,
+    check_compression,
+    compress_async_stream,
+    compress_bytes,
+    compress_stream,
+)
+from .codecs import JsonCodec, JsonCodecName, get_json_codec
+from .interning import Interner
+from .lazy import lazy_from_encodable
+from .paths import PathTemplate, path_template
+from .query import encode_query_string
+from .uploads import Upload
+from .records import record_from_encodable
+from .response import (
+    AsyncJsonArrayStreamResponse,
+    AsyncStreamResponse,
+    JsonArrayStreamResponse,
+    StreamFormat,
+    StreamResponse,
+)
+from .validation import ResponseValidator, ValidationMode
+from .warmup import ConnectionSetup, async_warmup_connections, warmup_connections
+from .utils import get_response_type, filter_binary_response, is_raw_response_type
 from .binary_response import BinaryResponse
 
 NoneType = type(None)
@@ -28,6 +66,82 @@ T = TypeVar(
 _DEFAULT_SERVICE_NAME = "__default_service__"
 
 
+def _is_utf8_charset(charset: Optional[str]) -> bool:
+    """JSON bodies without an explicit charset are UTF-8 per RFC 8259"""
+    return charset is None or charset.lower().replace("-", "") == "utf8"
+
+
+def _finalize_url(
+    req_cfg: RequestConfig, httpx_client: Union[httpx.Client, httpx.AsyncClient]
+) -> RequestConfig:
+    """
+    Moves the request's query params into its URL as the final query string, so
+    httpx doesn't parse and merge them again.
+    Params are left to httpx when they need merging with a query already in the
+    URL or with the client's own params.
+    """
+    url = req_cfg["url"]
+    if not isinstance(url, str):
+        return req_cfg
+    params = req_cfg.get("params")
+    if params is not None and not httpx_client.params and "?" not in url:
+        del req_cfg["params"]
+        url = url + "?" + encode_query_string(params)
+    req_cfg["url"] = url
+    return req_cfg
+
+
+def _set_content_encoding(
+    req_cfg: RequestConfig, algorithm: CompressionAlgorithm
+) -> None:
+    """Marks a compressed body, whose length is no longer the original's"""
+    headers = {
+        k: v
+        for k, v in req_cfg.get("headers", {}).items()
+        if k.lower() != "content-length"
+    }
+    headers["content-encoding"] = algorithm
+    req_cfg["headers"] = headers
+
+
+class _RequestPlan:
+    """
+    Static parts of an operation's requests, computed once per
+    (method, service, auth names, content type).
+
+    Attributes:
+        base_url: Base URL of the operation's service, ending with a slash
+        auth_providers: Providers of the operation's auth names that must run on
+            every request
+        static_auth: Providers whose static headers are part of `headers`, with
+            the revision they were read at
+        headers: Frozen block of static auth headers, default headers and the
+            operation's content type
+    """
+
+    __slots__ = ("base_url", "auth_providers", "static_auth", "headers")
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        auth_providers: Tuple[AuthProvider, ...],
+        static_auth: Tuple[Tuple[AuthProvider, int], ...],
+        headers: Mapping[str, str],
+    ):
+        self.base_url = base_url
+        self.auth_providers = auth_providers
+        self.static_auth = static_auth
+        self.headers = headers
+
+    def is_current(self) -> bool:
+        """Whether none of the static auth providers changed since planning"""
+        for provider, revision in self.static_auth:
+            if provider.revision != revision:
+                return False
+        return True
+
+
 class BaseClient:
     """Base client class providing core HTTP client functionality.
 
@@ -36,16 +150,57 @@ class BaseClient:
 
     Attributes:
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        response_validator: Applies the response validation mode to decoded data
+        response_format: Default shape of decoded JSON responses
+        interner: Optional Interner that deduplicates strings and value objects
+            in decoded model and record responses
+        json_codec: Encodes JSON request bodies and decodes the responses that are
+            not validated straight from bytes by pydantic
+        request_compression: Content coding request bodies are compressed with,
+            or None to send them uncompressed
+        compression_threshold: Bodies smaller than this many bytes are sent
+            uncompressed
     """
 
-    def __init__(self, base_url: Union[str, Dict[str, str]]):
+    def __init__(
+        self,
+        base_url: Union[str, Dict[str, str]],
+        response_validator: Optional[ResponseValidator] = None,
+        response_format: ResponseFormat = "model",
+        interner: Optional[Interner] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+        json_codec: Union[JsonCodecName, JsonCodec, None] = None,
+        request_compression: Optional[CompressionAlgorithm] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ):
         """Initialize the base client"""
+        if request_compression is not None:
+            check_compression(request_compression)
         self._base_url = (
             base_url
             if isinstance(base_url, dict)
             else {_DEFAULT_SERVICE_NAME: base_url}
         )
+        # service prefixes normalized once, always ending with a single slash
+        self._base_prefixes: Dict[str, str] = {
+            name: url.rstrip("/") + "/" for name, url in self._base_url.items()
+        }
         self._auths: Dict[str, AuthProvider] = {}
+        self._request_plans: Dict[
+            Tuple[str, Optional[str], Tuple[str, ...], Optional[str]], _RequestPlan
+        ] = {}
+        self.json_codec = get_json_codec(json_codec)
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+        self.response_validator = response_validator or ResponseValidator(
+            codec=self.json_codec
+        )
+        self.response_format = response_format
+        self.interner = interner
+        self._default_header_overrides: Dict[str, Optional[str]] = dict(
+            default_headers or {}
+        )
+        self._default_header_block: Optional[Mapping[str, str]] = None
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -55,6 +210,8 @@ class BaseClient:
             provider: AuthProvider instance to handle authentication
         """
         self._auths[auth_id] = provider
+        # plans hold the resolved providers and static headers of each operation
+        self._request_plans.clear()
 
     def default_headers(self) -> Dict[str, str]:
         """Get default headers for requests.
@@ -65,8 +222,31 @@ class BaseClient:
         headers: Dict[str, str] = {
             "x-sideko-sdk-language": "Python",
         }
+        for name, value in self._default_header_overrides.items():
+            if value is None:
+                headers.pop(name, None)
+            else:
+                headers[name] = value
         return headers
 
+    def update_default_headers(self, headers: Dict[str, Optional[str]]) -> None:
+        """Add, replace or (with a None value) remove this client's default headers.
+
+        Args:
+            headers: Headers to merge into the defaults
+        """
+        self._default_header_overrides.update(headers)
+        self._default_header_block = None
+        self._request_plans.clear()
+
+    def _default_headers_block(self) -> Mapping[str, str]:
+        """Frozen copy of the default headers, built once until they change"""
+        block = self._default_header_block
+        if block is None:
+            block = MappingProxyType(self.default_headers())
+            self._default_header_block = block
+        return block
+
     def build_url(self, path: str, service_name: Optional[str] = None) -> str:
         """Build a complete URL by combining base URL and path.
 
@@ -76,172 +256,82 @@ class BaseClient:
         Returns:
             Complete URL string
         """
-        base_url = self._base_url.get(service_name or _DEFAULT_SERVICE_NAME, "")
-        if base_url.endswith("/"):
-            base_url = base_url[:-1]
-        if path.startswith("/"):
-            path = path[1:]
-
-        return f"{base_url}/{path}"
+        prefix = self._base_prefixes.get(service_name or _DEFAULT_SERVICE_NAME, "/")
+        return prefix + (path[1:] if path.startswith("/") else path)
+
+    def _service_urls(self) -> Dict[Optional[str], str]:
+        """Base URLs by service name, None for the default service"""
+        return {
+            (None if name == _DEFAULT_SERVICE_NAME else name): url
+            for name, url in self._base_url.items()
+        }
 
     def _cast_to_raw_response(
         self, res: httpx.Response, cast_to: Union[Type[T], Any]
     ) -> TypeGuard[T]:
         """Determines if the provided cast_to is an httpx.Response"""
-        try:
-            return issubclass(cast_to, httpx.Response)
-        except TypeError:
-            return False
+        return is_raw_response_type(cast_to)
 
-    def _apply_auth(
-        self, *, cfg: RequestConfig, auth_names: List[str]
-    ) -> RequestConfig:
-        """Apply authentication to the request configuration.
-
-        Args:
-            cfg: Request configuration to modify
-            auth_names: List of auth provider IDs to apply
-
-        Returns:
-            Modified request configuration
-        """
-        for auth_name in auth_names:
-            auth_provider = self._auths.get(auth_name)
-            if auth_provider is not None:
-                cfg = auth_provider.add_to_request(cfg)
-
-        return cfg
-
-    def _apply_headers(
+    def _request_plan(
         self,
         *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-        content_type: Optional[str] = None,
-        explicit_headers: Optional[Dict[str, str]] = None,
-    ) -> RequestConfig:
-        """Apply headers to the request configuration.
-
-        Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional headers
-            content_type: Optional content type header
-            explicit_headers: Optional explicitly specified headers
-
-        Returns:
-            Modified request configuration
-        """
-        headers = cfg.get("headers", {})
-        headers.update(self.default_headers())
-
-        if content_type is not None:
-            headers["content-type"] = content_type
-
-        if explicit_headers is not None:
-            headers.update(explicit_headers)
-
-        additional_headers = opts.get("additional_headers", None)
-        if additional_headers is not None:
-            headers.update(additional_headers)
-
-        if len(headers) > 0:
-            cfg["headers"] = headers
-
-        return cfg
-
-    def _apply_query_params(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-        query_params: Optional[QueryParams] = None,
-    ) -> RequestConfig:
-        """Apply query parameters to the request configuration.
-
-        Args:
-            cfg: Request configuration to modify
-            opts: Request options containing additional parameters
-            query_params: Optional query parameters to add
-
-        Returns:
-            Modified request configuration
-        """
-        params = cfg.get("params", {})
-
-        if query_params is not None:
-            params.update(query_params)
-
-        additional_params = opts.get("additional_params", None)
-        if additional_params is not None:
-            params.update(additional_params)
-
-        if len(params) > 0:
-            cfg["params"] = params
-
-        return cfg
-
-    def _apply_timeout(
-        self,
-        *,
-        cfg: RequestConfig,
-        opts: RequestOptions,
-    ) -> RequestConfig:
-        """Apply timeout settings to the request configuration.
-
-        Args:
-            cfg: Request configuration to modify
-            opts: Request options containing timeout settings
-
-        Returns:
-            Modified request configuration
-        """
-        timeout = opts.get("timeout", None)
-
-        if timeout is not None:
-            cfg["timeout"] = timeout
-
-        return cfg
-
-    def _apply_body(
-        self,
-        *,
-        cfg: RequestConfig,
-        data: Optional[httpx._types.RequestData] = None,
-        files: Optional[httpx._types.RequestFiles] = None,
-        json: Optional[Any] = None,
-        content: Optional[httpx._types.RequestContent] = None,
-    ) -> RequestConfig:
-        """Apply request body content to the request configuration.
+        method: str,
+        service_name: Optional[str],
+        auth_names: Optional[List[str]],
+        content_type: Optional[str],
+    ) -> "_RequestPlan":
+        """Returns the cached plan of an operation, building it on first use.
 
         Args:
-            cfg: Request configuration to modify
-            data: Optional form data
-            files: Optional files to upload
-            json: Optional JSON data
-            content: Optional raw content
+            method: HTTP method
+            service_name: Service whose base URL the operation targets
+            auth_names: List of auth provider IDs
+            content_type: Content type header
 
         Returns:
-            Modified request configuration
+            Static parts of the request shared by every call to the operation
         """
-        if data is not None:
-            cfg["data"] = data
-
-        if files is not None:
-            cfg["files"] = files
-
-        if json is not None:
-            cfg["json"] = json
-
-        if content is not None:
-            cfg["content"] = content
+        key = (method, service_name, tuple(auth_names or ()), content_type)
+        plan = self._request_plans.get(key)
+        if plan is None or not plan.is_current():
+            base_url = self._base_prefixes.get(
+                service_name or _DEFAULT_SERVICE_NAME, "/"
+            )
 
-        return cfg
+            headers: Dict[str, str] = {}
+            auth_providers: List[AuthProvider] = []
+            static_auth: List[Tuple[AuthProvider, int]] = []
+            for name in key[2]:
+                provider = self._auths.get(name)
+                if provider is None:
+                    continue
+                revision = provider.revision
+                static_headers = provider.static_headers()
+                if static_headers is None:
+                    auth_providers.append(provider)
+                else:
+                    headers.update(static_headers)
+                    static_auth.append((provider, revision))
+
+            # defaults and the content type take precedence over auth headers
+            headers.update(self._default_headers_block())
+            if content_type is not None:
+                headers["content-type"] = content_type
+            plan = _RequestPlan(
+                base_url=base_url,
+                auth_providers=tuple(auth_providers),
+                static_auth=tuple(static_auth),
+                headers=MappingProxyType(headers),
+            )
+            self._request_plans[key] = plan
+        return plan
 
     def build_request(
         self,
         *,
         method: str,
-        path: str,
+        path: Union[str, PathTemplate],
+        path_params: Optional[Mapping[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -255,9 +345,13 @@ class BaseClient:
     ) -> RequestConfig:
         """Build a complete request configuration.
 
+        The base URL, auth providers and base headers of the operation come from
+        its cached request plan; only the variable parts are filled in per call.
+
         Args:
             method: HTTP method
-            path: API endpoint path
+            path: API endpoint path, or its compiled path template
+            path_params: Values of the path template's parameters
             auth_names: List of auth provider IDs
             query_params: Query parameters
             headers: Request headers
@@ -272,35 +366,135 @@ class BaseClient:
             Complete request configuration
         """
         opts = request_options or default_request_options()
+        if json is not None:
+            # sent as bytes encoded by the client's codec instead of httpx's json=
+            content = self.json_codec.dumps(json)
+            content_type = content_type or "application/json"
+        if isinstance(path, PathTemplate):
+            relative_path = path.format(path_params or {})
+        elif path_params is not None:
+            relative_path = path_template(path).format(path_params)
+        else:
+            relative_path = path[1:] if path.startswith("/") else path
+        plan = self._request_plan(
+            method=method,
+            service_name=service_name,
+            auth_names=auth_names,
+            content_type=content_type,
+        )
         req_cfg: RequestConfig = {
             "method": method,
-            "url": self.build_url(path, service_name=service_name),
+            "url": plan.base_url + relative_path,
         }
-        req_cfg = self._apply_auth(cfg=req_cfg, auth_names=auth_names or [])
-        req_cfg = self._apply_headers(
-            cfg=req_cfg, opts=opts, content_type=content_type, explicit_headers=headers
-        )
-        req_cfg = self._apply_query_params(
-            cfg=req_cfg, opts=opts, query_params=query_params
-        )
-        req_cfg = self._apply_body(
-            cfg=req_cfg, data=data, files=files, json=json, content=content
-        )
-        req_cfg = self._apply_timeout(cfg=req_cfg, opts=opts)
+
+        # auth values may change between calls (e.g. refreshed OAuth2 tokens)
+        for auth_provider in plan.auth_providers:
+            req_cfg = auth_provider.add_to_request(req_cfg)
+
+        auth_headers = req_cfg.get("headers")
+        additional_headers = opts.get("additional_headers", None)
+        # streamed uploads of a known size are sent with a Content-Length
+        # instead of chunked transfer encoding
+        upload_length = content.content_length if isinstance(content, Upload) else None
+        if (
+            auth_headers is None
+            and headers is None
+            and additional_headers is None
+            and upload_length is None
+        ):
+            # nothing to layer on top, share the operation's frozen header block
+            req_cfg["headers"] = plan.headers
+        else:
+            req_headers = dict(auth_headers or {})
+            req_headers.update(plan.headers)
+            if upload_length is not None:
+                req_headers["content-length"] = str(upload_length)
+            if headers is not None:
+                req_headers.update(headers)
+            if additional_headers is not None:
+                req_headers.update(additional_headers)
+            req_cfg["headers"] = req_headers
+
+        additional_params = opts.get("additional_params", None)
+        if query_params is not None or additional_params is not None:
+            params = req_cfg.get("params", {})
+            if query_params is not None:
+                params.update(query_params)
+            if additional_params is not None:
+                params.update(additional_params)
+            if params:
+                req_cfg["params"] = params
+
+        if data is not None:
+            req_cfg["data"] = data
+        if files is not None:
+            req_cfg["files"] = files
+        if content is not None:
+            req_cfg["content"] = content
+
+        timeout = opts.get("timeout", None)
+        if timeout is not None:
+            req_cfg["timeout"] = timeout
 
         return req_cfg
 
+    def _body_compression(
+        self, req_cfg: RequestConfig, request_options: Optional[RequestOptions]
+    ) -> Optional[CompressionAlgorithm]:
+        """
+        Content coding the request's body should be compressed with, if any.
+
+        Only raw content bodies at least as large as the threshold are compressed,
+        and never bodies that already declare a content encoding. Streamed bodies
+        of unknown size are always compressed.
+        """
+        opts = request_options or default_request_options()
+        algorithm = opts.get("request_compression", self.request_compression)
+        content = req_cfg.get("content")
+        if algorithm is None or content is None:
+            return None
+        if any(k.lower() == "content-encoding" for k in req_cfg.get("headers", {})):
+            return None
+
+        threshold = opts.get("compression_threshold", self.compression_threshold)
+        size: Optional[int] = None
+        if isinstance(content, (bytes, str)):
+            size = len(content)
+        elif isinstance(content, Upload):
+            size = content.content_length
+        if size is not None and size < threshold:
+            return None
+        check_compression(algorithm)
+        return algorithm
+
+    def _stream_loader(
+        self, request_options: Optional[RequestOptions]
+    ) -> Callable[[bytes, Any], Any]:
+        """Builds the converter applied to each element of a streamed JSON array"""
+        validation = (request_options or default_request_options()).get("validation")
+
+        def load(raw: bytes, cast_to: Any) -> Any:
+            return self.response_validator.load_json(
+                data=raw, load_with=cast_to, mode=validation
+            )
+
+        return load
+
     def process_response(
         self,
         *,
         response=httpx.Response,
         cast_to: Union[Type[T], Any],
+        validation: Optional[ValidationMode] = None,
+        response_format: Optional[ResponseFormat] = None,
     ) -> T:
         """Process an HTTP response and convert it to the desired type.
 
         Args:
             response: HTTP response to process
             cast_to: Type to cast the response data to
+            validation: Overrides the client's response validation mode
+            response_format: Overrides the client's response format
 
         Returns:
             Processed response data of the specified type
@@ -320,11 +514,69 @@ class BaseClient:
         response_type = get_response_type(response.headers)
 
         if response_type == "json":
-            if cast_to is type(Any):
-                return response.json()
-            return from_encodable(
-                data=response.json(), load_with=filter_binary_response(cast_to=cast_to)
-            )
+            if cast_to is Any or cast_to is type(Any):
+                data = self.json_codec.loads(response.content)
+                return data if self.interner is None else self.interner.intern(data)
+            load_with = filter_binary_response(cast_to=cast_to)
+            is_utf8 = _is_utf8_charset(response.charset_encoding)
+            response_format = response_format or self.response_format
+            if response_format == "record":
+                # the generated records register themselves for their models
+                from ..types import records  # noqa: F401
+            elif response_format == "frame":
+                # the generated frames register themselves for their models
+                from ..types import frames  # noqa: F401
+
+            if response_format == "lazy":
+                return lazy_from_encodable(
+                    data=(
+                        self.json_codec.loads(response.content)
+                        if is_utf8
+                        else response.json()
+                    ),
+                    load_with=load_with,
+                    validator=self.response_validator,
+                    mode=validation,
+                )
+            elif response_format == "frame" and frame_for_type(load_with) is not None:
+                data = (
+                    self.json_codec.loads(response.content)
+                    if is_utf8
+                    else response.json()
+                )
+                if isinstance(data, list):
+                    return cast(T, frame_from_encodable(data=data, load_with=load_with))
+                result = self.response_validator.load_python(
+                    data=data, load_with=load_with, mode=validation
+                )
+            elif (
+                response_format == "record"
+                and (validation or self.response_validator.mode) == "trusted"
+            ):
+                # records are built straight from the decoded JSON
+                result = record_from_encodable(
+                    data=(
+                        self.json_codec.loads(response.content)
+                        if is_utf8
+                        else response.json()
+                    ),
+                    load_with=load_with,
+                )
+            else:
+                if is_utf8:
+                    # decode the raw body straight into the target type
+                    result = self.response_validator.load_json(
+                        data=response.content, load_with=load_with, mode=validation
+                    )
+                else:
+                    result = self.response_validator.load_python(
+                        data=response.json(), load_with=load_with, mode=validation
+                    )
+                if response_format == "record":
+                    result = record_from_encodable(data=result, load_with=load_with)
+            if self.interner is not None:
+                result = self.interner.intern(result)
+            return cast(T, result)
         elif response_type == "text":
             return cast(T, response.text)
         else:
@@ -345,21 +597,72 @@ class SyncBaseClient(BaseClient):
         *,
         base_url: Union[str, Dict[str, str]],
         httpx_client: httpx.Client,
+        response_validator: Optional[ResponseValidator] = None,
+        response_format: ResponseFormat = "model",
+        interner: Optional[Interner] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+        json_codec: Union[JsonCodecName, JsonCodec, None] = None,
+        request_compression: Optional[CompressionAlgorithm] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ):
         """Initialize the synchronous client.
 
         Args:
             httpx_client: Synchronous HTTPX client instance
+            response_validator: Applies the response validation mode to decoded data
+            response_format: Default shape of decoded JSON responses
+            interner: Optional Interner applied to decoded responses
+            default_headers: Headers added to (or overriding) the default headers
+            json_codec: JSON codec name or instance, the standard library by default
+            request_compression: Content coding request bodies are compressed with
+            compression_threshold: Minimum size of compressed bodies in bytes
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            response_validator=response_validator,
+            response_format=response_format,
+            interner=interner,
+            default_headers=default_headers,
+            json_codec=json_codec,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+        )
         self.httpx_client = httpx_client
 
+    def warmup(self, connections: int = 1) -> List[ConnectionSetup]:
+        """Open pooled connections to every base URL before traffic arrives.
+
+        Args:
+            connections: Number of connections opened to each base URL
+
+        Returns:
+            Setup time of each connection that was opened
+        """
+        return warmup_connections(self.httpx_client, self._service_urls(), connections)
+
+    def _compress_body(
+        self, req_cfg: RequestConfig, request_options: Optional[RequestOptions]
+    ) -> RequestConfig:
+        """Compresses the request body when request compression applies to it"""
+        algorithm = self._body_compression(req_cfg, request_options)
+        if algorithm is not None:
+            content = req_cfg["content"]
+            if isinstance(content, (bytes, str)):
+                req_cfg["content"] = compress_bytes(content, algorithm)
+            else:
+                req_cfg["content"] = compress_stream(
+                    cast(Iterable[bytes], content), algorithm
+                )
+            _set_content_encoding(req_cfg, algorithm)
+        return req_cfg
+
     def request(
         self,
         *,
         method: str,
-        path: str,
+        path: Union[str, PathTemplate],
         cast_to: Union[Type[T], Any],
+        path_params: Optional[Mapping[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -375,7 +678,8 @@ class SyncBaseClient(BaseClient):
 
         Args:
             method: HTTP method
-            path: API endpoint path
+            path: API endpoint path, or its compiled path template
+            path_params: Values of the path template's parameters
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -397,6 +701,7 @@ class SyncBaseClient(BaseClient):
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -408,7 +713,11 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = self.httpx_client.request(**req_cfg)
+        response = self.httpx_client.request(
+            **_finalize_url(
+                self._compress_body(req_cfg, request_options), self.httpx_client
+            )
+        )
 
         if not response.is_success:
             raise ApiError(response=response)
@@ -416,14 +725,21 @@ class SyncBaseClient(BaseClient):
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+        opts = request_options or default_request_options()
+        return self.process_response(
+            response=response,
+            cast_to=cast_to,
+            validation=opts.get("validation"),
+            response_format=opts.get("response_format"),
+        )
 
     def stream_request(
         self,
         *,
         method: str,
-        path: str,
+        path: Union[str, PathTemplate],
         cast_to: Union[Type[T], Any],
+        path_params: Optional[Mapping[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -434,12 +750,14 @@ class SyncBaseClient(BaseClient):
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
         request_options: Optional[RequestOptions] = None,
-    ) -> StreamResponse[T]:
+        stream_format: StreamFormat = "sse",
+    ) -> Union[StreamResponse[T], JsonArrayStreamResponse[T]]:
         """Make a streaming synchronous HTTP request.
 
         Args:
             method: HTTP method
-            path: API endpoint path
+            path: API endpoint path, or its compiled path template
+            path_params: Values of the path template's parameters
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -451,9 +769,11 @@ class SyncBaseClient(BaseClient):
             content_type: Content type header
             content: Raw content
             request_options: Additional request options
+            stream_format: Whether the body is a stream of Server-Sent Events (`sse`)
+                or a JSON array decoded element by element (`json_array`)
 
         Returns:
-            StreamResponse containing the streaming response
+            StreamResponse (or JsonArrayStreamResponse) containing the streaming response
 
         Raises:
             ApiError: If the request fails
@@ -461,6 +781,7 @@ class SyncBaseClient(BaseClient):
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -472,9 +793,22 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
+        context = self.httpx_client.stream(
+            **_finalize_url(
+                self._compress_body(req_cfg, request_options), self.httpx_client
+            )
+        )
         response = context.__enter__()
-        return StreamResponse(response, context, cast_to)
+
+        if stream_format == "json_array":
+            if not response.is_success:
+                response.read()
+                context.__exit__(None, None, None)
+                raise ApiError(response=response)
+            return JsonArrayStreamResponse(
+                response, context, cast_to, self._stream_loader(request_options)
+            )
+        return StreamResponse(response, context, cast_to, loads=self.json_codec.loads)
 
 
 class AsyncBaseClient(BaseClient):
@@ -488,21 +822,79 @@ class AsyncBaseClient(BaseClient):
         *,
         base_url: Union[str, Dict[str, str]],
         httpx_client: httpx.AsyncClient,
+        response_validator: Optional[ResponseValidator] = None,
+        response_format: ResponseFormat = "model",
+        interner: Optional[Interner] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+        json_codec: Union[JsonCodecName, JsonCodec, None] = None,
+        request_compression: Optional[CompressionAlgorithm] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ):
         """Initialize the asynchronous client.
 
         Args:
             httpx_client: Asynchronous HTTPX client instance
+            response_validator: Applies the response validation mode to decoded data
+            response_format: Default shape of decoded JSON responses
+            interner: Optional Interner applied to decoded responses
+            default_headers: Headers added to (or overriding) the default headers
+            json_codec: JSON codec name or instance, the standard library by default
+            request_compression: Content coding request bodies are compressed with
+            compression_threshold: Minimum size of compressed bodies in bytes
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            response_validator=response_validator,
+            response_format=response_format,
+            interner=interner,
+            default_headers=default_headers,
+            json_codec=json_codec,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+        )
         self.httpx_client = httpx_client
 
+    async def warmup(self, connections: int = 1) -> List[ConnectionSetup]:
+        """Open pooled connections to every base URL before traffic arrives.
+
+        Args:
+            connections: Number of connections opened to each base URL
+
+        Returns:
+            Setup time of each connection that was opened
+        """
+        return await async_warmup_connections(
+            self.httpx_client, self._service_urls(), connections
+        )
+
+    async def _compress_body(
+        self, req_cfg: RequestConfig, request_options: Optional[RequestOptions]
+    ) -> RequestConfig:
+        """
+        Compresses the request body when request compression applies to it, in a
+        worker thread so the event loop is never blocked
+        """
+        algorithm = self._body_compression(req_cfg, request_options)
+        if algorithm is not None:
+            content = req_cfg["content"]
+            if isinstance(content, (bytes, str)):
+                req_cfg["content"] = await anyio.to_thread.run_sync(
+                    compress_bytes, content, algorithm
+                )
+            elif isinstance(content, AsyncIterable):
+                req_cfg["content"] = compress_async_stream(content, algorithm)
+            else:
+                req_cfg["content"] = compress_stream(content, algorithm)
+            _set_content_encoding(req_cfg, algorithm)
+        return req_cfg
+
     async def request(
         self,
         *,
         method: str,
-        path: str,
+        path: Union[str, PathTemplate],
         cast_to: Union[Type[T], Any],
+        path_params: Optional[Mapping[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -518,7 +910,8 @@ class AsyncBaseClient(BaseClient):
 
         Args:
             method: HTTP method
-            path: API endpoint path
+            path: API endpoint path, or its compiled path template
+            path_params: Values of the path template's parameters
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -540,6 +933,7 @@ class AsyncBaseClient(BaseClient):
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -551,7 +945,10 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = await self.httpx_client.request(**req_cfg)
+        req_cfg = await self._compress_body(req_cfg, request_options)
+        response = await self.httpx_client.request(
+            **_finalize_url(req_cfg, self.httpx_client)
+        )
 
         if not response.is_success:
             raise ApiError(response=response)
@@ -559,14 +956,21 @@ class AsyncBaseClient(BaseClient):
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+        opts = request_options or default_request_options()
+        return self.process_response(
+            response=response,
+            cast_to=cast_to,
+            validation=opts.get("validation"),
+            response_format=opts.get("response_format"),
+        )
 
     async def stream_request(
         self,
         *,
         method: str,
-        path: str,
+        path: Union[str, PathTemplate],
         cast_to: Union[Type[T], Any],
+        path_params: Optional[Mapping[str, Any]] = None,
         service_name: Optional[str] = None,
         auth_names: Optional[List[str]] = None,
         query_params: Optional[QueryParams] = None,
@@ -577,12 +981,14 @@ class AsyncBaseClient(BaseClient):
         content_type: Optional[str] = None,
         content: Optional[httpx._types.RequestContent] = None,
         request_options: Optional[RequestOptions] = None,
-    ) -> AsyncStreamResponse[T]:
+        stream_format: StreamFormat = "sse",
+    ) -> Union[AsyncStreamResponse[T], AsyncJsonArrayStreamResponse[T]]:
         """Make a streaming asynchronous HTTP request.
 
         Args:
             method: HTTP method
-            path: API endpoint path
+            path: API endpoint path, or its compiled path template
+            path_params: Values of the path template's parameters
             cast_to: Type to cast the response to
             auth_names: List of auth provider IDs
             service_name: The name of the API service to make the request to
@@ -594,9 +1000,12 @@ class AsyncBaseClient(BaseClient):
             content_type: Content type header
             content: Raw content
             request_options: Additional request options
+            stream_format: Whether the body is a stream of Server-Sent Events (`sse`)
+                or a JSON array decoded element by element (`json_array`)
 
         Returns:
-            AsyncStreamResponse containing the streaming response
+            AsyncStreamResponse (or AsyncJsonArrayStreamResponse) containing the
+            streaming response
 
         Raises:
             ApiError: If the request fails
@@ -604,6 +1013,7 @@ class AsyncBaseClient(BaseClient):
         req_cfg = self.build_request(
             method=method,
             path=path,
+            path_params=path_params,
             service_name=service_name,
             auth_names=auth_names,
             query_params=query_params,
@@ -615,6 +1025,18 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
+        req_cfg = await self._compress_body(req_cfg, request_options)
+        context = self.httpx_client.stream(**_finalize_url(req_cfg, self.httpx_client))
         response = await context.__aenter__()
-        return AsyncStreamResponse(response, context, cast_to)
+
+        if stream_format == "json_array":
+            if not response.is_success:
+                await response.aread()
+                await context.__aexit__(None, None, None)
+                raise ApiError(response=response)
+            return AsyncJsonArrayStreamResponse(
+                response, context, cast_to, self._stream_loader(request_options)
+            )
+        return AsyncStreamResponse(
+            response, context, cast_to, loads=self.json_codec.loads
+        )
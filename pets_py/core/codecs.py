@@ -0,0 +1,104 @@
+import abc
+import json
+from typing import Any, Union
+
+from typing_extensions import Literal
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+"""
+JSON codecs used to encode request bodies and decode responses.
+
+The standard library codec is the default. Faster libraries are opt-in through a
+client's `json_codec` setting, so the bytes sent and the objects decoded never
+depend on what happens to be installed.
+"""
+
+JsonCodecName = Literal["stdlib", "orjson"]
+
+
+class JsonCodec(abc.ABC):
+    """
+    Encodes Python objects into JSON bytes and decodes JSON documents.
+
+    Implementations must raise `json.JSONDecodeError` (or a subclass of it) for
+    malformed documents.
+
+    Attributes:
+        name: Short name identifying the codec
+    """
+
+    name: str
+
+    @abc.abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """
+        Encodes data into UTF-8 JSON bytes.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decodes a JSON document into plain Python objects.
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    JSON codec built on the standard library `json` module, encoding the same way
+    httpx encodes `json=` request bodies.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec built on `orjson`, which must be installed separately.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "the orjson JSON codec requires the `orjson` package to be installed"
+            )
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+stdlib_json_codec = StdlibJsonCodec()
+"""
+Codec used when a client does not configure one
+"""
+
+
+def get_json_codec(codec: Union[JsonCodecName, JsonCodec, None]) -> JsonCodec:
+    """
+    Resolves a codec name (or instance) into a JsonCodec.
+    """
+    if codec is None or codec == "stdlib":
+        return stdlib_json_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "orjson":
+        return OrjsonCodec()
+    raise ValueError(f"unknown JSON codec: {codec!r}")
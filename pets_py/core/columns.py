@@ -0,0 +1,558 @@
+import abc
+import itertools
+import operator
+import typing
+from array import array
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+"""
+Columnar storage for bulk responses.
+
+Values of one field across many models are packed into contiguous buffers from the
+standard library `array` module: integers as int64 arrays, strings as offset-packed
+UTF-8 buffers, enums as int8 category codes and lists as ragged offset arrays.
+Masks used for filtering are `bytes` objects holding one 0/1 byte per row, so they
+can be built and combined with C-level primitives (`bytes.translate`, `map`).
+"""
+
+Mask = bytes
+Indices = Sequence[int]
+
+
+def mask_and(*masks: Mask) -> Mask:
+    """Combines row masks with a logical AND"""
+    result = masks[0]
+    for mask in masks[1:]:
+        result = bytes(map(operator.and_, result, mask))
+    return result
+
+
+def mask_or(*masks: Mask) -> Mask:
+    """Combines row masks with a logical OR"""
+    result = masks[0]
+    for mask in masks[1:]:
+        result = bytes(map(operator.or_, result, mask))
+    return result
+
+
+def mask_to_indices(mask: Mask) -> List[int]:
+    """Returns the positions of the rows selected by a mask"""
+    return list(itertools.compress(range(len(mask)), mask))
+
+
+class _Validity:
+    """Null bitmap (one byte per row), only allocated once a null is appended"""
+
+    __slots__ = ("flags",)
+
+    def __init__(self) -> None:
+        self.flags: Optional[bytearray] = None
+
+    def append(self, present: bool, length: int) -> None:
+        if self.flags is None:
+            if present:
+                return
+            self.flags = bytearray(b"\x01") * length
+        self.flags.append(1 if present else 0)
+
+    def is_null(self, i: int) -> bool:
+        return self.flags is not None and not self.flags[i]
+
+    def take(self, indices: Indices) -> "_Validity":
+        taken = _Validity()
+        if self.flags is not None:
+            taken.flags = bytearray(map(self.flags.__getitem__, indices))
+        return taken
+
+    @property
+    def nbytes(self) -> int:
+        return 0 if self.flags is None else len(self.flags)
+
+
+class Column(abc.ABC):
+    """Base class of the columnar buffers"""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def append(self, value: Any) -> None:
+        """Appends a value, type checking it"""
+
+    @abc.abstractmethod
+    def __getitem__(self, i: int) -> Any:
+        pass
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def take(self, indices: Indices) -> "Column":
+        """Returns a new column holding the given rows, in order"""
+
+    @abc.abstractmethod
+    def empty(self) -> "Column":
+        """Returns an empty column with the same configuration"""
+
+    @property
+    @abc.abstractmethod
+    def nbytes(self) -> int:
+        """Size of the column buffers in bytes"""
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.__getitem__, range(len(self)))
+
+    def is_null(self) -> Mask:
+        """Row mask selecting null values"""
+        return bytes(v is None for v in self)
+
+
+class Int64Column(Column):
+    """Nullable 64 bit integers"""
+
+    __slots__ = ("values", "_validity")
+
+    def __init__(self) -> None:
+        self.values = array("q")
+        self._validity = _Validity()
+
+    def append(self, value: Optional[int]) -> None:
+        if value is None:
+            self._validity.append(False, len(self.values))
+            self.values.append(0)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            self._validity.append(True, len(self.values))
+            self.values.append(value)
+        else:
+            raise TypeError(f"expected an integer, got {type(value).__name__}")
+
+    def __getitem__(self, i: int) -> Optional[int]:
+        return None if self._validity.is_null(i) else self.values[i]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def take(self, indices: Indices) -> "Int64Column":
+        taken = Int64Column()
+        taken.values = array("q", map(self.values.__getitem__, indices))
+        taken._validity = self._validity.take(indices)
+        return taken
+
+    def empty(self) -> "Int64Column":
+        return Int64Column()
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values) + self._validity.nbytes
+
+    def isin(self, values: Iterable[int]) -> Mask:
+        """Row mask selecting the non-null rows whose value is in `values`"""
+        lookup = frozenset(values)
+        mask = bytes(map(lookup.__contains__, self.values))
+        if self._validity.flags is not None:
+            mask = bytes(map(operator.and_, mask, self._validity.flags))
+        return mask
+
+
+class StringColumn(Column):
+    """Nullable strings packed into a single UTF-8 buffer with int64 offsets"""
+
+    __slots__ = ("data", "offsets", "_validity")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self._validity = _Validity()
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self._validity.append(False, len(self))
+        elif isinstance(value, str):
+            self._validity.append(True, len(self))
+            self.data += value.encode()
+        else:
+            raise TypeError(f"expected a string, got {type(value).__name__}")
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if self._validity.is_null(i):
+            return None
+        return self.data[self.offsets[i] : self.offsets[i + 1]].decode()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, indices: Indices) -> "StringColumn":
+        taken = StringColumn()
+        data, offsets = self.data, self.offsets
+        for i in indices:
+            taken.data += data[offsets[i] : offsets[i + 1]]
+            taken.offsets.append(len(taken.data))
+        taken._validity = self._validity.take(indices)
+        return taken
+
+    def empty(self) -> "StringColumn":
+        return StringColumn()
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.data)
+            + self.offsets.itemsize * len(self.offsets)
+            + self._validity.nbytes
+        )
+
+    def isin(self, values: Iterable[str]) -> Mask:
+        """Row mask selecting the non-null rows whose value is in `values`"""
+        lookup = frozenset(v.encode() for v in values)
+        data, offsets = self.data, self.offsets
+        mask = bytes(
+            bytes(data[offsets[i] : offsets[i + 1]]) in lookup for i in range(len(self))
+        )
+        if self._validity.flags is not None:
+            mask = bytes(map(operator.and_, mask, self._validity.flags))
+        return mask
+
+
+class CategoricalColumn(Column):
+    """Nullable values from a fixed set of categories, stored as int8 codes"""
+
+    __slots__ = ("categories", "codes", "_lookup")
+
+    def __init__(self, categories: Sequence[str]):
+        if len(categories) > 127:
+            raise ValueError("a categorical column supports at most 127 categories")
+        self.categories: Tuple[str, ...] = tuple(categories)
+        self.codes = array("b")
+        self._lookup = {c: i for i, c in enumerate(self.categories)}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._lookup.get(value)
+        if code is None:
+            raise ValueError(f"{value!r} is not one of {self.categories}")
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code < 0 else self.categories[code]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def take(self, indices: Indices) -> "CategoricalColumn":
+        taken = self.empty()
+        taken.codes = array("b", map(self.codes.__getitem__, indices))
+        return taken
+
+    def empty(self) -> "CategoricalColumn":
+        return CategoricalColumn(self.categories)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.codes)
+
+    def isin(self, values: Iterable[Optional[str]]) -> Mask:
+        """Row mask selecting the rows whose value is in `values`"""
+        table = bytearray(256)
+        for value in values:
+            code = -1 if value is None else self._lookup.get(value)
+            if code is not None:
+                table[code & 0xFF] = 1
+        return self.codes.tobytes().translate(table)
+
+
+class StructColumn(Column):
+    """Nullable nested models stored as one child column per field"""
+
+    __slots__ = ("model", "fields", "_writers", "_validity", "_length")
+
+    def __init__(self, model: Type[BaseModel], fields: Dict[str, Column]):
+        self.model = model
+        self.fields = fields
+        self._writers = _field_writers(model, fields)
+        self._validity = _Validity()
+        self._length = 0
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self._validity.append(False, self._length)
+            for column in self.fields.values():
+                column.append(None)
+        else:
+            self._validity.append(True, self._length)
+            _append_fields(self._writers, value)
+        self._length += 1
+
+    def __getitem__(self, i: int) -> Optional[BaseModel]:
+        if self._validity.is_null(i):
+            return None
+        return self.model.model_construct(
+            **{name: column[i] for name, column in self.fields.items()}
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def take(self, indices: Indices) -> "StructColumn":
+        taken = StructColumn(
+            self.model,
+            {name: column.take(indices) for name, column in self.fields.items()},
+        )
+        taken._validity = self._validity.take(indices)
+        taken._length = len(indices)
+        return taken
+
+    def empty(self) -> "StructColumn":
+        return StructColumn(
+            self.model, {name: column.empty() for name, column in self.fields.items()}
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self._validity.nbytes + sum(c.nbytes for c in self.fields.values())
+
+
+class RaggedColumn(Column):
+    """Nullable variable length lists stored as int64 offsets into a child column"""
+
+    __slots__ = ("child", "offsets", "_validity")
+
+    def __init__(self, child: Column):
+        self.child = child
+        self.offsets = array("q", [0])
+        self._validity = _Validity()
+
+    def append(self, value: Optional[Iterable[Any]]) -> None:
+        if value is None:
+            self._validity.append(False, len(self))
+        elif isinstance(value, (str, bytes, dict)):
+            raise TypeError(f"expected a list, got {type(value).__name__}")
+        else:
+            self._validity.append(True, len(self))
+            for item in value:
+                self.child.append(item)
+        self.offsets.append(len(self.child))
+
+    def __getitem__(self, i: int) -> Optional[List[Any]]:
+        if self._validity.is_null(i):
+            return None
+        return [self.child[j] for j in range(self.offsets[i], self.offsets[i + 1])]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, indices: Indices) -> "RaggedColumn":
+        offsets = self.offsets
+        child_indices = [j for i in indices for j in range(offsets[i], offsets[i + 1])]
+        taken = RaggedColumn(self.child.take(child_indices))
+        for i in indices:
+            taken.offsets.append(taken.offsets[-1] + offsets[i + 1] - offsets[i])
+        taken._validity = self._validity.take(indices)
+        return taken
+
+    def empty(self) -> "RaggedColumn":
+        return RaggedColumn(self.child.empty())
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.offsets.itemsize * len(self.offsets)
+            + self._validity.nbytes
+            + self.child.nbytes
+        )
+
+    def lengths(self) -> array:
+        """Number of items in each row's list (0 for null rows)"""
+        offsets = self.offsets
+        return array("q", map(operator.sub, offsets[1:], offsets[:-1]))
+
+
+_FieldWriters = List[Tuple[str, str, Column]]
+
+
+def _field_writers(model: Type[BaseModel], columns: Dict[str, Column]) -> _FieldWriters:
+    """Pairs every column with the field name and JSON key it is read from"""
+    fields = model.model_fields
+    return [
+        (name, fields[name].alias or name, column) for name, column in columns.items()
+    ]
+
+
+def _append_fields(writers: _FieldWriters, value: Any) -> None:
+    """Appends a model instance or raw JSON object (keyed by alias or name)"""
+    if isinstance(value, dict):
+        for name, alias, column in writers:
+            column.append(value[alias] if alias in value else value.get(name))
+    else:
+        for name, _, column in writers:
+            column.append(getattr(value, name, None))
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+FrameT = TypeVar("FrameT", bound="Frame")
+
+_frame_types: Dict[Type[BaseModel], Type["Frame[Any]"]] = {}
+
+
+def frame_for(model: Any) -> Optional[Type["Frame[Any]"]]:
+    """Returns the Frame class registered for a model, if any"""
+    return _frame_types.get(model)
+
+
+class Frame(abc.ABC, Generic[ModelT]):
+    """
+    Columnar container for many instances of a pydantic model.
+
+    Subclasses declare the model they hold and build one column per field in
+    `new_columns`; they are registered automatically so bulk responses of that
+    model can be decoded into the frame.
+    """
+
+    model: ClassVar[Type[BaseModel]]
+    columns: Dict[str, Column]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "model" in cls.__dict__:
+            _frame_types[cls.model] = cls
+
+    def __init__(self, columns: Optional[Dict[str, Column]] = None):
+        self.columns = columns if columns is not None else self.new_columns()
+
+    @classmethod
+    @abc.abstractmethod
+    def new_columns(cls) -> Dict[str, Column]:
+        """Builds the empty columns, keyed by model field name"""
+
+    @classmethod
+    def from_json(cls: Type[FrameT], items: Iterable[Dict[str, Any]]) -> FrameT:
+        """
+        Builds a frame from decoded JSON objects (keyed by field alias or name).
+
+        Values are type checked as they are packed into their columns.
+
+        Raises:
+            TypeError: If a value does not have the column's type
+            ValueError: If an enum value is not one of the allowed categories
+        """
+        frame = cls()
+        frame.extend(items)
+        return frame
+
+    @classmethod
+    def from_models(cls: Type[FrameT], items: Iterable[Any]) -> FrameT:
+        """Builds a frame from model instances"""
+        frame = cls()
+        frame.extend(items)
+        return frame
+
+    def extend(self, items: Iterable[Union[BaseModel, Dict[str, Any]]]) -> None:
+        """
+        Appends rows from model instances or decoded JSON objects. A row that
+        fails to append is rolled back, keeping the rows appended before it.
+        """
+        writers = _field_writers(self.model, self.columns)
+        length = len(self)
+        for item in items:
+            try:
+                _append_fields(writers, item)
+            except BaseException:
+                # drop the values of the failed row from the columns it reached
+                rows = range(length)
+                self.columns = {
+                    name: column.take(rows) for name, column in self.columns.items()
+                }
+                raise
+            length += 1
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, i: int) -> ModelT:
+        if i < 0:
+            i += len(self)
+        return typing.cast(
+            ModelT,
+            self.model.model_construct(
+                **{name: column[i] for name, column in self.columns.items()}
+            ),
+        )
+
+    def __iter__(self) -> Iterator[ModelT]:
+        return map(self.__getitem__, range(len(self)))
+
+    def to_models(self) -> List[ModelT]:
+        """Converts every row back into a model instance"""
+        return list(self)
+
+    def take(self: FrameT, indices: Indices) -> FrameT:
+        """Returns a new frame holding the given rows, in order"""
+        return type(self)(
+            {name: column.take(indices) for name, column in self.columns.items()}
+        )
+
+    def filter(self: FrameT, mask: Mask) -> FrameT:
+        """Returns a new frame holding the rows selected by a mask"""
+        return self.take(mask_to_indices(mask))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of all column buffers in bytes"""
+        return sum(c.nbytes for c in self.columns.values())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, nbytes={self.nbytes})"
+
+
+def frame_for_type(load_with: Any) -> Optional[Type["Frame[Any]"]]:
+    """
+    Returns the Frame class registered for the item model of a list response
+    type, e.g. `List[models.Pet]` optionally wrapped in a Union, if any.
+    """
+    candidates = [load_with]
+    if typing.get_origin(load_with) is Union:
+        candidates = list(typing.get_args(load_with))
+    for candidate in candidates:
+        if typing.get_origin(candidate) is list:
+            frame_cls = frame_for(typing.get_args(candidate)[0])
+            if frame_cls is not None:
+                return frame_cls
+    return None
+
+
+def frame_from_encodable(*, data: Any, load_with: Any) -> "Frame[Any]":
+    """
+    Packs a decoded JSON array into the Frame registered for its item model.
+
+    `load_with` is the list type of the response, e.g. `List[models.Pet]`,
+    optionally wrapped in a Union.
+
+    Raises:
+        TypeError: If no frame is registered for the item type or the data is
+            not an array
+    """
+    frame_cls = frame_for_type(load_with)
+    if frame_cls is None:
+        raise TypeError(f"no columnar frame is registered for {load_with!r}")
+    if not isinstance(data, list):
+        raise TypeError("a columnar frame can only be built from an array")
+    return frame_cls.from_json(data)
@@ -0,0 +1,124 @@
+import zlib
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Union
+
+import anyio
+import anyio.to_thread
+from typing_extensions import Literal, Protocol
+
+try:
+    from compression import zstd  # type: ignore
+except ImportError:  # pragma: no cover - Python < 3.14
+    zstd = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+"""
+Request body compression.
+
+Compression is opt-in per client or per request. Bodies smaller than the
+threshold are sent as they are, since the encoding overhead outweighs the
+savings. Streamed bodies are compressed chunk by chunk as they are sent, and
+asynchronous clients run the compressor in a worker thread.
+"""
+
+CompressionAlgorithm = Literal["gzip", "zstd"]
+"""
+Content codings request bodies can be compressed with. `zstd` requires the
+`zstandard` package, or Python 3.14's `compression.zstd`
+"""
+
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+"""
+Bodies smaller than this many bytes are not compressed by default
+"""
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Zstd314Compressor:
+    """Adapts `compression.zstd` to the compressobj interface"""
+
+    def __init__(self) -> None:
+        self._compressor = zstd.ZstdCompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+def check_compression(algorithm: CompressionAlgorithm) -> None:
+    """
+    Raises if bodies cannot be compressed with the algorithm in this environment.
+    """
+    if algorithm == "gzip":
+        return
+    if algorithm == "zstd":
+        if zstd is None and zstandard is None:
+            raise ImportError(
+                "zstd request compression requires the `zstandard` package to be "
+                "installed (or Python 3.14+)"
+            )
+        return
+    raise ValueError(f"unknown request compression: {algorithm!r}")
+
+
+def compressor(algorithm: CompressionAlgorithm) -> Compressor:
+    """
+    Creates an incremental compressor producing the algorithm's content coding.
+    """
+    check_compression(algorithm)
+    if algorithm == "gzip":
+        # wbits=31 writes the gzip container (with a zero mtime)
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if zstd is not None:
+        return _Zstd314Compressor()
+    return zstandard.ZstdCompressor().compressobj()
+
+
+def compress_bytes(data: Union[bytes, str], algorithm: CompressionAlgorithm) -> bytes:
+    """
+    Compresses a whole body.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    c = compressor(algorithm)
+    return c.compress(data) + c.flush()
+
+
+def compress_stream(
+    chunks: Iterable[Any], algorithm: CompressionAlgorithm
+) -> Iterator[bytes]:
+    """
+    Compresses a streamed body chunk by chunk.
+    """
+    c = compressor(algorithm)
+    for chunk in chunks:
+        out = c.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        if out:
+            yield out
+    yield c.flush()
+
+
+async def compress_async_stream(
+    chunks: AsyncIterable[Any], algorithm: CompressionAlgorithm
+) -> AsyncIterator[bytes]:
+    """
+    Compresses a streamed body chunk by chunk in a worker thread.
+    """
+    c = compressor(algorithm)
+    async for chunk in chunks:
+        out = await anyio.to_thread.run_sync(
+            c.compress, chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        )
+        if out:
+            yield out
+    yield await anyio.to_thread.run_sync(c.flush)
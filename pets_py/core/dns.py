@@ -0,0 +1,297 @@
+import ipaddress
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import anyio
+import httpcore
+import httpx
+from typing_extensions import TypedDict
+
+"""
+Cached DNS resolution for the clients' connections.
+
+By default every new pooled connection resolves its host again through the
+system resolver. A `DnsCache` keeps resolved addresses for a TTL, answers pinned
+hosts from a static table without resolving them at all, and can rotate the
+addresses it returns so that new connections are spread across all the A/AAAA
+records of a host. It is plugged into httpx as an httpcore network backend, so
+TLS server names and `Host` headers still use the hostname.
+"""
+
+DEFAULT_DNS_TTL = 60.0
+"""
+Seconds resolved addresses are cached for
+"""
+
+
+class DnsCacheStats(TypedDict):
+    """
+    Snapshot of a DnsCache's counters.
+
+    Attributes:
+        hits: Lookups answered from a pin or an unexpired cache entry
+        misses: Lookups that went to the system resolver
+        size: Number of hosts currently cached
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+def _addresses(infos: Iterable[Tuple[Any, ...]]) -> List[str]:
+    """Unique addresses of getaddrinfo results, in resolver order"""
+    return list(dict.fromkeys(str(info[4][0]) for info in infos))
+
+
+class DnsCache:
+    """
+    Thread-safe cache of resolved host addresses, shared by any number of clients.
+
+    Attributes:
+        ttl: Seconds resolved addresses are cached for
+        pins: Static addresses of hosts that are never resolved
+        spread: Whether successive lookups of a host rotate through its addresses,
+            spreading new connections across them, rather than always starting
+            with the first one
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_DNS_TTL,
+        pins: Optional[Mapping[str, Union[str, Sequence[str]]]] = None,
+        spread: bool = True,
+    ):
+        if ttl < 0:
+            raise ValueError("ttl cannot be negative")
+        self.ttl = ttl
+        self.spread = spread
+        self.pins: Dict[str, List[str]] = {
+            host.lower(): [addresses] if isinstance(addresses, str) else list(addresses)
+            for host, addresses in (pins or {}).items()
+        }
+        for host, addresses in self.pins.items():
+            if not addresses or not all(_is_ip_address(a) for a in addresses):
+                raise ValueError(f"pins of {host!r} must be IP addresses")
+        # (host, port) -> (expiry, addresses)
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._turns: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _rotated(self, host: str, addresses: List[str]) -> List[str]:
+        if not self.spread or len(addresses) < 2:
+            return addresses
+        with self._lock:
+            turn = self._turns.get(host, 0)
+            self._turns[host] = turn + 1
+        start = turn % len(addresses)
+        return addresses[start:] + addresses[:start]
+
+    def _cached(self, host: str, port: int) -> Optional[List[str]]:
+        pinned = self.pins.get(host)
+        if pinned is not None:
+            with self._lock:
+                self._hits += 1
+            return pinned
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry is not None and entry[0] > time.monotonic():
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        return None
+
+    def _store(self, host: str, port: int, addresses: List[str]) -> List[str]:
+        if self.ttl > 0:
+            with self._lock:
+                self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Returns the addresses to connect to for a host, in the order they should be
+        tried.
+
+        Raises:
+            OSError: If the host cannot be resolved
+        """
+        host = host.lower()
+        if _is_ip_address(host):
+            return [host]
+        addresses = self._cached(host, port)
+        if addresses is None:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            addresses = self._store(host, port, _addresses(infos))
+        return self._rotated(host, addresses)
+
+    async def resolve_async(self, host: str, port: int) -> List[str]:
+        """
+        Returns the addresses to connect to for a host, resolving it without
+        blocking the event loop.
+
+        Raises:
+            OSError: If the host cannot be resolved
+        """
+        host = host.lower()
+        if _is_ip_address(host):
+            return [host]
+        addresses = self._cached(host, port)
+        if addresses is None:
+            infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            addresses = self._store(host, port, _addresses(infos))
+        return self._rotated(host, addresses)
+
+    def clear(self) -> None:
+        """
+        Drops every cached address (pins are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> DnsCacheStats:
+        """
+        Returns the current cache counters.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+
+class _DnsCacheBackend(httpcore.NetworkBackend):
+    """Network backend connecting to the cached addresses of a host in turn"""
+
+    def __init__(self, backend: httpcore.NetworkBackend, dns_cache: DnsCache):
+        self._backend = backend
+        self._dns_cache = dns_cache
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        try:
+            addresses = self._dns_cache.resolve(host, port)
+        except (OSError, UnicodeError) as e:
+            # resolver errors, and hostnames that cannot be IDNA encoded
+            raise httpcore.ConnectError(str(e)) from e
+        options = list(socket_options or [])
+        for address in addresses[:-1]:
+            try:
+                return self._backend.connect_tcp(
+                    address, port, timeout, local_address, options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                continue
+        return self._backend.connect_tcp(
+            addresses[-1], port, timeout, local_address, options
+        )
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        return self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _AsyncDnsCacheBackend(httpcore.AsyncNetworkBackend):
+    """Async network backend connecting to the cached addresses of a host in turn"""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns_cache: DnsCache):
+        self._backend = backend
+        self._dns_cache = dns_cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._dns_cache.resolve_async(host, port)
+        except (OSError, UnicodeError) as e:
+            # resolver errors, and hostnames that cannot be IDNA encoded
+            raise httpcore.ConnectError(str(e)) from e
+        options = list(socket_options or [])
+        for address in addresses[:-1]:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout, local_address, options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                continue
+        return await self._backend.connect_tcp(
+            addresses[-1], port, timeout, local_address, options
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class DnsCacheTransport(httpx.HTTPTransport):
+    """
+    HTTP transport resolving hosts through a DnsCache. Takes the keyword
+    arguments of `httpx.HTTPTransport`.
+
+    Attributes:
+        dns_cache: The cache hosts are resolved through
+    """
+
+    def __init__(self, dns_cache: Optional[DnsCache] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.dns_cache = DnsCache() if dns_cache is None else dns_cache
+        # httpx does not expose the pool's network backend
+        pool: Any = self._pool
+        pool._network_backend = _DnsCacheBackend(pool._network_backend, self.dns_cache)
+
+
+class AsyncDnsCacheTransport(httpx.AsyncHTTPTransport):
+    """
+    Async HTTP transport resolving hosts through a DnsCache. Takes the keyword
+    arguments of `httpx.AsyncHTTPTransport`.
+
+    Attributes:
+        dns_cache: The cache hosts are resolved through
+    """
+
+    def __init__(self, dns_cache: Optional[DnsCache] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.dns_cache = DnsCache() if dns_cache is None else dns_cache
+        # httpx does not expose the pool's network backend
+        pool: Any = self._pool
+        pool._network_backend = _AsyncDnsCacheBackend(
+            pool._network_backend, self.dns_cache
+        )
@@ -0,0 +1,350 @@
+import math
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote_plus
+
+from pydantic import BaseModel
+from typing_extensions import Literal
+
+from .codecs import JsonCodec, stdlib_json_codec
+from .query import QueryParamStyle, encode_query_string
+from .request import to_encodable, to_form_urlencoded
+from .type_utils import NotGiven
+
+"""
+Compiled JSON and form encoders for request body serializers.
+
+`to_encodable` validates a request body into its pydantic serializer and dumps it
+back into a dict that httpx then serializes again. For the common case, where every
+value already has exactly the declared type, a compiled encoder walks the keyword
+arguments once, checking each value's type while writing the aliased JSON text.
+Any value that would need pydantic's coercion (e.g. "10" for an int) or would fail
+validation makes the encoder bail out to `to_encodable`, so both paths produce the
+same document and raise the same errors.
+"""
+
+try:
+    from json.encoder import c_encode_basestring as _encode_str  # type: ignore
+except ImportError:  # pragma: no cover
+    from json.encoder import py_encode_basestring as _encode_str  # type: ignore
+
+_Encode = Callable[[Any], str]
+
+
+class _Mismatch(Exception):
+    """A value needs the full pydantic serializer path"""
+
+
+class _Unsupported(Exception):
+    """An annotation has no compiled encoder"""
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serializes data the same way httpx serializes `json=` request bodies"""
+    return stdlib_json_codec.dumps(data)
+
+
+def _encode_int(value: Any) -> str:
+    if type(value) is int:
+        return int.__repr__(value)
+    raise _Mismatch
+
+
+def _encode_float(value: Any) -> str:
+    if type(value) is float and math.isfinite(value):
+        return float.__repr__(value)
+    raise _Mismatch
+
+
+def _encode_bool(value: Any) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    raise _Mismatch
+
+
+def _encode_string(value: Any) -> str:
+    if type(value) is str:
+        return _encode_str(value)
+    raise _Mismatch
+
+
+def _compile(annotation: Any) -> _Encode:
+    if annotation is int:
+        return _encode_int
+    if annotation is float:
+        return _encode_float
+    if annotation is bool:
+        return _encode_bool
+    if annotation is str:
+        return _encode_string
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        encoder = encoder_for(annotation)
+        if encoder is None:
+            raise _Unsupported(annotation)
+        return encoder.encode_value
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1 or len(args) != 2:
+            raise _Unsupported(annotation)
+        inner = _compile(members[0])
+
+        def encode_optional(value: Any) -> str:
+            return "null" if value is None else inner(value)
+
+        return encode_optional
+    if origin is list:
+        item = _compile(args[0]) if args else None
+        if item is None:
+            raise _Unsupported(annotation)
+
+        def encode_list(value: Any) -> str:
+            if type(value) is not list:
+                raise _Mismatch
+            return (
+                "["
+                + ",".join(item(v) for v in value if not isinstance(v, NotGiven))
+                + "]"
+            )
+
+        return encode_list
+    if origin in (typing.Literal, Literal) and all(type(arg) is str for arg in args):
+        allowed = {arg: _encode_str(arg) for arg in args}
+
+        def encode_literal(value: Any) -> str:
+            if type(value) is str:
+                encoded = allowed.get(value)
+                if encoded is not None:
+                    return encoded
+            raise _Mismatch
+
+        return encode_literal
+    raise _Unsupported(annotation)
+
+
+# (field name, alias, encoded '"alias":' prefix, value encoder, is required)
+_FieldPlan = List[Tuple[str, str, str, _Encode, bool]]
+
+
+class ModelEncoder:
+    """
+    JSON encoder compiled from a pydantic serializer's fields.
+
+    Fields are read by alias or by name, in declaration order. Omitted and
+    NotGiven fields are left out, explicit None values are kept and keys that
+    are not fields are ignored, matching `to_encodable`.
+    """
+
+    def __init__(self, model: typing.Type[BaseModel]):
+        self.model = model
+        self._plan: _FieldPlan = []
+        for name, field in model.model_fields.items():
+            alias = field.alias or name
+            self._plan.append(
+                (
+                    name,
+                    alias,
+                    _encode_str(alias) + ":",
+                    _compile(field.annotation),
+                    field.is_required(),
+                )
+            )
+
+    def encode_value(self, value: Any) -> str:
+        """Encodes a dict of field values into a JSON object"""
+        if type(value) is not dict:
+            raise _Mismatch
+        parts: List[str] = []
+        for name, alias, prefix, encode, required in self._plan:
+            if alias in value:
+                item = value[alias]
+            elif name in value:
+                item = value[name]
+            elif required:
+                raise _Mismatch
+            else:
+                continue
+            if isinstance(item, NotGiven):
+                if required:
+                    raise _Mismatch
+                continue
+            parts.append(prefix + encode(item))
+        return "{" + ",".join(parts) + "}"
+
+
+_encoders: Dict[Any, Optional[ModelEncoder]] = {}
+# reentrant, as compiling a serializer compiles the serializers nested in it
+_encoders_lock = threading.RLock()
+
+
+def encoder_for(dump_with: Any) -> Optional[ModelEncoder]:
+    """
+    Returns the compiled encoder of a serializer model, or None when one of its
+    fields has an annotation the compiled encoders do not support.
+    """
+    try:
+        return _encoders[dump_with]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+
+    with _encoders_lock:
+        encoder: Optional[ModelEncoder] = None
+        if isinstance(dump_with, type) and issubclass(dump_with, BaseModel):
+            try:
+                encoder = ModelEncoder(dump_with)
+            except _Unsupported:
+                encoder = None
+        _encoders[dump_with] = encoder
+    return encoder
+
+
+def to_json_bytes(
+    *, item: Any, dump_with: Any, codec: JsonCodec = stdlib_json_codec
+) -> bytes:
+    """
+    Encodes a request body into aliased JSON bytes.
+
+    Uses the compiled encoder of `dump_with` when every value already has its
+    declared type, and otherwise serializes the output of `to_encodable` with
+    `codec`, the client's JSON codec.
+    """
+    encoder = encoder_for(dump_with)
+    if encoder is not None:
+        try:
+            return encoder.encode_value(item).encode("utf-8")
+        except _Mismatch:
+            pass
+    return codec.dumps(to_encodable(item=item, dump_with=dump_with))
+
+
+def urlencode_form(data: Mapping[str, Any]) -> bytes:
+    """
+    Encodes form data into an x-www-form-urlencoded body exactly as httpx
+    encodes `data=` request bodies.
+    """
+    return encode_query_string(data).encode("utf-8")
+
+
+def _compile_form(annotation: Any) -> _Encode:
+    if annotation is int:
+
+        def encode_int(value: Any) -> str:
+            if type(value) is int:
+                return int.__repr__(value)
+            raise _Mismatch
+
+        return encode_int
+    if annotation is bool:
+        return _encode_bool
+    if annotation is str:
+
+        def encode_str(value: Any) -> str:
+            if type(value) is str:
+                return quote_plus(value)
+            raise _Mismatch
+
+        return encode_str
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1 or len(args) != 2:
+            raise _Unsupported(annotation)
+        inner = _compile_form(members[0])
+
+        def encode_optional(value: Any) -> str:
+            # httpx sends None as an empty value
+            return "" if value is None else inner(value)
+
+        return encode_optional
+    if origin in (typing.Literal, Literal) and all(type(arg) is str for arg in args):
+        allowed = {arg: quote_plus(arg) for arg in args}
+
+        def encode_literal(value: Any) -> str:
+            if type(value) is str:
+                encoded = allowed.get(value)
+                if encoded is not None:
+                    return encoded
+            raise _Mismatch
+
+        return encode_literal
+    raise _Unsupported(annotation)
+
+
+class FormEncoder:
+    """
+    x-www-form-urlencoded encoder compiled once from a serializer and its
+    per-field `style`/`explode` metadata.
+
+    Serializers whose fields are all scalars are encoded in a single pass that
+    writes the body directly; with scalars every style encodes like `form`.
+    Values that need pydantic's coercion, and serializers with list or object
+    fields, go through `to_form_urlencoded` instead. Both paths produce the same
+    bytes as httpx would for the equivalent `data=` mapping.
+    """
+
+    def __init__(
+        self,
+        *,
+        dump_with: Any,
+        style: Mapping[str, QueryParamStyle],
+        explode: Mapping[str, bool],
+    ):
+        self.dump_with = dump_with
+        self.style = dict(style)
+        self.explode = dict(explode)
+        self._plan: Optional[_FieldPlan] = None
+        if isinstance(dump_with, type) and issubclass(dump_with, BaseModel):
+            try:
+                self._plan = [
+                    (
+                        name,
+                        field.alias or name,
+                        quote_plus(field.alias or name) + "=",
+                        _compile_form(field.annotation),
+                        field.is_required(),
+                    )
+                    for name, field in dump_with.model_fields.items()
+                ]
+            except _Unsupported:
+                self._plan = None
+
+    def encode(self, item: Any) -> bytes:
+        """Encodes the keyword arguments of a request into the form body"""
+        plan = self._plan
+        if plan is not None and type(item) is dict:
+            try:
+                parts: List[str] = []
+                for name, alias, prefix, encode, required in plan:
+                    if alias in item:
+                        value = item[alias]
+                    elif name in item:
+                        value = item[name]
+                    elif required:
+                        raise _Mismatch
+                    else:
+                        continue
+                    if isinstance(value, NotGiven):
+                        if required:
+                            raise _Mismatch
+                        continue
+                    parts.append(prefix + encode(value))
+                return "&".join(parts).encode("ascii")
+            except _Mismatch:
+                pass
+        return urlencode_form(
+            to_form_urlencoded(
+                item=item,
+                dump_with=self.dump_with,
+                style=self.style,
+                explode=self.explode,
+            )
+        )
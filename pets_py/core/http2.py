@@ -0,0 +1,197 @@
+import threading
+from typing import Any, Callable, Dict, Iterator, AsyncIterator, Optional, Tuple
+
+import anyio
+import httpx
+
+try:
+    import h2  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore
+
+"""
+HTTP/2 transports.
+
+With HTTP/2 the clients multiplex concurrent requests as streams of a single
+connection per origin, instead of opening (and TLS-handshaking) one HTTP/1.1
+connection per in-flight request. The number of concurrent streams per
+connection is capped client-side: requests past the cap wait for a stream to
+close, for at most the pool timeout, rather than queueing inside the
+connection.
+
+HTTP/2 is negotiated with ALPN, so it only applies to `https` base URLs, and
+requires the `h2` package (`pip install httpx[http2]`).
+"""
+
+DEFAULT_MAX_CONCURRENT_STREAMS = 100
+"""
+Maximum number of concurrent requests multiplexed over an HTTP/2 connection
+"""
+
+_Origin = Tuple[bytes, bytes, Optional[int]]
+
+
+def check_http2() -> None:
+    """
+    Raises if HTTP/2 cannot be used in this environment.
+    """
+    if h2 is None:
+        raise ImportError(
+            "HTTP/2 requires the `h2` package to be installed "
+            "(e.g. `pip install httpx[http2]`)"
+        )
+
+
+def _check_max_concurrent_streams(max_concurrent_streams: int) -> None:
+    if max_concurrent_streams < 1:
+        raise ValueError("max_concurrent_streams must be at least 1")
+
+
+def _origin(request: httpx.Request) -> _Origin:
+    url = request.url
+    return (url.raw_scheme, url.raw_host, url.port)
+
+
+def _pool_timeout(request: httpx.Request) -> Optional[float]:
+    return request.extensions.get("timeout", {}).get("pool")
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that releases its stream slot once closed"""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], Any]):
+        self._stream = stream
+        self._release: Optional[Callable[[], Any]] = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response body that releases its stream slot once closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], Any]):
+        self._stream = stream
+        self._release: Optional[Callable[[], Any]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class SyncStreamLimitTransport(httpx.BaseTransport):
+    """
+    Transport capping the number of in-flight requests per origin, i.e. per
+    HTTP/2 connection, of the transport it wraps.
+
+    Attributes:
+        transport: The wrapped transport
+        max_concurrent_streams: Maximum number of in-flight requests per origin
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    ):
+        _check_max_concurrent_streams(max_concurrent_streams)
+        self.transport = transport
+        self.max_concurrent_streams = max_concurrent_streams
+        self._streams: Dict[_Origin, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, origin: _Origin) -> threading.BoundedSemaphore:
+        semaphore = self._streams.get(origin)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._streams.setdefault(
+                    origin, threading.BoundedSemaphore(self.max_concurrent_streams)
+                )
+        return semaphore
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(_origin(request))
+        if not semaphore.acquire(timeout=_pool_timeout(request)):
+            raise httpx.PoolTimeout(
+                "timed out waiting for an HTTP/2 stream", request=request
+            )
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncStreamLimitTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport capping the number of in-flight requests per origin, i.e. per
+    HTTP/2 connection, of the transport it wraps.
+
+    Attributes:
+        transport: The wrapped transport
+        max_concurrent_streams: Maximum number of in-flight requests per origin
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    ):
+        _check_max_concurrent_streams(max_concurrent_streams)
+        self.transport = transport
+        self.max_concurrent_streams = max_concurrent_streams
+        # semaphores are created lazily, from within the event loop
+        self._streams: Dict[_Origin, anyio.Semaphore] = {}
+
+    def _semaphore(self, origin: _Origin) -> anyio.Semaphore:
+        semaphore = self._streams.get(origin)
+        if semaphore is None:
+            semaphore = self._streams[origin] = anyio.Semaphore(
+                self.max_concurrent_streams
+            )
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(_origin(request))
+        try:
+            with anyio.fail_after(_pool_timeout(request)):
+                await semaphore.acquire()
+        except TimeoutError:
+            raise httpx.PoolTimeout(
+                "timed out waiting for an HTTP/2 stream", request=request
+            ) from None
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,159 @@
+import collections
+import threading
+from typing import Any, Hashable, Iterable, Tuple, Type
+
+from pydantic import BaseModel
+from typing_extensions import TypedDict
+
+from .records import Record
+
+"""
+Interning of decoded response data.
+
+Bulk responses repeat the same few values over and over: pet statuses, category
+and tag names, photo URL prefixes. An Interner walks a decoded response once and
+makes equal strings, and equal instances of small value types (e.g. `Category`
+and `Tag`), share a single object held in a bounded flyweight table.
+"""
+
+
+class InternerStats(TypedDict):
+    """
+    Snapshot of an Interner's flyweight table counters.
+
+    Attributes:
+        hits: Values replaced by an equal value already in the table
+        misses: Values that were added to the table
+        evictions: Values dropped from the table to stay within its bound
+        size: Number of values currently held by the table
+        hit_rate: Share of lookups that were hits (0.0 when unused)
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    hit_rate: float
+
+
+class Interner:
+    """
+    Deduplicates strings and small value objects in decoded responses.
+
+    Strings and instances of `flyweight_types` (pydantic models or records) are
+    shared by value: once interned, an equal value decoded later is replaced by
+    the one in the table. Shared pydantic models must therefore be treated as
+    read-only; records are immutable already. The table keeps the `max_size` most
+    recently used values, so one-off values such as pet names only pass through
+    it while repeated ones stay.
+
+    Attributes:
+        flyweight_types: Types whose equal instances are shared
+        max_size: Upper bound on the number of values in the table
+        intern_strings: Whether equal strings are made to share one object
+    """
+
+    flyweight_types: Tuple[Type[Any], ...]
+    max_size: int
+    intern_strings: bool
+
+    def __init__(
+        self,
+        *,
+        flyweight_types: Iterable[Type[Any]] = (),
+        max_size: int = 4096,
+        intern_strings: bool = True,
+    ):
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        self.flyweight_types = tuple(flyweight_types)
+        self.max_size = max_size
+        self.intern_strings = intern_strings
+        self._table: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def intern(self, value: Any) -> Any:
+        """
+        Interns a decoded response in place and returns it.
+
+        Lists, dicts, tuples, pydantic models and records are walked recursively.
+        Freshly decoded models and records are updated in place, so this must only
+        be applied to data that has not been handed out yet.
+        """
+        tp = type(value)
+        if tp is str:
+            return self._flyweight(value, value) if self.intern_strings else value
+        if tp is list:
+            for i, item in enumerate(value):
+                value[i] = self.intern(item)
+            return value
+        if tp is dict:
+            return {self.intern(k): self.intern(v) for k, v in value.items()}
+        if tp is tuple:
+            return tuple(self.intern(item) for item in value)
+        if isinstance(value, BaseModel):
+            values = value.__dict__
+            for name, item in values.items():
+                values[name] = self.intern(item)
+            if tp in self.flyweight_types:
+                return self._flyweight(
+                    (tp, tuple(values.items()), frozenset(value.model_fields_set)),
+                    value,
+                )
+            return value
+        if isinstance(value, Record):
+            for name in value.__slots__:
+                object.__setattr__(value, name, self.intern(getattr(value, name)))
+            if tp in self.flyweight_types:
+                return self._flyweight(value, value)
+            return value
+        return value
+
+    def _flyweight(self, key: Hashable, value: Any) -> Any:
+        table = self._table
+        with self._lock:
+            try:
+                shared = table.get(key)
+            except TypeError:
+                # unhashable field value, e.g. a list in a model marked as flyweight
+                return value
+            if shared is not None:
+                self._hits += 1
+                table.move_to_end(key)
+                return shared
+
+            self._misses += 1
+            if self.max_size:
+                table[key] = value
+                if len(table) > self.max_size:
+                    table.popitem(last=False)
+                    self._evictions += 1
+            return value
+
+    def stats(self) -> InternerStats:
+        """
+        Returns the current table counters and hit rate.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._table),
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """
+        Drops every shared value and resets the counters.
+        """
+        with self._lock:
+            self._table.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,183 @@
+import typing
+from typing import Any, Dict, Generic, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .validation import ResponseValidator, ValidationMode
+
+"""
+Lazily decoded response models.
+
+A LazyModel keeps the decoded JSON object of a response model and only validates
+a field the first time it is read. Bulk reads that touch a handful of fields per
+item (e.g. `id` and `status` of every pet) skip building the rest of the tree.
+"""
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class LazyModel(Generic[ModelT]):
+    """
+    Read-only view of a pydantic model backed by its raw JSON object.
+
+    Attribute access mirrors the wrapped model: each field is validated against
+    its annotation on first access and cached afterwards. Nested models and
+    lists of models are themselves returned lazily.
+
+    Attributes:
+        model_cls: The pydantic model this view stands in for
+    """
+
+    __slots__ = ("model_cls", "_raw", "_values", "_validator", "_mode")
+
+    model_cls: Type[ModelT]
+
+    def __init__(
+        self,
+        model_cls: Type[ModelT],
+        raw: Dict[str, Any],
+        *,
+        validator: Optional[ResponseValidator] = None,
+        mode: Optional[ValidationMode] = None,
+    ):
+        self.model_cls = model_cls
+        self._raw = raw
+        self._values: Dict[str, Any] = {}
+        self._validator = validator or ResponseValidator()
+        self._mode = mode
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when regular attribute lookup fails, i.e. for model fields
+        if name in LazyModel.__slots__ or name.startswith("__"):
+            # unset slots (e.g. on the bare instance copy and pickle build) and
+            # special method lookups never name model fields
+            raise AttributeError(name)
+        field = self.model_cls.model_fields.get(name)
+        if field is None:
+            raise AttributeError(
+                f"'{self.model_cls.__name__}' object has no attribute '{name}'"
+            )
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        if field.alias is not None and field.alias in self._raw:
+            raw_value = self._raw[field.alias]
+        elif name in self._raw:
+            raw_value = self._raw[name]
+        elif field.is_required():
+            # let the full model validation produce the usual missing field error
+            self.model_cls.model_validate(self._raw)
+            raise AttributeError(name)
+        else:
+            values[name] = field.get_default(call_default_factory=True)
+            return values[name]
+
+        value = lazy_from_encodable(
+            data=raw_value,
+            load_with=field.annotation,
+            validator=self._validator,
+            mode=self._mode,
+        )
+        values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyModel.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"Lazy{self.model_cls.__name__}({self._raw!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            return self.to_model() == other.to_model()
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    @property
+    def model_fields_set(self) -> typing.Set[str]:
+        """Fields present in the underlying JSON object"""
+        return {
+            name
+            for name, field in self.model_cls.model_fields.items()
+            if (field.alias is not None and field.alias in self._raw)
+            or name in self._raw
+        }
+
+    def to_model(self) -> ModelT:
+        """
+        Decodes every remaining field and returns the equivalent pydantic model.
+        """
+        values = {name: getattr(self, name) for name in self.model_fields_set}
+        for name, value in values.items():
+            if isinstance(value, LazyModel):
+                values[name] = value.to_model()
+            elif isinstance(value, list):
+                values[name] = [
+                    v.to_model() if isinstance(v, LazyModel) else v for v in value
+                ]
+        return self.model_cls.model_construct(**values)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Equivalent of `BaseModel.model_dump` on the fully decoded model"""
+        return self.to_model().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Equivalent of `BaseModel.model_dump_json` on the fully decoded model"""
+        return self.to_model().model_dump_json(**kwargs)
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+def lazy_from_encodable(
+    *,
+    data: Any,
+    load_with: Any,
+    validator: Optional[ResponseValidator] = None,
+    mode: Optional[ValidationMode] = None,
+) -> Any:
+    """
+    Converts decoded JSON data into `load_with`, deferring the validation of
+    every model in it to the first access of each field.
+
+    Models become LazyModel views, lists of models become lists of views and
+    any other value is validated eagerly with the given validation mode.
+    """
+    validator = validator or ResponseValidator()
+    if _is_model(load_with) and isinstance(data, dict):
+        return LazyModel(load_with, data, validator=validator, mode=mode)
+
+    origin = typing.get_origin(load_with)
+    args = typing.get_args(load_with)
+    if origin is list and isinstance(data, list):
+        item_type = args[0] if args else Any
+        if _is_model(item_type):
+            return [
+                (
+                    LazyModel(item_type, item, validator=validator, mode=mode)
+                    if isinstance(item, dict)
+                    else validator.load_python(
+                        data=item, load_with=item_type, mode=mode
+                    )
+                )
+                for item in data
+            ]
+        # lists of scalars are cheap to validate as a whole
+        return validator.load_python(data=data, load_with=load_with, mode=mode)
+    if origin is Union and data is not None:
+        for arg in args:
+            if _is_model(arg) and isinstance(data, dict):
+                return LazyModel(arg, data, validator=validator, mode=mode)
+            if typing.get_origin(arg) is list and isinstance(data, list):
+                return lazy_from_encodable(
+                    data=data, load_with=arg, validator=validator, mode=mode
+                )
+
+    return validator.load_python(data=data, load_with=load_with, mode=mode)
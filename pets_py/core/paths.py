@@ -0,0 +1,104 @@
+import enum
+import re
+from typing import Any, Dict, List, Mapping, Tuple
+from urllib.parse import quote
+
+from .type_utils import NotGiven
+
+"""
+Compiled path templates.
+
+Operation paths such as `/pet/{petId}` are compiled once into formatters that
+validate and percent-encode their parameters, so a parameter value can never
+change the shape of the path (e.g. `a/b` is sent as `a%2Fb`).
+"""
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def _path_segment(value: Any) -> str:
+    """Encodes a path parameter value into a single path segment"""
+    cls = type(value)
+    if cls is int:
+        return int.__repr__(value)
+    if cls is str:
+        if not value:
+            raise ValueError("path parameters cannot be empty")
+        if value.isascii() and value.isalnum():
+            return value
+        if value in (".", ".."):
+            # dot segments would be resolved away, changing the path
+            return value.replace(".", "%2E")
+        return quote(value, safe="")
+    if cls is bool:
+        return "true" if value else "false"
+    if value is None or isinstance(value, NotGiven):
+        raise ValueError("path parameters are required")
+    if isinstance(value, enum.Enum):
+        return _path_segment(value.value)
+    return _path_segment(str(value))
+
+
+class PathTemplate:
+    """
+    Operation path with `{name}` placeholders, compiled once into a formatter.
+
+    Attributes:
+        template: The path template, e.g. `/pet/{petId}`
+        names: Names of the template's parameters, in order
+    """
+
+    __slots__ = ("template", "names", "_format")
+
+    def __init__(self, template: str):
+        self.template = template
+        names: List[str] = []
+
+        def positional(match: "re.Match[str]") -> str:
+            names.append(match.group(1))
+            return "{%d}" % (len(names) - 1)
+
+        # paths are formatted relative to the normalized base URL prefix
+        relative = template[1:] if template.startswith("/") else template
+        pattern = _PLACEHOLDER.sub(positional, relative)
+        literal = _PLACEHOLDER.sub("", relative)
+        if "{" in literal or "}" in literal:
+            raise ValueError(f"malformed path template: {template!r}")
+        self.names: Tuple[str, ...] = tuple(names)
+        self._format = pattern.format
+
+    def format(self, params: Mapping[str, Any]) -> str:
+        """
+        Renders the path, relative to the base URL, from its parameters.
+
+        Raises:
+            ValueError: If a parameter is missing, None or empty
+        """
+        try:
+            return self._format(*[_path_segment(params[name]) for name in self.names])
+        except KeyError as e:
+            raise ValueError(
+                f"missing path parameter {e.args[0]!r} for {self.template!r}"
+            ) from None
+        except ValueError as e:
+            raise ValueError(f"{e} ({self.template!r})") from None
+
+    def __repr__(self) -> str:
+        return f"PathTemplate({self.template!r})"
+
+
+_path_templates: Dict[str, PathTemplate] = {}
+_MAX_CACHED = 4096
+
+
+def path_template(template: str) -> PathTemplate:
+    """
+    Returns the (cached) compiled path template
+    """
+    compiled = _path_templates.get(template)
+    if compiled is None:
+        compiled = PathTemplate(template)
+        if len(_path_templates) >= _MAX_CACHED:
+            _path_templates.clear()
+        _path_templates[template] = compiled
+    return compiled
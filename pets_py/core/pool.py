@@ -0,0 +1,125 @@
+from typing import Optional
+
+import httpx
+
+from .dns import AsyncDnsCacheTransport, DnsCache, DnsCacheTransport
+from .http2 import (
+    DEFAULT_MAX_CONCURRENT_STREAMS,
+    AsyncStreamLimitTransport,
+    SyncStreamLimitTransport,
+    check_http2,
+)
+
+"""
+Connection pool settings of the httpx clients built by the SDK.
+
+httpx keeps only 20 of its 100 connections alive, for 5 seconds, so every burst
+of concurrent requests past 20 reconnects (a TCP and TLS handshake each). The
+SDK keeps every pooled connection alive, for longer, so bursts reuse warm
+connections. The connection limit itself stays at 100: larger pools only help
+when the client has spare CPU, see `benchmarks/bench_pool.py`.
+"""
+
+DEFAULT_MAX_CONNECTIONS = 100
+"""
+Maximum number of concurrent connections per client
+"""
+
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+"""
+Maximum number of idle connections kept alive per client
+"""
+
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+"""
+Seconds an idle connection is kept alive
+"""
+
+
+def pool_limits(
+    *,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.Limits:
+    """
+    Builds the connection pool limits of a client, None meaning unlimited.
+    """
+    if max_connections is not None and max_connections < 1:
+        raise ValueError("max_connections must be at least 1")
+    if max_connections is not None and (
+        max_keepalive_connections is None or max_keepalive_connections > max_connections
+    ):
+        # at most every open connection can be kept alive
+        max_keepalive_connections = max_connections
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def client_timeout(
+    timeout: Optional[float], pool_timeout: Optional[float] = None
+) -> httpx.Timeout:
+    """
+    Builds a client's timeouts, waiting at most `pool_timeout` seconds for a
+    connection from the pool (the request timeout when it is None).
+    """
+    return httpx.Timeout(
+        timeout, pool=timeout if pool_timeout is None else pool_timeout
+    )
+
+
+def client_transport(
+    *,
+    limits: httpx.Limits,
+    http2: bool = False,
+    max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    dns_cache: Optional[DnsCache] = None,
+) -> Optional[httpx.BaseTransport]:
+    """
+    Builds the transport of a synchronous client, None when httpx's default
+    transport does.
+    """
+    if http2:
+        check_http2()
+    elif dns_cache is None:
+        return None
+    transport = (
+        httpx.HTTPTransport(http2=http2, limits=limits)
+        if dns_cache is None
+        else DnsCacheTransport(dns_cache, http2=http2, limits=limits)
+    )
+    if not http2:
+        return transport
+    return SyncStreamLimitTransport(
+        transport, max_concurrent_streams=max_concurrent_streams
+    )
+
+
+def async_client_transport(
+    *,
+    limits: httpx.Limits,
+    http2: bool = False,
+    max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    dns_cache: Optional[DnsCache] = None,
+) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Builds the transport of an asynchronous client, None when httpx's default
+    transport does.
+    """
+    if http2:
+        check_http2()
+    elif dns_cache is None:
+        return None
+    transport = (
+        httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        if dns_cache is None
+        else AsyncDnsCacheTransport(dns_cache, http2=http2, limits=limits)
+    )
+    if not http2:
+        return transport
+    return AsyncStreamLimitTransport(
+        transport, max_concurrent_streams=max_concurrent_streams
+    )
@@ -1,7 +1,9 @@
 import json
+import math
 
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
 from typing_extensions import Literal, Sequence
+from urllib.parse import urlencode
 
 import httpx
 
@@ -20,99 +22,175 @@ def encode_query_param(
     style: QueryParamStyle = "form",
     explode: bool = True,
 ):
-    if style == "form":
-        _encode_form(params, name, value, explode)
-    elif style == "spaceDelimited":
-        _encode_spaced_delimited(params, name, value, explode)
-    elif style == "pipeDelimited":
-        _encode_pipe_delimited(params, name, value, explode)
-    elif style == "deepObject":
-        _encode_deep_object(params, name, value, explode)
-    else:
-        raise NotImplementedError(f"query param style '{style}' not implemented")
+    query_param_encoder(name, style=style, explode=explode).encode(params, value)
 
 
 def _query_str(val: Any) -> str:
     """jsonify value without wrapping quotes for strings"""
+    cls = type(val)
+    if cls is str:
+        return val
+    if cls is int:
+        return int.__repr__(val)
+    if cls is bool:
+        return "true" if val else "false"
+    if val is None:
+        return "null"
+    if cls is float and math.isfinite(val):
+        return float.__repr__(val)
     if isinstance(val, str):
         return val
     return json.dumps(val)
 
 
-def _encode_form(params: QueryParams, name: str, value: Any, explode: bool):
+_QueryEncode = Callable[[QueryParams, Any], None]
+
+
+class QueryParamEncoder:
     """
-    Encodes query params in the `form` style as defined by OpenAPI with both explode and non-explode
-    variants.
+    Query parameter encoder compiled once from a parameter's name, style and
+    explode settings.
+
+    Encoding is equivalent to `encode_query_param`, without dispatching on the
+    style for every value.
+
+    Attributes:
+        name: Name of the query parameter
+        style: OpenAPI serialization style
+        explode: Whether lists and objects are exploded
     """
-    if isinstance(value, list) and not explode:
-        # non-explode form lists should be encoded like /users?id=3,4,5
-        params[name] = ",".join(map(_query_str, value))
-    elif isinstance(value, dict):
-        if explode:
-            # explode form objects should be encoded like /users?key0=val0&key1=val1
-            # the input param name will be omitted
-            for k, v in value.items():
-                params[k] = _query_str(v)
+
+    __slots__ = ("name", "style", "explode", "encode")
+
+    encode: _QueryEncode
+    """
+    Encodes a value of the parameter into the query params
+    """
+
+    def __init__(
+        self, name: str, *, style: QueryParamStyle = "form", explode: bool = True
+    ):
+        self.name = name
+        self.style = style
+        self.explode = explode
+        if style == "form":
+            self.encode = _compile_form(name, explode, ",")
+        elif style == "spaceDelimited":
+            self.encode = _compile_form(name, explode, " ")
+        elif style == "pipeDelimited":
+            self.encode = _compile_form(name, explode, "|")
+        elif style == "deepObject":
+            self.encode = _compile_deep_object(name, explode)
         else:
-            # non-explode form objects should be encoded like /users?id=key0,val0,key1,val1
-            encoded_chunks = []
-            for k, v in value.items():
-                encoded_chunks.extend([str(k), _query_str(v)])
-            params[name] = ",".join(encoded_chunks)
-    else:
-        params[name] = value
+            raise NotImplementedError(f"query param style '{style}' not implemented")
 
 
-def _encode_spaced_delimited(params: QueryParams, name: str, value: Any, explode: bool):
+_query_param_encoders: Dict[Tuple[str, str, bool], QueryParamEncoder] = {}
+_MAX_QUERY_PARAM_ENCODERS = 1024
+
+
+def query_param_encoder(
+    name: str, *, style: QueryParamStyle = "form", explode: bool = True
+) -> QueryParamEncoder:
+    """
+    Returns the (cached) compiled encoder of a query parameter
+    """
+    key = (name, style, explode)
+    encoder = _query_param_encoders.get(key)
+    if encoder is None:
+        encoder = QueryParamEncoder(name, style=style, explode=explode)
+        if len(_query_param_encoders) >= _MAX_QUERY_PARAM_ENCODERS:
+            _query_param_encoders.clear()
+        _query_param_encoders[key] = encoder
+    return encoder
+
+
+def _primitive_str(value: Any) -> str:
+    """Mirrors httpx's conversion of query and form values to strings"""
+    if value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif value is None:
+        return ""
+    return str(value)
+
+
+def encode_query_string(params: Mapping[str, Any]) -> str:
     """
-    Encodes query params in the `spaceDelimited` style as defined by OpenAPI with both explode and non-explode
-    variants.
+    Encodes query params into the final query string, exactly as httpx encodes
+    `params=` (lists and tuples repeat their key).
     """
-    if isinstance(value, list) and not explode:
-        # non-explode spaceDelimited lists should be encoded like /users?id=3%204%205
-        params[name] = " ".join(map(_query_str, value))
-    else:
-        # according to the docs, spaceDelimited + explode=false only effects lists,
-        # all other encodings are marked as n/a or are the same as `form` style
-        # fall back on form style as it is the default for query params
-        _encode_form(params, name, value, explode)
+    pairs: List[Tuple[str, str]] = []
+    for key, value in params.items():
+        if isinstance(value, (list, tuple)):
+            pairs.extend((key, _primitive_str(item)) for item in value)
+        else:
+            pairs.append((key, _primitive_str(value)))
+    return urlencode(pairs)
 
 
-def _encode_pipe_delimited(params: QueryParams, name: str, value: Any, explode: bool):
+def _compile_form(name: str, explode: bool, separator: str) -> _QueryEncode:
     """
-    Encodes query params in the `pipeDelimited` style as defined by OpenAPI with both explode and non-explode
-    variants.
+    Compiles the `form` style as defined by OpenAPI with both explode and non-explode
+    variants. `spaceDelimited` and `pipeDelimited` only differ from it for non-explode
+    lists, all other encodings are marked as n/a or are the same as `form` style.
     """
-    if isinstance(value, list) and not explode:
-        # non-explode pipeDelimited lists should be encoded like /users?id=3|4|5
-        params[name] = "|".join(map(_query_str, value))
-    else:
-        # according to the docs, pipeDelimited + explode=false only effects lists,
-        # all other encodings are marked as n/a or are the same as `form` style
-        # fall back on form style as it is the default for query params
-        _encode_form(params, name, value, explode)
+    if explode:
+
+        def encode_exploded(params: QueryParams, value: Any) -> None:
+            if isinstance(value, dict):
+                # explode form objects should be encoded like /users?key0=val0&key1=val1
+                # the input param name will be omitted
+                for k, v in value.items():
+                    params[k] = _query_str(v)
+            else:
+                # explode form lists are repeated by httpx like /users?id=3&id=4
+                params[name] = value
+
+        return encode_exploded
+
+    def encode(params: QueryParams, value: Any) -> None:
+        if isinstance(value, list):
+            # non-explode lists should be encoded like /users?id=3,4,5 (or with
+            # the space/pipe separator of the delimited styles)
+            params[name] = separator.join(map(_query_str, value))
+        elif isinstance(value, dict):
+            # non-explode form objects should be encoded like /users?id=key0,val0,key1,val1
+            encoded_chunks = []
+            for k, v in value.items():
+                encoded_chunks.extend([str(k), _query_str(v)])
+            params[name] = ",".join(encoded_chunks)
+        else:
+            params[name] = value
+
+    return encode
 
 
-def _encode_deep_object(params: QueryParams, name: str, value: Any, explode: bool):
+def _compile_deep_object(name: str, explode: bool) -> _QueryEncode:
     """
-    Encodes query params in the `deepObject` style as defined by with both explode and non-explode
-    variants.
+    Compiles the `deepObject` style as defined by OpenAPI with both explode and
+    non-explode variants.
     """
-    if isinstance(value, (dict, list)):
-        _encode_deep_object_key(params, name, value)
-    else:
-        # according to the docs, deepObject style only applies to
-        # object encodes, encodings for primitives are listed as n/a,
-        # fall back on form style as it is the default for query params
-        _encode_form(params, name, value, explode)
+    form = _compile_form(name, explode, ",")
+
+    def encode(params: QueryParams, value: Any) -> None:
+        if isinstance(value, (dict, list)):
+            _encode_deep_object_key(params, name, value)
+        else:
+            # according to the docs, deepObject style only applies to
+            # object encodes, encodings for primitives are listed as n/a,
+            # fall back on form style as it is the default for query params
+            form(params, value)
+
+    return encode
 
 
 def _encode_deep_object_key(params: QueryParams, key: str, value: Any):
-    if isinstance(value, dict):
-        for k, v in value.items():
-            _encode_deep_object_key(params, f"{key}[{k}]", v)
-    elif isinstance(value, list):
-        for i, v in enumerate(value):
-            _encode_deep_object_key(params, f"{key}[{i}]", v)
-    else:
-        params[key] = _query_str(value)
+    items = value.items() if isinstance(value, dict) else enumerate(value)
+    for k, v in items:
+        child = key + "[" + (k if type(k) is str else f"{k}") + "]"
+        if isinstance(v, (dict, list)):
+            _encode_deep_object_key(params, child, v)
+        else:
+            params[child] = _query_str(v)
@@ -0,0 +1,197 @@
+import threading
+import typing
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+"""
+Compact read-only records mirroring the response models.
+
+A Record subclass declares `__slots__` with the field names of its pydantic model,
+so instances carry no `__dict__`, fields-set tracking or validator state. Lists are
+stored as tuples, making records immutable and hashable. Conversion to and from the
+pydantic models bypasses validation, as the data has either already been validated
+or is explicitly trusted.
+"""
+
+RecordT = TypeVar("RecordT", bound="Record")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_record_types: Dict[Type[BaseModel], Type["Record[Any]"]] = {}
+
+
+def record_for(model: Any) -> Optional[Type["Record[Any]"]]:
+    """Returns the Record class registered for a model, if any"""
+    return _record_types.get(model)
+
+
+# (field name, JSON key, nested record class, is a list)
+_FieldPlan = List[Tuple[str, str, Optional[Type["Record[Any]"]], bool]]
+
+
+class Record(typing.Generic[ModelT]):
+    """
+    Base class of the immutable, slotted record types.
+
+    Subclasses set `model` to the pydantic model they mirror and list its field
+    names in `__slots__`; they are registered automatically for that model.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    model: ClassVar[Type[BaseModel]]
+    _plan: ClassVar[Optional[_FieldPlan]] = None
+    _plan_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "model" in cls.__dict__:
+            _record_types[cls.model] = cls
+
+    def __init__(self, **kwargs: Any):
+        for name in self.__slots__:
+            value = kwargs.pop(name, None)
+            object.__setattr__(
+                self, name, tuple(value) if type(value) is list else value
+            )
+        if kwargs:
+            raise TypeError(
+                f"{type(self).__name__} got unexpected fields: {', '.join(kwargs)}"
+            )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == typing.cast(Record[Any], other)._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Any:
+        return (_rebuild, (type(self), self._values()))
+
+    @classmethod
+    def _field_plan(cls) -> _FieldPlan:
+        plan = cls._plan
+        if plan is None:
+            with cls._plan_lock:
+                plan = []
+                fields = cls.model.model_fields
+                for name in cls.__slots__:
+                    field = fields[name]
+                    nested, is_list = _nested_record(field.annotation)
+                    plan.append((name, field.alias or name, nested, is_list))
+                cls._plan = plan
+        return plan
+
+    @classmethod
+    def from_model(cls: Type[RecordT], model: BaseModel) -> RecordT:
+        """Converts a pydantic model instance into a record"""
+        record = cls.__new__(cls)
+        for name, _, nested, is_list in cls._field_plan():
+            value = getattr(model, name, None)
+            if value is not None:
+                if is_list:
+                    value = tuple(
+                        nested.from_model(v) if nested is not None else v for v in value
+                    )
+                elif nested is not None:
+                    value = nested.from_model(value)
+            object.__setattr__(record, name, value)
+        return record
+
+    @classmethod
+    def from_json(cls: Type[RecordT], data: Dict[str, Any]) -> RecordT:
+        """
+        Builds a record from a decoded JSON object (keyed by alias or name)
+        without validating it
+        """
+        record = cls.__new__(cls)
+        for name, alias, nested, is_list in cls._field_plan():
+            value = data[alias] if alias in data else data.get(name)
+            if value is not None:
+                if is_list:
+                    value = tuple(
+                        nested.from_json(v) if nested is not None else v for v in value
+                    )
+                elif nested is not None:
+                    value = nested.from_json(value)
+            object.__setattr__(record, name, value)
+        return record
+
+    def to_model(self) -> ModelT:
+        """Converts the record into the equivalent pydantic model, without validation"""
+        values: Dict[str, Any] = {}
+        for name, _, nested, is_list in self._field_plan():
+            value = getattr(self, name)
+            if value is not None:
+                if is_list:
+                    value = [v.to_model() if nested is not None else v for v in value]
+                elif nested is not None:
+                    value = value.to_model()
+            values[name] = value
+        return typing.cast(ModelT, self.model.model_construct(**values))
+
+
+def _rebuild(cls: Type[RecordT], values: Tuple[Any, ...]) -> RecordT:
+    record = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(record, name, value)
+    return record
+
+
+def _nested_record(annotation: Any) -> Tuple[Optional[Type["Record[Any]"]], bool]:
+    """Finds the record type nested in a field annotation and whether it is a list"""
+    origin = typing.get_origin(annotation)
+    if origin is Union:
+        for arg in typing.get_args(annotation):
+            if arg is not type(None):
+                return _nested_record(arg)
+    if origin is list:
+        args = typing.get_args(annotation)
+        return (record_for(args[0]) if args else None), True
+    return record_for(annotation), False
+
+
+def record_from_encodable(*, data: Any, load_with: Any) -> Any:
+    """
+    Converts decoded JSON data or validated models into the records registered
+    for the models in `load_with`. Values without a record type are returned as is.
+    """
+    if data is None:
+        return None
+    if isinstance(data, BaseModel):
+        record_cls = record_for(type(data))
+        return record_cls.from_model(data) if record_cls is not None else data
+    if isinstance(load_with, type):
+        record_cls = record_for(load_with)
+        if record_cls is not None and isinstance(data, dict):
+            return record_cls.from_json(data)
+        return data
+
+    origin = typing.get_origin(load_with)
+    args = typing.get_args(load_with)
+    if origin is list and isinstance(data, list):
+        item_type = args[0] if args else Any
+        return [record_from_encodable(data=item, load_with=item_type) for item in data]
+    if origin is Union:
+        for arg in args:
+            if isinstance(arg, type) and record_for(arg) is not None:
+                if isinstance(data, dict):
+                    return record_from_encodable(data=data, load_with=arg)
+            elif typing.get_origin(arg) is list and isinstance(data, list):
+                return record_from_encodable(data=data, load_with=arg)
+    return data
@@ -1,10 +1,13 @@
-from typing import Any, Dict, Type, Union, List, Mapping
+from typing import Any, Dict, Type, Union, List, Mapping, Optional
 
 import httpx
-from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from typing_extensions import Literal, TypedDict, Required, NotRequired
+from pydantic import BaseModel
 
+from .adapters import serializer_registry
+from .compression import CompressionAlgorithm
 from .type_utils import NotGiven
+from .validation import ValidationMode
 from .query import QueryParams, QueryParamStyle, encode_query_param
 
 """
@@ -14,6 +17,15 @@ and processing HTTP requests in a type-safe manner.
 """
 
 
+ResponseFormat = Literal["model", "lazy", "frame", "record"]
+"""
+Shape of decoded JSON responses: fully built pydantic models, `LazyModel`
+views that validate each field on first access, columnar frames
+(e.g. `PetFrame`) for arrays of models (other responses are returned as
+models), or compact immutable records (e.g. `records.Pet`)
+"""
+
+
 class RequestConfig(TypedDict):
     """
     Configuration for HTTP requests.
@@ -30,7 +42,7 @@ class RequestConfig(TypedDict):
     files: NotRequired[httpx._types.RequestFiles]
     json: NotRequired[Any]
     params: NotRequired[QueryParams]
-    headers: NotRequired[Dict[str, str]]
+    headers: NotRequired[Mapping[str, str]]
     cookies: NotRequired[Dict[str, str]]
     auth: NotRequired[httpx._types.AuthTypes]
     follow_redirects: NotRequired[bool]
@@ -49,11 +61,20 @@ class RequestOptions(TypedDict):
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        validation: Overrides the client's response validation mode for this request
+        response_format: Overrides the client's response format for this request
+        request_compression: Overrides the client's request body compression for
+            this request, None sends the body uncompressed
+        compression_threshold: Overrides the minimum size of compressed bodies
     """
 
     timeout: NotRequired[int]
     additional_headers: NotRequired[Dict[str, str]]
     additional_params: NotRequired[QueryParams]
+    validation: NotRequired[ValidationMode]
+    response_format: NotRequired[ResponseFormat]
+    request_compression: NotRequired[Optional[CompressionAlgorithm]]
+    compression_threshold: NotRequired[int]
 
 
 def default_request_options() -> RequestOptions:
@@ -86,11 +107,11 @@ def to_encodable(
 ) -> Any:
     """
     Validates and converts an item to an encodable format using a specified type.
-    Uses Pydantic's TypeAdapter for validation and converts the result
-    to a format suitable for encoding in requests.
+    Uses the Pydantic TypeAdapter cached for `dump_with` in `serializer_registry`
+    for validation and converts the result to a format suitable for encoding in requests.
     """
     filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
+    adapter = serializer_registry.get(dump_with)
     validated_item = adapter.validate_python(filtered_item)
     return model_dump(validated_item)
 
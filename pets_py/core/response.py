@@ -1,13 +1,33 @@
 import json
-from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Union,
+    Dict,
+    Type,
+    TypeVar,
+    List,
+    Generic,
+    Optional,
+)
+from typing_extensions import Literal
 from pydantic import BaseModel
 import httpx
 
+from .adapters import validator_registry
+from .codecs import stdlib_json_codec
+
 """
-Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
-Includes utilities for both synchronous and asynchronous stream processing.
+Provides functionality for handling Server-Sent Events (SSE) streams, streamed JSON arrays
+and response data encoding. Includes utilities for both synchronous and asynchronous
+stream processing.
 """
 
+StreamFormat = Literal["sse", "json_array"]
+
 EncodableT = TypeVar(
     "EncodableT",
     bound=Union[
@@ -27,14 +47,28 @@ def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    The validator for each target type is built once and shared through the
+    process-wide `validator_registry`.
     """
+    return validator_registry.get(load_with).validate_python(data)
 
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
 
-    return Caster(data=data).data
+def from_json_bytes(*, data: Union[bytes, str], load_with: Type[EncodableT]) -> Any:
+    """
+    Parses and validates a raw JSON document into the specified type in one pass.
+
+    Pydantic's JSON validator builds the target models straight from the bytes,
+    skipping the intermediate dict/list tree that `json.loads` would produce.
+    """
+    return validator_registry.get(load_with).validate_json(data)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses a JSON document into plain Python objects with the standard library
+    codec. Clients decode with their configured `json_codec` instead.
+    """
+    return stdlib_json_codec.loads(data)
 
 
 T = TypeVar("T")
@@ -49,7 +83,13 @@ class StreamResponse(Generic[T]):
     into the specified type.
     """
 
-    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        loads: Callable[[str], Any] = json_loads,
+    ):
         """
         Initialize the stream processor with response and conversion settings.
 
@@ -57,10 +97,12 @@ class StreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Context manager for the stream
             cast_to: Target type for converting parsed events
+            loads: Decodes the JSON data of each event
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
+        self._loads = loads
         self.iterator = response.iter_bytes()
         self.buffer = bytearray()
         self.position = 0
@@ -119,7 +161,7 @@ class StreamResponse(Generic[T]):
                         data = self._parse_sse(message)
                         if data:
                             try:
-                                parsed_data = json.loads(data)
+                                parsed_data = self._loads(data)
                                 if (
                                     not isinstance(parsed_data, dict)
                                     or "data" not in parsed_data
@@ -141,7 +183,7 @@ class StreamResponse(Generic[T]):
             data = self._parse_sse(message)
             if data:
                 try:
-                    parsed_data = json.loads(data)
+                    parsed_data = self._loads(data)
                     if not isinstance(parsed_data, dict) or "data" not in parsed_data:
                         parsed_data = {"data": parsed_data}
                     return from_encodable(data=parsed_data, load_with=self.cast_to)
@@ -177,7 +219,13 @@ class AsyncStreamResponse(Generic[T]):
     but compatible with async/await syntax.
     """
 
-    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        loads: Callable[[str], Any] = json_loads,
+    ):
         """
         Initialize the async stream processor.
 
@@ -185,10 +233,12 @@ class AsyncStreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Async context manager for the stream
             cast_to: Target type for converting parsed events
+            loads: Decodes the JSON data of each event
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
+        self._loads = loads
         self.iterator = response.aiter_bytes()
         self.buffer = bytearray()
         self.position = 0
@@ -243,7 +293,7 @@ class AsyncStreamResponse(Generic[T]):
                         data = self._parse_sse(message)
                         if data:
                             try:
-                                parsed_data = json.loads(data)
+                                parsed_data = self._loads(data)
                                 if (
                                     not isinstance(parsed_data, dict)
                                     or "data" not in parsed_data
@@ -265,7 +315,7 @@ class AsyncStreamResponse(Generic[T]):
             data = self._parse_sse(message)
             if data:
                 try:
-                    parsed_data = json.loads(data)
+                    parsed_data = self._loads(data)
                     if not isinstance(parsed_data, dict) or "data" not in parsed_data:
                         parsed_data = {"data": parsed_data}
                     return from_encodable(data=parsed_data, load_with=self.cast_to)
@@ -291,3 +341,226 @@ class AsyncStreamResponse(Generic[T]):
         if data:
             return "\n".join(data)
         return None
+
+
+_STRUCTURAL_RE = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL_RE = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class JsonArrayDecoder:
+    """
+    Incrementally splits a JSON array into the raw bytes of its top level elements.
+
+    Bytes are fed as they arrive from the network; every element that has been
+    fully received is returned and dropped from the internal buffer, so memory
+    stays bounded by the largest single element rather than the whole document.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._elem_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Adds a chunk of the document and returns the elements it completed.
+
+        Raises:
+            ValueError: If the document is not a JSON array
+        """
+        if self._done:
+            if chunk.strip(_WHITESPACE):
+                raise ValueError("unexpected data after the end of the JSON array")
+            return []
+
+        buf = self._buffer
+        buf += chunk
+        pos = self._pos
+        items: List[bytes] = []
+
+        while True:
+            if self._in_string:
+                m = _STRING_SPECIAL_RE.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                if buf[m.start()] == 0x5C:  # backslash escapes the next byte
+                    if m.end() >= len(buf):
+                        pos = m.start()
+                        break
+                    pos = m.end() + 1
+                    continue
+                self._in_string = False
+                pos = m.end()
+                continue
+
+            m = _STRUCTURAL_RE.search(buf, pos)
+            if not self._started:
+                leading = buf[pos : len(buf) if m is None else m.start()]
+                if leading.strip(_WHITESPACE) or (
+                    m is not None and buf[m.start()] != 0x5B
+                ):
+                    raise ValueError("expected a JSON array")
+            if m is None:
+                pos = len(buf)
+                break
+
+            c = buf[m.start()]
+            pos = m.end()
+            if c == 0x22:  # "
+                self._in_string = True
+            elif c == 0x5B or c == 0x7B:  # [ {
+                if not self._started:
+                    self._started = True
+                    self._elem_start = pos
+                self._depth += 1
+            elif c == 0x5D or c == 0x7D:  # ] }
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(items, m.start())
+                    self._done = True
+                    if buf[pos:].strip(_WHITESPACE):
+                        raise ValueError(
+                            "unexpected data after the end of the JSON array"
+                        )
+                    break
+            elif self._depth == 1:  # , between top level elements
+                self._emit(items, m.start())
+                self._elem_start = pos
+
+        # drop everything before the element currently being received
+        consumed = self._elem_start
+        if consumed:
+            del buf[:consumed]
+            pos -= consumed
+            self._elem_start = 0
+        self._pos = pos
+        return items
+
+    def close(self) -> None:
+        """
+        Signals the end of the document.
+
+        Raises:
+            ValueError: If the array was not terminated
+        """
+        if not self._done:
+            raise ValueError("truncated JSON array")
+
+    def _emit(self, items: List[bytes], end: int) -> None:
+        element = bytes(self._buffer[self._elem_start : end]).strip(_WHITESPACE)
+        if element:
+            items.append(element)
+
+
+class JsonArrayStreamResponse(Generic[T]):
+    """
+    Handles synchronous streaming of a JSON array response.
+
+    Elements are parsed from the body as bytes arrive and converted into the
+    specified type one at a time.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        load: Callable[[bytes, Type[T]], T],
+    ):
+        """
+        Initialize the stream processor with response and conversion settings.
+
+        Args:
+            response: The HTTP response containing the JSON array
+            stream_context: Context manager for the stream
+            cast_to: Target type for converting each array element
+            load: Converts the raw bytes of one element into `cast_to`
+        """
+        self.response = response
+        self._context = stream_context
+        self.cast_to = cast_to
+        self._load = load
+        self._decoder = JsonArrayDecoder()
+        self._closed = False
+
+    def __iter__(self) -> Iterator[T]:
+        """Yields the converted array elements as they are received."""
+        try:
+            for chunk in self.response.iter_bytes():
+                for item in self._decoder.feed(chunk):
+                    yield self._load(item, self.cast_to)
+            self._decoder.close()
+        finally:
+            self.close()
+
+    def __enter__(self) -> "JsonArrayStreamResponse[T]":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the underlying connection."""
+        if not self._closed:
+            self._closed = True
+            self._context.__exit__(None, None, None)
+
+
+class AsyncJsonArrayStreamResponse(Generic[T]):
+    """
+    Handles asynchronous streaming of a JSON array response.
+
+    Asynchronous version of JsonArrayStreamResponse, providing the same functionality
+    but compatible with async/await syntax.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        load: Callable[[bytes, Type[T]], T],
+    ):
+        """
+        Initialize the async stream processor.
+
+        Args:
+            response: The HTTP response containing the JSON array
+            stream_context: Async context manager for the stream
+            cast_to: Target type for converting each array element
+            load: Converts the raw bytes of one element into `cast_to`
+        """
+        self.response = response
+        self._context = stream_context
+        self.cast_to = cast_to
+        self._load = load
+        self._decoder = JsonArrayDecoder()
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        """Yields the converted array elements as they are received."""
+        try:
+            async for chunk in self.response.aiter_bytes():
+                for item in self._decoder.feed(chunk):
+                    yield self._load(item, self.cast_to)
+            self._decoder.close()
+        finally:
+            await self.aclose()
+
+    async def __aenter__(self) -> "AsyncJsonArrayStreamResponse[T]":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Releases the underlying connection."""
+        if not self._closed:
+            self._closed = True
+            await self._context.__aexit__(None, None, None)
@@ -0,0 +1,280 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import httpx
+
+from .dns import DnsCache
+from .http2 import DEFAULT_MAX_CONCURRENT_STREAMS
+from .pool import async_client_transport, client_transport
+
+"""
+Transports shared between clients.
+
+Clients built with `share_transport=True` draw their transport, and so their
+connection pool, from a process-wide registry keyed by base URL and connection
+settings, so any number of clients (e.g. one per tenant API key) reuse the same
+connections. Each client keeps its own `httpx` client, so credentials, headers
+and cookies stay per client. Transports are reference counted: closing a client
+releases its lease, and the transport is closed with the last one. Clients that
+are garbage collected without being closed release their lease too.
+
+Async transports hold connections bound to the event loop they were opened in,
+so async clients lease one transport per running event loop, when they first
+send a request from it.
+"""
+
+
+def _event_loop() -> Hashable:
+    """The running asyncio event loop, None with other async backends"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class TransportRegistry:
+    """
+    Reference-counted transports shared by the clients leasing them.
+    """
+
+    def __init__(self) -> None:
+        # key -> [transport, leases]
+        self._transports: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._transports.get(key)
+            if entry is None:
+                entry = self._transports[key] = [factory(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def _release(self, key: Hashable) -> Optional[Any]:
+        """Drops a lease, returning the transport to close after the last one"""
+        with self._lock:
+            entry = self._transports[key]
+            entry[1] -= 1
+            if entry[1] > 0:
+                return None
+            del self._transports[key]
+            return entry[0]
+
+    def lease(
+        self, key: Hashable, factory: Callable[[], httpx.BaseTransport]
+    ) -> "SharedTransport":
+        """
+        Leases the transport registered under `key`, creating it with `factory`
+        when there is none.
+        """
+        return SharedTransport(self, key, self._acquire(("sync", key), factory))
+
+    def async_lease(
+        self, key: Hashable, factory: Callable[[], httpx.AsyncBaseTransport]
+    ) -> "AsyncSharedTransport":
+        """
+        Leases the async transports registered under `key`, one per event loop,
+        creating them with `factory` when there is none.
+        """
+        return AsyncSharedTransport(self, key, factory)
+
+    def leases(self, key: Hashable, *, is_async: bool = False) -> int:
+        """
+        Returns the number of open leases of the transport registered under `key`,
+        for async transports the one of the running event loop.
+        """
+        registry_key = ("async", key, _event_loop()) if is_async else ("sync", key)
+        with self._lock:
+            entry = self._transports.get(registry_key)
+            return 0 if entry is None else entry[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._transports)
+
+
+def _release_lease(registry: TransportRegistry, key: Hashable) -> None:
+    transport = registry._release(key)
+    if transport is not None:
+        transport.close()
+
+
+def _release_async_leases(
+    registry: TransportRegistry, leases: Dict[Hashable, Hashable]
+) -> None:
+    # the connections of the last leases are left to be closed by the garbage
+    # collector, as they cannot be awaited outside their event loop
+    for registry_key in list(leases.values()):
+        registry._release(registry_key)
+    leases.clear()
+
+
+class SharedTransport(httpx.BaseTransport):
+    """
+    Lease of a shared transport. Closing it, or garbage collecting it, releases
+    the lease, and closes the transport once no lease is left.
+
+    Attributes:
+        key: Registry key of the transport
+        transport: The shared transport
+    """
+
+    def __init__(
+        self, registry: TransportRegistry, key: Hashable, transport: httpx.BaseTransport
+    ):
+        self.key = key
+        self.transport = transport
+        self._release = weakref.finalize(self, _release_lease, registry, ("sync", key))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self._release()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """
+    Leases of a shared async transport, one per event loop the client sends
+    requests from. Closing it, or garbage collecting it, releases the leases, and
+    closes the transports once no lease is left.
+
+    Attributes:
+        key: Registry key of the transport
+    """
+
+    def __init__(
+        self,
+        registry: TransportRegistry,
+        key: Hashable,
+        factory: Callable[[], httpx.AsyncBaseTransport],
+    ):
+        self._registry = registry
+        self.key = key
+        self._factory = factory
+        # event loop -> registry key of its lease
+        self._leases: Dict[Hashable, Hashable] = {}
+        self._transports: Dict[Hashable, httpx.AsyncBaseTransport] = {}
+        self._lock = threading.Lock()
+        self._release = weakref.finalize(
+            self, _release_async_leases, registry, self._leases
+        )
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """
+        The shared transport of the running event loop, leased on first use.
+        """
+        loop = _event_loop()
+        transport = self._transports.get(loop)
+        if transport is not None:
+            return transport
+        with self._lock:
+            if not self._release.alive:
+                raise RuntimeError("the shared transport has been closed")
+            if loop not in self._transports:
+                registry_key = ("async", self.key, loop)
+                self._transports[loop] = self._registry._acquire(
+                    registry_key, self._factory
+                )
+                self._leases[loop] = registry_key
+            return self._transports[loop]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._release.detach() is None:
+                return
+            leases = dict(self._leases)
+            self._leases.clear()
+            self._transports.clear()
+        loop = _event_loop()
+        for lease_loop, registry_key in leases.items():
+            transport = self._registry._release(registry_key)
+            # transports of other event loops cannot be closed from this one
+            if transport is not None and lease_loop is loop:
+                await transport.aclose()
+
+
+shared_transports = TransportRegistry()
+"""
+Process-wide registry of the transports of clients built with `share_transport=True`
+"""
+
+
+def _transport_key(
+    base_url: str,
+    limits: httpx.Limits,
+    http2: bool,
+    max_concurrent_streams: int,
+    dns_cache: Optional[DnsCache],
+) -> Tuple[Hashable, ...]:
+    return (
+        base_url,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+        max_concurrent_streams,
+        dns_cache,
+    )
+
+
+def shared_transport(
+    base_url: str,
+    *,
+    limits: httpx.Limits,
+    http2: bool = False,
+    max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    dns_cache: Optional[DnsCache] = None,
+    registry: TransportRegistry = shared_transports,
+) -> SharedTransport:
+    """
+    Leases the shared transport of a synchronous client, one per base URL and
+    connection settings.
+    """
+
+    def factory() -> httpx.BaseTransport:
+        transport = client_transport(
+            limits=limits,
+            http2=http2,
+            max_concurrent_streams=max_concurrent_streams,
+            dns_cache=dns_cache,
+        )
+        return httpx.HTTPTransport(limits=limits) if transport is None else transport
+
+    key = _transport_key(base_url, limits, http2, max_concurrent_streams, dns_cache)
+    return registry.lease(key, factory)
+
+
+def async_shared_transport(
+    base_url: str,
+    *,
+    limits: httpx.Limits,
+    http2: bool = False,
+    max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+    dns_cache: Optional[DnsCache] = None,
+    registry: TransportRegistry = shared_transports,
+) -> AsyncSharedTransport:
+    """
+    Leases the shared transport of an asynchronous client, one per base URL and
+    connection settings.
+    """
+
+    def factory() -> httpx.AsyncBaseTransport:
+        transport = async_client_transport(
+            limits=limits,
+            http2=http2,
+            max_concurrent_streams=max_concurrent_streams,
+            dns_cache=dns_cache,
+        )
+        return (
+            httpx.AsyncHTTPTransport(limits=limits) if transport is None else transport
+        )
+
+    key = _transport_key(base_url, limits, http2, max_concurrent_streams, dns_cache)
+    return registry.async_lease(key, factory)
@@ -0,0 +1,316 @@
+import contextlib
+import io
+import mmap
+import os
+import stat
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+)
+
+import anyio
+import anyio.to_thread
+import httpx
+
+"""
+Streaming request bodies for file uploads.
+
+File objects and paths are read in fixed-size chunks while the request is being
+sent, so an upload never holds more than one chunk of the file in memory. The
+transport pulls the next chunk only once the previous one has been written,
+which keeps reads paced to the connection. Sizes that can be known up front are
+sent as `Content-Length`, everything else uses chunked transfer encoding.
+
+Paths and file descriptors of regular files are memory-mapped instead of read:
+chunks are `memoryview` slices of the mapping, so the file is never copied into
+Python `bytes` by the client. In-memory buffers (`bytearray`, `memoryview`) are
+sliced the same way.
+"""
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+"""
+Number of bytes read from a file for each chunk of an upload
+"""
+
+UploadContent = Union[
+    httpx._types.FileTypes, "os.PathLike[str]", int, memoryview, Iterable[bytes]
+]
+"""
+Upload bodies accepted by synchronous clients: bytes, buffers, file objects, paths,
+file descriptors, iterators of bytes, or an httpx file tuple wrapping one of them
+"""
+
+AsyncUploadContent = Union[UploadContent, AsyncIterable[bytes]]
+"""
+Upload bodies accepted by asynchronous clients, additionally async iterators
+"""
+
+
+def _remaining_size(file: IO[bytes]) -> Optional[int]:
+    """Number of bytes left to read from a file object, when it can be known"""
+    try:
+        st = os.fstat(file.fileno())
+        if stat.S_ISREG(st.st_mode):
+            return max(st.st_size - file.tell(), 0)
+        return None
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        end = file.seek(0, io.SEEK_END)
+        file.seek(position)
+        return max(end - position, 0)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _is_fd(source: Any) -> bool:
+    # bools are ints, but True would be sent as stdout
+    return isinstance(source, int) and not isinstance(source, bool)
+
+
+def _is_regular(fd: int) -> bool:
+    return stat.S_ISREG(os.fstat(fd).st_mode)
+
+
+@contextlib.contextmanager
+def _mapped(fd: int, offset: int) -> Iterator[memoryview]:
+    """Read-only view of a regular file from offset, backed by a memory mapping"""
+    if os.fstat(fd).st_size <= offset:
+        # empty files cannot be mapped
+        yield memoryview(b"")
+        return
+    mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)[offset:]
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapping.close()
+        except BufferError:
+            # chunks are still referenced by the caller, the mapping is closed
+            # once they are collected
+            pass
+
+
+def _slices(view: memoryview, chunk_size: int) -> Iterator[bytes]:
+    """
+    Zero-copy chunks of a buffer. They are `memoryview`s, which the transport
+    writes like any other bytes-like object.
+    """
+    for start in range(0, len(view), chunk_size):
+        yield cast(bytes, view[start : start + chunk_size])
+
+
+class Upload:
+    """
+    Request body streamed from a file object, a path, a file descriptor, a buffer
+    or an iterator of bytes.
+
+    File objects are read from their current position and rewound to it when the
+    body is sent again (e.g. on redirects) if they are seekable. Paths are opened
+    and mapped for each send and closed once the body has been read. File
+    descriptors are sent from their current offset, which is left unchanged, and
+    stay open.
+
+    Attributes:
+        source: The file object, path or iterator the body is read from
+        chunk_size: Number of bytes read from files per chunk
+        content_length: Size of the body, or None when it is unknown
+    """
+
+    def __init__(self, source: Any, *, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.content_length: Optional[int] = None
+        self._start: Optional[int] = None
+
+        if isinstance(source, os.PathLike):
+            self.content_length = os.stat(source).st_size
+        elif _is_fd(source):
+            if _is_regular(source):
+                offset = os.lseek(source, 0, os.SEEK_CUR)
+                self.content_length = max(os.fstat(source).st_size - offset, 0)
+        elif isinstance(source, (bytearray, memoryview)):
+            self.content_length = memoryview(source).nbytes
+        elif callable(getattr(source, "read", None)):
+            self.content_length = _remaining_size(source)
+            try:
+                if source.seekable():
+                    self._start = source.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                self._start = None
+
+    def _rewind(self) -> None:
+        if self._start is not None:
+            self.source.seek(self._start)
+
+
+class SyncUpload(Upload):
+    """
+    Upload body for synchronous clients
+    """
+
+    def __iter__(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, os.PathLike):
+            with open(source, "rb") as file:
+                with _mapped(file.fileno(), 0) as view:
+                    yield from _slices(view, self.chunk_size)
+        elif _is_fd(source):
+            if self.content_length is None:
+                # pipes, sockets and devices cannot be mapped
+                yield from _read_fd_chunks(source, self.chunk_size)
+            else:
+                offset = os.lseek(source, 0, os.SEEK_CUR)
+                with _mapped(source, offset) as view:
+                    yield from _slices(view, self.chunk_size)
+        elif isinstance(source, (bytearray, memoryview)):
+            with memoryview(source) as view:
+                yield from _slices(view.cast("B"), self.chunk_size)
+        elif callable(getattr(source, "read", None)):
+            self._rewind()
+            yield from _read_chunks(source, self.chunk_size)
+        else:
+            for chunk in source:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+class AsyncUpload(Upload):
+    """
+    Upload body for asynchronous clients. Files are opened and read, and mapped
+    pages faulted in, in a worker thread so blocking disk reads never stall the
+    event loop.
+    """
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        source = self.source
+        if isinstance(source, os.PathLike):
+            file = await anyio.to_thread.run_sync(open, source, "rb")
+            try:
+                with _mapped(file.fileno(), 0) as view:
+                    async for part in _prefetched_slices(view, self.chunk_size):
+                        yield part
+            finally:
+                await anyio.to_thread.run_sync(file.close)
+        elif _is_fd(source):
+            if self.content_length is None:
+                while True:
+                    data = await anyio.to_thread.run_sync(
+                        os.read, source, self.chunk_size
+                    )
+                    if not data:
+                        break
+                    yield data
+            else:
+                offset = os.lseek(source, 0, os.SEEK_CUR)
+                with _mapped(source, offset) as view:
+                    async for part in _prefetched_slices(view, self.chunk_size):
+                        yield part
+        elif isinstance(source, (bytearray, memoryview)):
+            with memoryview(source) as view:
+                for part in _slices(view.cast("B"), self.chunk_size):
+                    yield part
+        elif callable(getattr(source, "read", None)):
+            await anyio.to_thread.run_sync(self._rewind)
+            async for chunk in _read_chunks_async(source, self.chunk_size):
+                yield chunk
+        elif hasattr(source, "__aiter__"):
+            async for chunk in source:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        else:
+            # sync iterators may block (e.g. reading from a pipe)
+            iterator = iter(source)
+            while True:
+                chunk = await anyio.to_thread.run_sync(_next_chunk, iterator)
+                if chunk is None:
+                    break
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _next_chunk(iterator: Iterator[Any]) -> Any:
+    return next(iterator, None)
+
+
+def _read_fd_chunks(fd: int, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _prefetch(chunk: bytes) -> None:
+    """Faults in the pages of a mapped chunk without copying them"""
+    page = mmap.PAGESIZE
+    for i in range(0, len(chunk), page):
+        chunk[i]
+
+
+async def _prefetched_slices(view: memoryview, chunk_size: int) -> AsyncIterator[bytes]:
+    for chunk in _slices(view, chunk_size):
+        await anyio.to_thread.run_sync(_prefetch, chunk)
+        yield chunk
+
+
+def _read_chunks(file: IO[Any], chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+async def _read_chunks_async(file: IO[Any], chunk_size: int) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await anyio.to_thread.run_sync(file.read, chunk_size)
+        if not chunk:
+            break
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _upload_source(file: Any) -> Any:
+    if isinstance(file, tuple):
+        # httpx file tuples, e.g. (filename, content, content type)
+        return file[1]
+    return file
+
+
+def to_upload(
+    *, file: UploadContent, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Union[bytes, str, SyncUpload]:
+    """
+    Converts an upload body into request content for a synchronous client,
+    streaming file objects, paths, file descriptors, buffers and iterators instead
+    of reading them into memory
+    """
+    source = _upload_source(file)
+    if isinstance(source, (bytes, str)):
+        return source
+    return SyncUpload(source, chunk_size=chunk_size)
+
+
+def to_async_upload(
+    *, file: AsyncUploadContent, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Union[bytes, str, AsyncUpload]:
+    """
+    Converts an upload body into request content for an asynchronous client,
+    streaming file objects, paths, file descriptors, buffers and (async) iterators
+    instead of reading them into memory
+    """
+    source = _upload_source(file)
+    if isinstance(source, (bytes, str)):
+        return source
+    return AsyncUpload(source, chunk_size=chunk_size)
@@ -17,28 +17,73 @@ def remove_none_from_dict(
     return new
 
 
-def get_response_type(headers: httpx.Headers) -> Literal["json", "text", "binary"]:
-    """Check response type based on content type"""
-    content_type = headers.get("content-type")
+ResponseType = Literal["json", "text", "binary"]
+
+_JSON_CONTENT_TYPE = re.compile(r"^application/(.+[+])?json")
+_TEXT_CONTENT_TYPE = re.compile(r"^text/(.+)")
+
+_MAX_CACHED_CONTENT_TYPES = 256
+_response_types: typing.Dict[typing.Optional[str], ResponseType] = {}
 
-    if re.search("^application/(.+[+])?json", content_type):
+
+def _classify_content_type(content_type: typing.Optional[str]) -> ResponseType:
+    if not content_type:
+        # a missing or empty content type carries no hint, keep the raw bytes
+        return "binary"
+    content_type = content_type.strip().lower()
+    if _JSON_CONTENT_TYPE.search(content_type):
         return "json"
-    elif re.search("^text/(.+)", content_type):
+    elif _TEXT_CONTENT_TYPE.search(content_type):
         return "text"
     else:
         return "binary"
 
 
+def get_response_type(headers: httpx.Headers) -> ResponseType:
+    """
+    Check response type based on content type
+
+    Classifications are memoized per raw header value, so repeated responses
+    resolve with a single dictionary lookup. The cache is bounded as header
+    values may embed parameters (e.g. multipart boundaries).
+    """
+    content_type = headers.get("content-type")
+    response_type = _response_types.get(content_type)
+    if response_type is None:
+        response_type = _classify_content_type(content_type)
+        if len(_response_types) < _MAX_CACHED_CONTENT_TYPES:
+            _response_types[content_type] = response_type
+    return response_type
+
+
 def is_union_type(type_hint: typing.Any) -> bool:
     """Check if a type hint is a Union type."""
     return hasattr(type_hint, "__origin__") and type_hint.__origin__ is typing.Union
 
 
+_filtered_cast_to: typing.Dict[typing.Any, typing.Type] = {}
+
+
 def filter_binary_response(cast_to: typing.Type) -> typing.Type:
     """
     Filters out BinaryResponse from a Union type.
     If cast_to is not a Union, returns it unchanged.
+
+    Results are memoized per cast_to, so the same Union object is returned on
+    every call.
     """
+    try:
+        filtered = _filtered_cast_to.get(cast_to)
+    except TypeError:
+        # unhashable type hint, resolve it every time
+        return _filter_binary_response(cast_to)
+    if filtered is None:
+        filtered = _filter_binary_response(cast_to)
+        _filtered_cast_to[cast_to] = filtered
+    return filtered
+
+
+def _filter_binary_response(cast_to: typing.Type) -> typing.Type:
     if not is_union_type(cast_to):
         return cast_to
 
@@ -53,3 +98,20 @@ def filter_binary_response(cast_to: typing.Type) -> typing.Type:
         return typing.cast(typing.Type, filtered[0])
     # Otherwise return new Union with filtered types
     return typing.cast(typing.Type, typing.Union[filtered])  # type: ignore
+
+
+_raw_response_types: typing.Dict[typing.Any, bool] = {}
+
+
+def is_raw_response_type(cast_to: typing.Any) -> bool:
+    """
+    Check whether cast_to asks for the raw httpx.Response, memoized per cast_to.
+    """
+    try:
+        is_raw = _raw_response_types.get(cast_to)
+    except TypeError:
+        return isinstance(cast_to, type) and issubclass(cast_to, httpx.Response)
+    if is_raw is None:
+        is_raw = isinstance(cast_to, type) and issubclass(cast_to, httpx.Response)
+        _raw_response_types[cast_to] = is_raw
+    return is_raw
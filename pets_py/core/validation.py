@@ -0,0 +1,234 @@
+import itertools
+import threading
+import typing
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+import pydantic
+from pydantic import BaseModel
+from typing_extensions import Literal, TypedDict
+
+from .adapters import validator_registry
+from .codecs import JsonCodec, stdlib_json_codec
+
+"""
+Response validation modes.
+
+Decoded response data can be fully validated through pydantic (`lax` and `strict`),
+turned into models without any validation (`trusted`), or validated for only a
+sample of responses (`sampled`) to detect drift while paying the trusted cost
+for the rest.
+"""
+
+ValidationMode = Literal["strict", "lax", "trusted", "sampled"]
+DriftHandler = Callable[[pydantic.ValidationError, Any], None]
+
+
+class ValidationDriftWarning(UserWarning):
+    """
+    Emitted when a sampled response no longer matches its declared schema.
+    """
+
+
+class ValidationStats(TypedDict):
+    """
+    Snapshot of a ResponseValidator's sampling counters.
+
+    Attributes:
+        sampled: Responses that were fully validated in `sampled` mode
+        skipped: Responses that were constructed without validation in `sampled` mode
+        drift: Sampled responses that failed validation
+    """
+
+    sampled: int
+    skipped: int
+    drift: int
+
+
+class ResponseValidator:
+    """
+    Converts decoded response data into its target type according to a validation mode.
+
+    Attributes:
+        mode: Default validation mode used when a request does not override it
+        sample_rate: In `sampled` mode, one out of every `sample_rate` responses is
+            fully validated
+        on_drift: Optional callback invoked with the validation error and target type
+            when a sampled response fails validation
+        codec: JSON codec decoding the documents that are not validated straight
+            from bytes by pydantic (`trusted` and `sampled` modes)
+    """
+
+    mode: ValidationMode
+    sample_rate: int
+    on_drift: Optional[DriftHandler]
+    codec: JsonCodec
+
+    def __init__(
+        self,
+        *,
+        mode: ValidationMode = "lax",
+        sample_rate: int = 100,
+        on_drift: Optional[DriftHandler] = None,
+        codec: Optional[JsonCodec] = None,
+    ):
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be a positive integer")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.on_drift = on_drift
+        self.codec = codec or stdlib_json_codec
+        self._counter = itertools.count()
+        self._sampled = 0
+        self._skipped = 0
+        self._drift = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks cannot be copied or pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def load_json(
+        self,
+        *,
+        data: Union[bytes, str],
+        load_with: Any,
+        mode: Optional[ValidationMode] = None,
+    ) -> Any:
+        """
+        Decodes a raw JSON document into `load_with` according to the validation mode.
+        """
+        mode = mode or self.mode
+        if mode == "lax":
+            return validator_registry.get(load_with).validate_json(data)
+        elif mode == "strict":
+            return validator_registry.get(load_with).validate_json(data, strict=True)
+        elif mode == "trusted":
+            return construct(load_with, self.codec.loads(data))
+        return self._load_sampled(self.codec.loads(data), load_with)
+
+    def load_python(
+        self,
+        *,
+        data: Any,
+        load_with: Any,
+        mode: Optional[ValidationMode] = None,
+    ) -> Any:
+        """
+        Converts already decoded data into `load_with` according to the validation mode.
+        """
+        mode = mode or self.mode
+        if mode == "lax":
+            return validator_registry.get(load_with).validate_python(data)
+        elif mode == "strict":
+            return validator_registry.get(load_with).validate_python(data, strict=True)
+        elif mode == "trusted":
+            return construct(load_with, data)
+        return self._load_sampled(data, load_with)
+
+    def stats(self) -> ValidationStats:
+        """
+        Returns the sampling counters collected so far.
+        """
+        with self._lock:
+            return {
+                "sampled": self._sampled,
+                "skipped": self._skipped,
+                "drift": self._drift,
+            }
+
+    def _load_sampled(self, data: Any, load_with: Any) -> Any:
+        with self._lock:
+            sampled = next(self._counter) % self.sample_rate == 0
+            if sampled:
+                self._sampled += 1
+            else:
+                self._skipped += 1
+        if not sampled:
+            return construct(load_with, data)
+
+        try:
+            return validator_registry.get(load_with).validate_python(data)
+        except pydantic.ValidationError as e:
+            with self._lock:
+                self._drift += 1
+            if self.on_drift is not None:
+                self.on_drift(e, load_with)
+            else:
+                warnings.warn(
+                    f"response no longer matches {load_with!r}: {e}",
+                    ValidationDriftWarning,
+                    stacklevel=2,
+                )
+            return construct(load_with, data)
+
+
+_FieldPlan = List[Tuple[str, Optional[str], Any]]
+_field_plans: Dict[Type[BaseModel], _FieldPlan] = {}
+_field_plans_lock = threading.Lock()
+
+
+def _get_field_plan(model: Type[BaseModel]) -> _FieldPlan:
+    plan = _field_plans.get(model)
+    if plan is None:
+        with _field_plans_lock:
+            plan = [
+                (name, field.alias, field.annotation)
+                for name, field in model.model_fields.items()
+            ]
+            _field_plans[model] = plan
+    return plan
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+def construct(load_with: Any, data: Any) -> Any:
+    """
+    Builds `load_with` from decoded JSON data without running any validation.
+
+    Nested models (e.g. the `Category` and `Tag` of a `Pet`) are constructed
+    recursively with `model_construct`; scalars are passed through untouched.
+    The data is assumed to already conform to the schema.
+    """
+    if data is None:
+        return None
+    if _is_model(load_with):
+        if not isinstance(data, dict):
+            return data
+        values: Dict[str, Any] = {}
+        for name, alias, annotation in _get_field_plan(load_with):
+            if alias is not None and alias in data:
+                values[name] = construct(annotation, data[alias])
+            elif name in data:
+                values[name] = construct(annotation, data[name])
+        return load_with.model_construct(**values)
+
+    origin = typing.get_origin(load_with)
+    if origin is None:
+        return data
+    args = typing.get_args(load_with)
+    if origin is list and isinstance(data, list):
+        item_type = args[0] if args else Any
+        return [construct(item_type, item) for item in data]
+    if origin is dict and isinstance(data, dict):
+        value_type = args[1] if len(args) == 2 else Any
+        return {k: construct(value_type, v) for k, v in data.items()}
+    if origin is Union:
+        # pick the first member that structurally matches the data
+        for arg in args:
+            if _is_model(arg) and isinstance(data, dict):
+                return construct(arg, data)
+            arg_origin = typing.get_origin(arg)
+            if arg_origin is list and isinstance(data, list):
+                return construct(arg, data)
+            if arg_origin is dict and isinstance(data, dict):
+                return construct(arg, data)
+    return data
@@ -0,0 +1,169 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import anyio
+import httpx
+from typing_extensions import TypedDict
+
+"""
+Connection pre-warming.
+
+A warmup sends `connections` concurrent `HEAD` requests to each base URL of a
+client, so that the pool opens (resolves, connects and TLS-handshakes) that
+many connections before traffic arrives, and keeps them alive for the requests
+that follow. The setup time of every new connection is taken from httpcore's
+`trace` extension events.
+"""
+
+
+class ConnectionSetup(TypedDict):
+    """
+    Setup time of a connection opened by a warmup.
+
+    Attributes:
+        service_name: Service of the base URL, None for the client's default base URL
+        base_url: Base URL the connection was opened to
+        connect: Seconds spent resolving the host and opening the TCP connection
+        tls: Seconds spent on the TLS handshake, None for plain HTTP
+        total: Seconds until the connection was ready to send the request
+    """
+
+    service_name: Optional[str]
+    base_url: str
+    connect: float
+    tls: Optional[float]
+    total: float
+
+
+_TRACED_STEPS = ("connection.connect_tcp", "connection.start_tls")
+
+
+class _SetupTrace:
+    """Times the connection setup steps of one request from its trace events"""
+
+    def __init__(self) -> None:
+        self._started: Dict[str, float] = {}
+        self.durations: Dict[str, float] = {}
+
+    def __call__(self, event: str, info: Mapping[str, Any]) -> None:
+        step, _, phase = event.rpartition(".")
+        if step not in _TRACED_STEPS:
+            return
+        if phase == "started":
+            self._started[step] = time.perf_counter()
+        elif phase == "complete":
+            self.durations[step] = time.perf_counter() - self._started.pop(step)
+
+    async def trace_async(self, event: str, info: Mapping[str, Any]) -> None:
+        self(event, info)
+
+    def setup(
+        self, service_name: Optional[str], base_url: str
+    ) -> Optional[ConnectionSetup]:
+        connect = self.durations.get("connection.connect_tcp")
+        if connect is None:
+            # the request was sent on an already open connection
+            return None
+        tls = self.durations.get("connection.start_tls")
+        return {
+            "service_name": service_name,
+            "base_url": base_url,
+            "connect": connect,
+            "tls": tls,
+            "total": connect + (tls or 0.0),
+        }
+
+
+def _targets(
+    base_urls: Mapping[Optional[str], str], connections: int
+) -> List[Tuple[Optional[str], str]]:
+    if connections < 1:
+        raise ValueError("connections must be at least 1")
+    return [item for item in base_urls.items() for _ in range(connections)]
+
+
+def warmup_connections(
+    httpx_client: httpx.Client, base_urls: Mapping[Optional[str], str], connections: int
+) -> List[ConnectionSetup]:
+    """
+    Opens up to `connections` pooled connections to each base URL, sending the
+    requests from one thread per connection.
+
+    Returns:
+        The setup times of the connections that were opened
+
+    Raises:
+        httpx.PoolTimeout: If the pool allows fewer connections than requested
+        httpx.HTTPError: If a connection cannot be opened
+    """
+
+    targets = _targets(base_urls, connections)
+    # every request keeps its connection checked out until all of them are sent,
+    # so the pool cannot hand a connection returned early to a later request
+    barrier = threading.Barrier(len(targets))
+
+    def warm(target: Tuple[Optional[str], str]) -> Optional[ConnectionSetup]:
+        trace = _SetupTrace()
+        try:
+            with httpx_client.stream(
+                "HEAD", target[1], extensions={"trace": trace}
+            ) as response:
+                # the connection is only pooled again if the (empty) body is read
+                # before the response is closed
+                assert isinstance(response.stream, httpx.SyncByteStream)
+                for _ in response.stream:
+                    pass
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    # another request failed, and raises from its own thread
+                    pass
+        except BaseException:
+            barrier.abort()
+            raise
+        return trace.setup(*target)
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        setups = list(executor.map(warm, targets))
+    return [setup for setup in setups if setup is not None]
+
+
+async def async_warmup_connections(
+    httpx_client: httpx.AsyncClient,
+    base_urls: Mapping[Optional[str], str],
+    connections: int,
+) -> List[ConnectionSetup]:
+    """
+    Opens up to `connections` pooled connections to each base URL, sending the
+    requests concurrently.
+
+    Returns:
+        The setup times of the connections that were opened
+
+    Raises:
+        httpx.HTTPError: If a connection cannot be opened
+    """
+    targets = _targets(base_urls, connections)
+    setups: List[Optional[ConnectionSetup]] = [None] * len(targets)
+    errors: List[BaseException] = []
+
+    async def warm(index: int) -> None:
+        trace = _SetupTrace()
+        try:
+            await httpx_client.head(
+                targets[index][1], extensions={"trace": trace.trace_async}
+            )
+        except Exception as e:
+            # raised once every request is done, rather than as an exception group
+            errors.append(e)
+            return
+        setups[index] = trace.setup(*targets[index])
+
+    async with anyio.create_task_group() as tg:
+        for index in range(len(targets)):
+            tg.start_soon(warm, index)
+    if errors:
+        raise errors[0]
+    return [setup for setup in setups if setup is not None]
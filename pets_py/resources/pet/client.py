@@ -5,10 +5,11 @@ import typing_extensions
 from pets_py.core import (
     AsyncBaseClient,
     BinaryResponse,
+    PathTemplate,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
+    to_json_bytes,
     type_utils,
 )
 from pets_py.resources.pet.find_by_status import (
@@ -18,6 +19,8 @@ from pets_py.resources.pet.find_by_status import (
 from pets_py.resources.pet.upload_image import AsyncUploadImageClient, UploadImageClient
 from pets_py.types import models, params
 
+_pet_path = PathTemplate("/pet/{petId}")
+
 
 class PetClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -53,7 +56,8 @@ class PetClient:
         """
         return self._base_client.request(
             method="DELETE",
-            path=f"/pet/{pet_id}",
+            path=_pet_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -87,7 +91,8 @@ class PetClient:
         """
         return self._base_client.request(
             method="GET",
-            path=f"/pet/{pet_id}",
+            path=_pet_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
@@ -141,7 +146,7 @@ class PetClient:
         client.pet.create(name="doggie", photo_urls=["string"], id=10)
         ```
         """
-        _json = to_encodable(
+        _content = to_json_bytes(
             item={
                 "category": category,
                 "id": id,
@@ -151,12 +156,14 @@ class PetClient:
                 "photo_urls": photo_urls,
             },
             dump_with=params._SerializerPet,
+            codec=self._base_client.json_codec,
         )
         return self._base_client.request(
             method="POST",
             path="/pet",
             auth_names=["api_key"],
-            json=_json,
+            content=_content,
+            content_type="application/json",
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
@@ -209,7 +216,7 @@ class PetClient:
         client.pet.update(name="doggie", photo_urls=["string"], id=10)
         ```
         """
-        _json = to_encodable(
+        _content = to_json_bytes(
             item={
                 "category": category,
                 "id": id,
@@ -219,12 +226,14 @@ class PetClient:
                 "photo_urls": photo_urls,
             },
             dump_with=params._SerializerPet,
+            codec=self._base_client.json_codec,
         )
         return self._base_client.request(
             method="PUT",
             path="/pet",
             auth_names=["api_key"],
-            json=_json,
+            content=_content,
+            content_type="application/json",
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
@@ -264,7 +273,8 @@ class AsyncPetClient:
         """
         return await self._base_client.request(
             method="DELETE",
-            path=f"/pet/{pet_id}",
+            path=_pet_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -298,7 +308,8 @@ class AsyncPetClient:
         """
         return await self._base_client.request(
             method="GET",
-            path=f"/pet/{pet_id}",
+            path=_pet_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
@@ -352,7 +363,7 @@ class AsyncPetClient:
         await client.pet.create(name="doggie", photo_urls=["string"], id=10)
         ```
         """
-        _json = to_encodable(
+        _content = to_json_bytes(
             item={
                 "category": category,
                 "id": id,
@@ -362,12 +373,14 @@ class AsyncPetClient:
                 "photo_urls": photo_urls,
             },
             dump_with=params._SerializerPet,
+            codec=self._base_client.json_codec,
         )
         return await self._base_client.request(
             method="POST",
             path="/pet",
             auth_names=["api_key"],
-            json=_json,
+            content=_content,
+            content_type="application/json",
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
@@ -420,7 +433,7 @@ class AsyncPetClient:
         await client.pet.update(name="doggie", photo_urls=["string"], id=10)
         ```
         """
-        _json = to_encodable(
+        _content = to_json_bytes(
             item={
                 "category": category,
                 "id": id,
@@ -430,12 +443,14 @@ class AsyncPetClient:
                 "photo_urls": photo_urls,
             },
             dump_with=params._SerializerPet,
+            codec=self._base_client.json_codec,
         )
         return await self._base_client.request(
             method="PUT",
             path="/pet",
             auth_names=["api_key"],
-            json=_json,
+            content=_content,
+            content_type="application/json",
             cast_to=typing.Union[models.Pet, BinaryResponse],
             request_options=request_options or default_request_options(),
         )
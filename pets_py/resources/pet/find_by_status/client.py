@@ -3,17 +3,21 @@ import typing_extensions
 
 from pets_py.core import (
     AsyncBaseClient,
+    AsyncJsonArrayStreamResponse,
     BinaryResponse,
+    JsonArrayStreamResponse,
+    QueryParamEncoder,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    encode_query_param,
     to_encodable,
     type_utils,
 )
 from pets_py.types import models
 
+_status_param = QueryParamEncoder("status", style="form", explode=True)
+
 
 class FindByStatusClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -53,15 +57,12 @@ class FindByStatusClient:
         """
         _query: QueryParams = {}
         if not isinstance(status, type_utils.NotGiven):
-            encode_query_param(
+            _status_param.encode(
                 _query,
-                "status",
                 to_encodable(
                     item=status,
                     dump_with=typing_extensions.Literal["available", "pending", "sold"],
                 ),
-                style="form",
-                explode=True,
             )
         return self._base_client.request(
             method="GET",
@@ -72,6 +73,63 @@ class FindByStatusClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        status: typing.Union[
+            typing.Optional[typing_extensions.Literal["available", "pending", "sold"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> JsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by status, yielding each pet as soon as it is received.
+
+        Streaming variant of `list`: the JSON array is parsed incrementally as the
+        body arrives, so memory use stays bounded by a single pet.
+
+        GET /pet/findByStatus
+
+        Args:
+            status: Status values that need to be considered for filter
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation, one validated pet at a time
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for pet in client.pet.find_by_status.iter_list():
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(status, type_utils.NotGiven):
+            _status_param.encode(
+                _query,
+                to_encodable(
+                    item=status,
+                    dump_with=typing_extensions.Literal["available", "pending", "sold"],
+                ),
+            )
+        return typing.cast(
+            JsonArrayStreamResponse[models.Pet],
+            self._base_client.stream_request(
+                method="GET",
+                path="/pet/findByStatus",
+                auth_names=["api_key"],
+                query_params=_query,
+                headers={"accept": "application/json"},
+                cast_to=models.Pet,
+                stream_format="json_array",
+                request_options=request_options or default_request_options(),
+            ),
+        )
+
 
 class AsyncFindByStatusClient:
     def __init__(self, *, base_client: AsyncBaseClient):
@@ -111,15 +169,12 @@ class AsyncFindByStatusClient:
         """
         _query: QueryParams = {}
         if not isinstance(status, type_utils.NotGiven):
-            encode_query_param(
+            _status_param.encode(
                 _query,
-                "status",
                 to_encodable(
                     item=status,
                     dump_with=typing_extensions.Literal["available", "pending", "sold"],
                 ),
-                style="form",
-                explode=True,
             )
         return await self._base_client.request(
             method="GET",
@@ -129,3 +184,60 @@ class AsyncFindByStatusClient:
             cast_to=typing.Union[typing.List[models.Pet], BinaryResponse],
             request_options=request_options or default_request_options(),
         )
+
+    async def aiter_list(
+        self,
+        *,
+        status: typing.Union[
+            typing.Optional[typing_extensions.Literal["available", "pending", "sold"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncJsonArrayStreamResponse[models.Pet]:
+        """
+        Finds Pets by status, yielding each pet as soon as it is received.
+
+        Streaming variant of `list`: the JSON array is parsed incrementally as the
+        body arrives, so memory use stays bounded by a single pet.
+
+        GET /pet/findByStatus
+
+        Args:
+            status: Status values that need to be considered for filter
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            successful operation, one validated pet at a time
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for pet in await client.pet.find_by_status.aiter_list():
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(status, type_utils.NotGiven):
+            _status_param.encode(
+                _query,
+                to_encodable(
+                    item=status,
+                    dump_with=typing_extensions.Literal["available", "pending", "sold"],
+                ),
+            )
+        return typing.cast(
+            AsyncJsonArrayStreamResponse[models.Pet],
+            await self._base_client.stream_request(
+                method="GET",
+                path="/pet/findByStatus",
+                auth_names=["api_key"],
+                query_params=_query,
+                headers={"accept": "application/json"},
+                cast_to=models.Pet,
+                stream_format="json_array",
+                request_options=request_options or default_request_options(),
+            ),
+        )
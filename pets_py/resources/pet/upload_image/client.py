@@ -3,17 +3,27 @@ import typing
 
 from pets_py.core import (
     AsyncBaseClient,
+    AsyncUploadContent,
+    PathTemplate,
+    QueryParamEncoder,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    UploadContent,
     default_request_options,
-    encode_query_param,
-    to_content,
+    to_async_upload,
     to_encodable,
+    to_upload,
     type_utils,
 )
 from pets_py.types import models
 
+_upload_image_path = PathTemplate("/pet/{petId}/uploadImage")
+
+_additional_metadata_param = QueryParamEncoder(
+    "additionalMetadata", style="form", explode=True
+)
+
 
 class UploadImageClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -22,7 +32,7 @@ class UploadImageClient:
     def create(
         self,
         *,
-        data: httpx._types.FileTypes,
+        data: UploadContent,
         pet_id: int,
         additional_metadata: typing.Union[
             typing.Optional[str], type_utils.NotGiven
@@ -38,7 +48,7 @@ class UploadImageClient:
 
         Args:
             additionalMetadata: Additional Metadata
-            data: httpx._types.FileTypes
+            data: Bytes, file object, path or iterator of bytes, streamed in chunks
             petId: ID of pet to update
             request_options: Additional options to customize the HTTP request
 
@@ -56,18 +66,16 @@ class UploadImageClient:
         """
         _query: QueryParams = {}
         if not isinstance(additional_metadata, type_utils.NotGiven):
-            encode_query_param(
+            _additional_metadata_param.encode(
                 _query,
-                "additionalMetadata",
                 to_encodable(item=additional_metadata, dump_with=str),
-                style="form",
-                explode=True,
             )
-        _content = to_content(file=data)
+        _content = to_upload(file=data)
         _content_type = "application/octet-stream"
         return self._base_client.request(
             method="POST",
-            path=f"/pet/{pet_id}/uploadImage",
+            path=_upload_image_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             query_params=_query,
             content=_content,
@@ -84,7 +92,7 @@ class AsyncUploadImageClient:
     async def create(
         self,
         *,
-        data: httpx._types.FileTypes,
+        data: AsyncUploadContent,
         pet_id: int,
         additional_metadata: typing.Union[
             typing.Optional[str], type_utils.NotGiven
@@ -100,7 +108,7 @@ class AsyncUploadImageClient:
 
         Args:
             additionalMetadata: Additional Metadata
-            data: httpx._types.FileTypes
+            data: Bytes, file object, path or (async) iterator of bytes, streamed in chunks
             petId: ID of pet to update
             request_options: Additional options to customize the HTTP request
 
@@ -120,18 +128,16 @@ class AsyncUploadImageClient:
         """
         _query: QueryParams = {}
         if not isinstance(additional_metadata, type_utils.NotGiven):
-            encode_query_param(
+            _additional_metadata_param.encode(
                 _query,
-                "additionalMetadata",
                 to_encodable(item=additional_metadata, dump_with=str),
-                style="form",
-                explode=True,
             )
-        _content = to_content(file=data)
+        _content = to_async_upload(file=data)
         _content_type = "application/octet-stream"
         return await self._base_client.request(
             method="POST",
-            path=f"/pet/{pet_id}/uploadImage",
+            path=_upload_image_path,
+            path_params={"petId": pet_id},
             auth_names=["api_key"],
             query_params=_query,
             content=_content,
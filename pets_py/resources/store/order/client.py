@@ -5,14 +5,37 @@ import typing_extensions
 from pets_py.core import (
     AsyncBaseClient,
     BinaryResponse,
+    FormEncoder,
+    PathTemplate,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_form_urlencoded,
     type_utils,
 )
 from pets_py.types import models, params
 
+_order_path = PathTemplate("/store/order/{orderId}")
+
+_create_form = FormEncoder(
+    dump_with=params._SerializerOrder,
+    style={
+        "complete": "form",
+        "id": "form",
+        "petId": "form",
+        "quantity": "form",
+        "shipDate": "form",
+        "status": "form",
+    },
+    explode={
+        "complete": True,
+        "id": True,
+        "petId": True,
+        "quantity": True,
+        "shipDate": True,
+        "status": True,
+    },
+)
+
 
 class OrderClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -46,7 +69,8 @@ class OrderClient:
         """
         return self._base_client.request(
             method="DELETE",
-            path=f"/store/order/{order_id}",
+            path=_order_path,
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -80,7 +104,8 @@ class OrderClient:
         """
         return self._base_client.request(
             method="GET",
-            path=f"/store/order/{order_id}",
+            path=_order_path,
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Order, BinaryResponse],
             request_options=request_options or default_request_options(),
@@ -140,8 +165,8 @@ class OrderClient:
         client.store.order.create(id=10, pet_id=198772, quantity=7, status="approved")
         ```
         """
-        _data = to_form_urlencoded(
-            item={
+        _content = _create_form.encode(
+            {
                 "complete": complete,
                 "id": id,
                 "pet_id": pet_id,
@@ -149,29 +174,13 @@ class OrderClient:
                 "ship_date": ship_date,
                 "status": status,
             },
-            dump_with=params._SerializerOrder,
-            style={
-                "complete": "form",
-                "id": "form",
-                "petId": "form",
-                "quantity": "form",
-                "shipDate": "form",
-                "status": "form",
-            },
-            explode={
-                "complete": True,
-                "id": True,
-                "petId": True,
-                "quantity": True,
-                "shipDate": True,
-                "status": True,
-            },
         )
         return self._base_client.request(
             method="POST",
             path="/store/order",
             auth_names=["api_key"],
-            data=_data,
+            content=_content,
+            content_type="application/x-www-form-urlencoded",
             cast_to=models.Order,
             request_options=request_options or default_request_options(),
         )
@@ -209,7 +218,8 @@ class AsyncOrderClient:
         """
         return await self._base_client.request(
             method="DELETE",
-            path=f"/store/order/{order_id}",
+            path=_order_path,
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=httpx.Response,
             request_options=request_options or default_request_options(),
@@ -243,7 +253,8 @@ class AsyncOrderClient:
         """
         return await self._base_client.request(
             method="GET",
-            path=f"/store/order/{order_id}",
+            path=_order_path,
+            path_params={"orderId": order_id},
             auth_names=["api_key"],
             cast_to=typing.Union[models.Order, BinaryResponse],
             request_options=request_options or default_request_options(),
@@ -305,8 +316,8 @@ class AsyncOrderClient:
         )
         ```
         """
-        _data = to_form_urlencoded(
-            item={
+        _content = _create_form.encode(
+            {
                 "complete": complete,
                 "id": id,
                 "pet_id": pet_id,
@@ -314,29 +325,13 @@ class AsyncOrderClient:
                 "ship_date": ship_date,
                 "status": status,
             },
-            dump_with=params._SerializerOrder,
-            style={
-                "complete": "form",
-                "id": "form",
-                "petId": "form",
-                "quantity": "form",
-                "shipDate": "form",
-                "status": "form",
-            },
-            explode={
-                "complete": True,
-                "id": True,
-                "petId": True,
-                "quantity": True,
-                "shipDate": True,
-                "status": True,
-            },
         )
         return await self._base_client.request(
             method="POST",
             path="/store/order",
             auth_names=["api_key"],
-            data=_data,
+            content=_content,
+            content_type="application/x-www-form-urlencoded",
             cast_to=models.Order,
             request_options=request_options or default_request_options(),
         )
@@ -0,0 +1,4 @@
+from .pet import PetFrame
+
+
+__all__ = ["PetFrame"]
@@ -0,0 +1,104 @@
+import typing
+import typing_extensions
+
+from pets_py.core.columns import (
+    CategoricalColumn,
+    Column,
+    Frame,
+    Int64Column,
+    Mask,
+    RaggedColumn,
+    StringColumn,
+    StructColumn,
+    mask_and,
+)
+from pets_py.types import models
+
+
+class PetFrame(Frame[models.Pet]):
+    """
+    Columnar collection of Pet
+
+    Columns:
+        category: Category structs (int64 ids, offset-packed names)
+        id: int64
+        name: offset-packed strings
+        photo_urls: ragged lists of offset-packed strings
+        status: int8 category codes
+        tags: ragged lists of Tag structs
+    """
+
+    model = models.Pet
+    STATUSES = ("available", "pending", "sold")
+
+    @classmethod
+    def new_columns(cls) -> typing.Dict[str, Column]:
+        return {
+            "category": StructColumn(
+                models.Category, {"id": Int64Column(), "name": StringColumn()}
+            ),
+            "id": Int64Column(),
+            "name": StringColumn(),
+            "photo_urls": RaggedColumn(StringColumn()),
+            "status": CategoricalColumn(cls.STATUSES),
+            "tags": RaggedColumn(
+                StructColumn(models.Tag, {"id": Int64Column(), "name": StringColumn()})
+            ),
+        }
+
+    @property
+    def ids(self) -> Int64Column:
+        return typing.cast(Int64Column, self.columns["id"])
+
+    @property
+    def names(self) -> StringColumn:
+        return typing.cast(StringColumn, self.columns["name"])
+
+    @property
+    def statuses(self) -> CategoricalColumn:
+        return typing.cast(CategoricalColumn, self.columns["status"])
+
+    @property
+    def tags(self) -> RaggedColumn:
+        return typing.cast(RaggedColumn, self.columns["tags"])
+
+    def where(
+        self,
+        *,
+        status: typing.Optional[
+            typing.Iterable[
+                typing.Optional[
+                    typing_extensions.Literal["available", "pending", "sold"]
+                ]
+            ]
+        ] = None,
+        ids: typing.Optional[typing.Iterable[int]] = None,
+        tag_names: typing.Optional[typing.Iterable[str]] = None,
+    ) -> "PetFrame":
+        """
+        Returns the pets matching every given filter.
+
+        Args:
+            status: Keep pets whose status is one of these values
+            ids: Keep pets whose id is one of these values
+            tag_names: Keep pets with at least one tag named one of these values
+        """
+        masks: typing.List[Mask] = []
+        if status is not None:
+            masks.append(self.statuses.isin(status))
+        if ids is not None:
+            masks.append(self.ids.isin(ids))
+        if tag_names is not None:
+            tag_struct = typing.cast(StructColumn, self.tags.child)
+            tag_mask = typing.cast(StringColumn, tag_struct.fields["name"]).isin(
+                tag_names
+            )
+            offsets = self.tags.offsets
+            masks.append(
+                bytes(
+                    any(tag_mask[offsets[i] : offsets[i + 1]]) for i in range(len(self))
+                )
+            )
+        if not masks:
+            return self
+        return self.filter(mask_and(*masks))
@@ -0,0 +1,7 @@
+from .api_response import ApiResponse
+from .category import Category
+from .order import Order
+from .pet import Pet
+from .tag import Tag
+
+__all__ = ["ApiResponse", "Category", "Order", "Pet", "Tag"]
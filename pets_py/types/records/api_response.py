@@ -0,0 +1,17 @@
+import typing
+
+from pets_py.core.records import Record
+from pets_py.types import models
+
+
+class ApiResponse(Record[models.ApiResponse]):
+    """
+    ApiResponse
+    """
+
+    __slots__ = ("code", "message", "type_")
+    model = models.ApiResponse
+
+    code: typing.Optional[int]
+    message: typing.Optional[str]
+    type_: typing.Optional[str]
@@ -0,0 +1,16 @@
+import typing
+
+from pets_py.core.records import Record
+from pets_py.types import models
+
+
+class Category(Record[models.Category]):
+    """
+    Category
+    """
+
+    __slots__ = ("id", "name")
+    model = models.Category
+
+    id: typing.Optional[int]
+    name: typing.Optional[str]
@@ -0,0 +1,26 @@
+import typing
+import typing_extensions
+
+from pets_py.core.records import Record
+from pets_py.types import models
+
+
+class Order(Record[models.Order]):
+    """
+    Order
+    """
+
+    __slots__ = ("complete", "id", "pet_id", "quantity", "ship_date", "status")
+    model = models.Order
+
+    complete: typing.Optional[bool]
+    id: typing.Optional[int]
+    pet_id: typing.Optional[int]
+    quantity: typing.Optional[int]
+    ship_date: typing.Optional[str]
+    status: typing.Optional[
+        typing_extensions.Literal["approved", "delivered", "placed"]
+    ]
+    """
+    Order Status
+    """
@@ -0,0 +1,27 @@
+import typing
+import typing_extensions
+
+from pets_py.core.records import Record
+from pets_py.types import models
+
+from .category import Category
+from .tag import Tag
+
+
+class Pet(Record[models.Pet]):
+    """
+    Pet
+    """
+
+    __slots__ = ("category", "id", "name", "photo_urls", "status", "tags")
+    model = models.Pet
+
+    category: typing.Optional[Category]
+    id: typing.Optional[int]
+    name: str
+    photo_urls: typing.Tuple[str, ...]
+    status: typing.Optional[typing_extensions.Literal["available", "pending", "sold"]]
+    """
+    pet status in the store
+    """
+    tags: typing.Optional[typing.Tuple[Tag, ...]]
@@ -0,0 +1,73 @@
+import concurrent.futures
+import typing
+
+from pets_py.core import (
+    BinaryResponse,
+    TypeAdapterRegistry,
+    from_encodable,
+    serializer_registry,
+    to_encodable,
+)
+from pets_py.core.utils import filter_binary_response
+from pets_py.types import models, params
+
+PET_DATA = {"id": 10, "name": "doggie", "photoUrls": ["string"], "status": "available"}
+
+
+def test_registry_reuses_adapter_per_type():
+    """Tests that a TypeAdapter is built once per type and then served from cache."""
+    registry = TypeAdapterRegistry()
+    first = registry.get(typing.List[models.Pet])
+    second = registry.get(typing.List[models.Pet])
+    assert first is second
+    assert registry.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    registry.clear()
+    assert registry.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_registry_keys_filtered_unions():
+    """Tests that unions rebuilt by filter_binary_response resolve to one adapter."""
+    registry = TypeAdapterRegistry()
+    load_with = filter_binary_response(
+        cast_to=typing.Union[models.Pet, models.Order, BinaryResponse]
+    )
+    adapter = registry.get(load_with)
+    rebuilt = filter_binary_response(
+        cast_to=typing.Union[models.Pet, models.Order, BinaryResponse]
+    )
+    assert registry.get(rebuilt) is adapter
+    assert registry.stats()["misses"] == 1
+
+
+def test_from_encodable_validates_through_registry():
+    """Tests that from_encodable still returns fully validated models."""
+    pet = from_encodable(data=PET_DATA, load_with=models.Pet)
+    assert isinstance(pet, models.Pet)
+    assert pet.photo_urls == ["string"]
+
+    pets = from_encodable(data=[PET_DATA, PET_DATA], load_with=typing.List[models.Pet])
+    assert [p.name for p in pets] == ["doggie", "doggie"]
+
+
+def test_to_encodable_shares_adapter_across_threads():
+    """Tests that concurrent serializers resolve to a single cached adapter."""
+    serializer_registry.clear()
+    item = {"id": 10, "pet_id": 198772, "quantity": 7, "status": "approved"}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(
+                lambda _: to_encodable(item=item, dump_with=params._SerializerOrder),
+                range(64),
+            )
+        )
+
+    assert all(
+        r == {"id": 10, "petId": 198772, "quantity": 7, "status": "approved"}
+        for r in results
+    )
+    stats = serializer_registry.stats()
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    # every lookup is counted exactly once
+    assert stats["hits"] + stats["misses"] == 64
@@ -0,0 +1,100 @@
+import httpx
+import pytest
+
+from pets_py.core import AuthBearer, AuthKey, SyncBaseClient
+
+
+def _client() -> SyncBaseClient:
+    client = SyncBaseClient(
+        base_url={
+            "__default_service__": "http://petstore.test/v3/",
+            "media": "http://media.petstore.test",
+        },
+        httpx_client=httpx.Client(),
+    )
+    client.register_auth("api_key", AuthKey(name="api_key", location="header", val="k"))
+    return client
+
+
+def test_build_request_reuses_operation_plan():
+    """Tests that static request parts are planned once per operation."""
+    client = _client()
+    first = client.build_request(
+        method="GET", path="/pet/1", auth_names=["api_key"], request_options={}
+    )
+    second = client.build_request(
+        method="GET",
+        path="pet/2",
+        auth_names=["api_key"],
+        query_params={"a": 1},
+        headers={"x-explicit": "1"},
+        request_options={"additional_headers": {"api_key": "override"}, "timeout": 5},
+    )
+    assert len(client._request_plans) == 1
+    assert first == {
+        "method": "GET",
+        "url": "http://petstore.test/v3/pet/1",
+        "headers": {"api_key": "k", "x-sideko-sdk-language": "Python"},
+    }
+    assert second == {
+        "method": "GET",
+        "url": "http://petstore.test/v3/pet/2",
+        "headers": {
+            "api_key": "override",
+            "x-sideko-sdk-language": "Python",
+            "x-explicit": "1",
+        },
+        "params": {"a": 1},
+        "timeout": 5,
+    }
+
+    media = client.build_request(
+        method="POST",
+        path="/upload",
+        service_name="media",
+        content_type="application/octet-stream",
+        content=b"\x00",
+    )
+    assert media["url"] == "http://media.petstore.test/upload"
+    assert media["headers"]["content-type"] == "application/octet-stream"
+    assert len(client._request_plans) == 2
+
+
+def test_register_auth_invalidates_plans():
+    """Tests that plans pick up auth providers registered after first use."""
+    client = _client()
+    cfg = client.build_request(method="GET", path="/pet/1", auth_names=["bearer"])
+    assert "Authorization" not in cfg["headers"]
+
+    client.register_auth("bearer", AuthBearer(token="t"))
+    cfg = client.build_request(method="GET", path="/pet/1", auth_names=["bearer"])
+    assert cfg["headers"]["Authorization"] == "Bearer t"
+
+    # provider values are still read on every call
+    client._auths["api_key"].set_value("rotated")
+    cfg = client.build_request(method="GET", path="/pet/1", auth_names=["api_key"])
+    assert cfg["headers"]["api_key"] == "rotated"
+
+
+def test_default_header_block_is_shared_and_frozen():
+    """Tests that calls without per-call headers share one read-only header block."""
+    client = _client()
+    first = client.build_request(method="GET", path="/pet/1", auth_names=["api_key"])
+    second = client.build_request(method="GET", path="/pet/2", auth_names=["api_key"])
+    assert first["headers"] is second["headers"]
+    with pytest.raises(TypeError):
+        first["headers"]["api_key"] = "x"  # type: ignore[index]
+
+    # per-call headers are layered on a copy
+    third = client.build_request(
+        method="GET", path="/pet/3", auth_names=["api_key"], headers={"x-a": "1"}
+    )
+    assert third["headers"]["x-a"] == "1"
+    assert "x-a" not in first["headers"]
+
+    # changing the auth value or the defaults rebuilds the block
+    client._auths["api_key"].set_value("rotated")
+    client.update_default_headers({"x-sideko-sdk-language": None, "user-agent": "pets"})
+    fourth = client.build_request(method="GET", path="/pet/4", auth_names=["api_key"])
+    assert fourth["headers"] == {"api_key": "rotated", "user-agent": "pets"}
+    assert first["headers"]["api_key"] == "k"
@@ -0,0 +1,133 @@
+import json
+import typing
+
+import httpx
+import pytest
+
+from pets_py import Client
+from pets_py.core import (
+    JsonCodec,
+    StdlibJsonCodec,
+    SyncBaseClient,
+    get_json_codec,
+)
+from pets_py.types import models
+
+PET = {"id": 10, "name": "doggie", "photoUrls": ["é"], "status": "available"}
+
+
+class RecordingCodec(StdlibJsonCodec):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls: typing.List[str] = []
+
+    def dumps(self, data: typing.Any) -> bytes:
+        self.calls.append("dumps")
+        return super().dumps(data)
+
+    def loads(self, data: typing.Any) -> typing.Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+def _client(codec: typing.Any, requests: typing.List[httpx.Request]) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            content=json.dumps(PET).encode(),
+            headers={"content-type": "application/json"},
+        )
+
+    return Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test",
+        json_codec=codec,
+    )
+
+
+def test_build_request_sends_codec_bytes():
+    """Tests that JSON bodies are sent as pre-encoded bytes with a content type."""
+    client = SyncBaseClient(
+        base_url="http://petstore.test", httpx_client=httpx.Client()
+    )
+    cfg = client.build_request(method="POST", path="/pet", json=PET)
+    assert "json" not in cfg
+    assert (
+        cfg["content"]
+        == json.dumps(PET, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+    assert cfg["headers"]["content-type"] == "application/json"
+
+    cfg = client.build_request(
+        method="POST",
+        path="/pet",
+        json=PET,
+        content_type="application/merge-patch+json",
+    )
+    assert cfg["headers"]["content-type"] == "application/merge-patch+json"
+
+
+def test_client_codec_used_for_requests_and_untyped_responses():
+    """Tests that a client's codec encodes bodies and decodes non-validated responses."""
+    codec = RecordingCodec()
+    requests: typing.List[httpx.Request] = []
+    client = _client(codec, requests)
+
+    client._base_client.request(
+        method="POST", path="/pet", json=PET, cast_to=typing.Any
+    )
+    assert codec.calls == ["dumps", "loads"]
+    assert json.loads(requests[0].content) == PET
+
+    # typed responses are still validated straight from bytes by pydantic
+    codec.calls.clear()
+    assert isinstance(client.pet.get(pet_id=10), models.Pet)
+    assert codec.calls == []
+
+    # trusted validation decodes with the codec
+    pet = client.pet.get(pet_id=10, request_options={"validation": "trusted"})
+    assert isinstance(pet, models.Pet)
+    assert codec.calls == ["loads"]
+
+
+def test_client_codec_used_for_sdk_request_bodies():
+    """Tests that request bodies falling back to the pydantic serializer are
+    encoded by the client's codec."""
+    codec = RecordingCodec()
+    requests: typing.List[httpx.Request] = []
+    client = _client(codec, requests)
+
+    # "10" needs coercion, so the compiled encoder hands over to the codec
+    client.pet.create(name="doggie", photo_urls=["é"], id="10")  # type: ignore[arg-type]
+    assert codec.calls == ["dumps"]
+    assert json.loads(requests[0].content) == {
+        "id": 10,
+        "name": "doggie",
+        "photoUrls": ["é"],
+    }
+
+
+def test_orjson_codec():
+    """Tests the opt-in orjson codec end to end."""
+    pytest.importorskip("orjson")
+    codec = get_json_codec("orjson")
+    assert codec.name == "orjson"
+    requests: typing.List[httpx.Request] = []
+    client = _client("orjson", requests)
+    data = client._base_client.request(
+        method="POST", path="/pet", json=PET, cast_to=typing.Any
+    )
+    assert data == PET
+    assert json.loads(requests[0].content) == PET
+
+
+def test_get_json_codec():
+    """Tests codec resolution by name and instance."""
+    assert get_json_codec(None) is get_json_codec("stdlib")
+    codec = RecordingCodec()
+    assert get_json_codec(codec) is codec
+    assert isinstance(codec, JsonCodec)
+    with pytest.raises(ValueError):
+        get_json_codec("simdjson")  # type: ignore[arg-type]
@@ -0,0 +1,127 @@
+import gzip
+import json
+import pathlib
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import compress_bytes, compress_stream, compression
+
+BODY = bytes(range(256)) * 100
+PET = {"name": "doggie", "photo_urls": ["https://img.example.com/1.jpg"] * 100}
+
+
+def _handler(requests: typing.List[httpx.Request]) -> typing.Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={"code": 200, "name": "doggie", "photoUrls": []},
+            headers={"content-type": "application/json"},
+        )
+
+    return handler
+
+
+def _client(requests: typing.List[httpx.Request], **kwargs: typing.Any) -> Client:
+    return Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(requests))),
+        base_url="http://petstore.test",
+        **kwargs,
+    )
+
+
+def test_json_bodies_are_compressed_above_threshold():
+    """Tests that JSON bodies are gzipped once they reach the threshold."""
+    requests: typing.List[httpx.Request] = []
+    client = _client(requests, request_compression="gzip", compression_threshold=512)
+    client.pet.create(**PET)
+    client.pet.create(name="doggie", photo_urls=[])
+
+    compressed, small = requests
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-length"] == str(len(compressed.content))
+    assert json.loads(gzip.decompress(compressed.content))["name"] == "doggie"
+    assert "content-encoding" not in small.headers
+    assert json.loads(small.content) == {"name": "doggie", "photoUrls": []}
+
+
+def test_request_options_override_compression():
+    """Tests that request options enable, disable and tune compression per call."""
+    requests: typing.List[httpx.Request] = []
+    client = _client(requests)
+    client.pet.create(**PET)
+    client.pet.create(**PET, request_options={"request_compression": "gzip"})
+    client.pet.create(
+        name="doggie",
+        photo_urls=[],
+        request_options={"request_compression": "gzip", "compression_threshold": 0},
+    )
+    client = _client(requests, request_compression="gzip")
+    client.pet.create(**PET, request_options={"request_compression": None})
+    client.pet.create(
+        **PET, request_options={"additional_headers": {"Content-Encoding": "br"}}
+    )
+
+    encodings = [r.headers.get("content-encoding") for r in requests]
+    assert encodings == [None, "gzip", "gzip", None, "br"]
+
+
+def test_uploads_are_compressed_while_streaming(tmp_path: pathlib.Path):
+    """Tests that streamed uploads are compressed chunk by chunk."""
+    path = tmp_path / "pet.png"
+    path.write_bytes(BODY)
+    requests: typing.List[httpx.Request] = []
+    client = _client(requests, request_compression="gzip")
+    client.pet.upload_image.create(data=path, pet_id=1)
+
+    request = requests[0]
+    assert request.headers["content-encoding"] == "gzip"
+    assert request.headers["transfer-encoding"] == "chunked"
+    assert "content-length" not in request.headers
+    assert gzip.decompress(request.content) == BODY
+
+
+@pytest.mark.asyncio
+async def test_async_compression(tmp_path: pathlib.Path):
+    """Tests compression of async JSON bodies and uploads."""
+    path = tmp_path / "pet.png"
+    path.write_bytes(BODY)
+    requests: typing.List[httpx.Request] = []
+    client = AsyncClient(
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_handler(requests))
+        ),
+        base_url="http://petstore.test",
+        request_compression="gzip",
+    )
+    await client.pet.create(**PET)
+    await client.pet.upload_image.create(data=path, pet_id=1)
+
+    for request in requests:
+        assert request.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(await requests[0].aread()))["name"] == "doggie"
+    assert gzip.decompress(await requests[1].aread()) == BODY
+
+
+def test_zstd_compression():
+    """Tests zstd bodies when a zstd implementation is available."""
+    if compression.zstd is None and compression.zstandard is None:
+        with pytest.raises(ImportError):
+            Client(base_url="http://petstore.test", request_compression="zstd")
+        pytest.skip("zstandard is not installed")
+    zstandard = pytest.importorskip("zstandard")
+    data = compress_bytes(BODY, "zstd")
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(data) == BODY
+    streamed = b"".join(compress_stream([BODY[:100], BODY[100:]], "zstd"))
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(streamed) == BODY
+
+
+def test_gzip_is_deterministic():
+    """Tests that whole and streamed gzip bodies match and carry no timestamp."""
+    whole = compress_bytes(BODY, "gzip")
+    assert whole == b"".join(compress_stream([BODY[:10], BODY[10:]], "gzip"))
+    assert whole[4:8] == b"\x00\x00\x00\x00"
+    assert gzip.decompress(whole) == BODY
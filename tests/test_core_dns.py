@@ -0,0 +1,123 @@
+import http.server
+import threading
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import AsyncDnsCacheTransport, DnsCache, DnsCacheTransport
+
+PET = b'{"id":10,"name":"doggie","photoUrls":[],"status":"available"}'
+
+
+class PetHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hosts: typing.List[str] = []
+
+    def do_GET(self) -> None:
+        self.hosts.append(self.headers["host"])
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(PET)))
+        self.end_headers()
+        self.wfile.write(PET)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def port() -> typing.Iterator[int]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PetHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_pinned_hosts_are_never_resolved(port: int):
+    """Tests that pinned hosts connect to their pinned address, keeping the hostname
+    in the Host header."""
+    cache = DnsCache(pins={"petstore.test": "127.0.0.1"})
+    client = Client(base_url=f"http://petstore.test:{port}/api/v3", dns_cache=cache)
+    assert client.pet.get(pet_id=10).name == "doggie"
+    assert PetHandler.hosts[-1] == f"petstore.test:{port}"
+    assert cache.stats() == {"hits": 1, "misses": 0, "size": 0}
+
+
+def test_resolved_addresses_are_cached_for_their_ttl():
+    """Tests that lookups are served from the cache until the TTL expires."""
+    cache = DnsCache()
+    addresses = cache.resolve("localhost", 80)
+    assert addresses
+    assert cache.resolve("LOCALHOST", 80) == addresses
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    # IP addresses are used as they are
+    assert cache.resolve("127.0.0.1", 80) == ["127.0.0.1"]
+    assert cache.stats()["hits"] == 1
+
+    uncached = DnsCache(ttl=0)
+    uncached.resolve("localhost", 80)
+    uncached.resolve("localhost", 80)
+    assert uncached.stats() == {"hits": 0, "misses": 2, "size": 0}
+
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_connections_are_spread_across_addresses():
+    """Tests that successive lookups rotate through a host's addresses."""
+    pins = {"petstore.test": ["127.0.0.2", "127.0.0.1"]}
+    cache = DnsCache(pins=pins)
+    assert cache.resolve("petstore.test", 80) == ["127.0.0.2", "127.0.0.1"]
+    assert cache.resolve("petstore.test", 80) == ["127.0.0.1", "127.0.0.2"]
+    assert cache.resolve("petstore.test", 80) == ["127.0.0.2", "127.0.0.1"]
+    fixed = DnsCache(pins=pins, spread=False)
+    assert fixed.resolve("petstore.test", 80) == fixed.resolve("petstore.test", 80)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_addresses_fall_back_to_the_next(port: int):
+    """Tests that a connection tries the host's next address when one is refused."""
+    # nothing listens on 127.0.0.2
+    cache = DnsCache(pins={"petstore.test": ["127.0.0.2", "127.0.0.1"]})
+    client = AsyncClient(
+        base_url=f"http://petstore.test:{port}/api/v3",
+        dns_cache=cache,
+        max_keepalive_connections=0,
+    )
+    for _ in range(2):
+        pet = await client.pet.get(pet_id=10)
+        assert pet.name == "doggie"
+    assert cache.stats()["hits"] == 2
+
+
+def test_clients_resolve_through_the_cache():
+    """Tests that clients given a DnsCache build transports resolving through it."""
+    cache = DnsCache()
+    transport = Client(dns_cache=cache)._base_client.httpx_client._transport
+    assert isinstance(transport, DnsCacheTransport)
+    assert transport.dns_cache is cache
+    async_transport = AsyncClient(dns_cache=cache)._base_client.httpx_client._transport
+    assert isinstance(async_transport, AsyncDnsCacheTransport)
+    assert not isinstance(
+        Client()._base_client.httpx_client._transport, DnsCacheTransport
+    )
+
+    with pytest.raises(ValueError):
+        DnsCache(pins={"petstore.test": "not-an-address"})
+    with pytest.raises(ValueError):
+        DnsCache(ttl=-1)
+
+
+def test_unresolvable_hosts_raise_connect_errors():
+    """Tests that resolution failures surface as httpx connection errors."""
+    cache = DnsCache()
+    client = httpx.Client(transport=DnsCacheTransport(cache))
+    with pytest.raises(httpx.ConnectError):
+        # empty labels are rejected by the resolver without a network lookup
+        client.get("http://invalid..host/")
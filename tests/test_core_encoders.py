@@ -0,0 +1,173 @@
+import json
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from pets_py import Client
+from pets_py.core import (
+    FormEncoder,
+    encoder_for,
+    json_dumps,
+    to_encodable,
+    to_form_urlencoded,
+    to_json_bytes,
+    urlencode_form,
+)
+from pets_py.core.type_utils import NOT_GIVEN
+from pets_py.types import params
+
+PETS: typing.List[typing.Dict[str, typing.Any]] = [
+    {
+        "category": {"id": 1, "name": "Dogs"},
+        "id": 10,
+        "status": "available",
+        "tags": [{"id": 1, "name": 'é "quoted"\n'}, {"name": "no-id"}],
+        "name": "doggie",
+        "photo_urls": ["https://img.example.com/1.jpg"],
+    },
+    # NotGiven dropped, explicit None kept, unknown keys ignored
+    {
+        "category": NOT_GIVEN,
+        "id": None,
+        "status": NOT_GIVEN,
+        "tags": None,
+        "name": "d",
+        "photo_urls": [],
+        "unknown": 1,
+    },
+    # fields given by alias
+    {"name": "d", "photoUrls": ["x"], "category": {"name": "Cats", "id": NOT_GIVEN}},
+    # values that need pydantic's coercion
+    {"name": "d", "photo_urls": ("x",), "id": "10"},
+    {"name": "d", "photo_urls": ["x"], "id": True},
+]
+
+
+@pytest.mark.parametrize("item", PETS)
+def test_to_json_bytes_matches_serializer(item: typing.Dict[str, typing.Any]):
+    """Tests that compiled and pydantic encodings produce identical bytes."""
+    expected = json_dumps(to_encodable(item=item, dump_with=params._SerializerPet))
+    assert to_json_bytes(item=item, dump_with=params._SerializerPet) == expected
+
+
+def test_to_json_bytes_raises_validation_errors():
+    """Tests that invalid bodies still raise pydantic's validation errors."""
+    with pytest.raises(pydantic.ValidationError):
+        to_json_bytes(
+            item={"name": "d", "photo_urls": ["x"], "status": "retired"},
+            dump_with=params._SerializerPet,
+        )
+    with pytest.raises(pydantic.ValidationError):
+        to_json_bytes(
+            item={"name": None, "photo_urls": []}, dump_with=params._SerializerPet
+        )
+    with pytest.raises(pydantic.ValidationError):
+        to_json_bytes(item={"photo_urls": []}, dump_with=params._SerializerPet)
+
+
+def test_encoders_compile_for_every_serializer():
+    """Tests that all body serializers have a compiled encoder."""
+    for serializer in [
+        params._SerializerPet,
+        params._SerializerOrder,
+        params._SerializerTag,
+        params._SerializerCategory,
+    ]:
+        assert encoder_for(serializer) is not None
+    assert encoder_for(typing.List[params._SerializerPet]) is None
+    order = {"pet_id": 1, "quantity": 2, "complete": False, "ship_date": "2024-01-01"}
+    assert to_json_bytes(item=order, dump_with=params._SerializerOrder) == json_dumps(
+        to_encodable(item=order, dump_with=params._SerializerOrder)
+    )
+
+
+def test_pet_create_sends_encoded_body():
+    """Tests that the pet client sends the compiled JSON body."""
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, content=request.content, headers={"content-type": "application/json"}
+        )
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test",
+    )
+    pet = client.pet.create(name="doggie", photo_urls=["string"], id=10)
+    assert pet.id == 10  # type: ignore[union-attr]
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == {
+        "id": 10,
+        "name": "doggie",
+        "photoUrls": ["string"],
+    }
+
+
+ORDER_STYLE: typing.Dict[str, typing.Any] = {
+    key: "form" for key in ["complete", "id", "petId", "quantity", "shipDate", "status"]
+}
+ORDER_EXPLODE = {key: True for key in ORDER_STYLE}
+ORDERS: typing.List[typing.Dict[str, typing.Any]] = [
+    {
+        "complete": True,
+        "id": 10,
+        "pet_id": 198772,
+        "quantity": 7,
+        "ship_date": "1970-01-01T00:00:00 é&=+/",
+        "status": "approved",
+    },
+    # NotGiven dropped, None sent as an empty value
+    {"complete": None, "id": NOT_GIVEN, "pet_id": None, "status": NOT_GIVEN},
+    # fields given by alias, values that need pydantic's coercion
+    {"complete": False, "petId": 3, "id": "10", "quantity": True},
+    {},
+]
+
+
+@pytest.mark.parametrize("item", ORDERS)
+def test_form_encoder_matches_httpx(item: typing.Dict[str, typing.Any]):
+    """Tests that compiled form bodies match httpx's encoding of the form data."""
+    data = to_form_urlencoded(
+        item=item,
+        dump_with=params._SerializerOrder,
+        style=ORDER_STYLE,
+        explode=ORDER_EXPLODE,
+    )
+    expected = httpx.Request("POST", "http://petstore.test", data=data).content
+    assert urlencode_form(data) == expected
+    encoder = FormEncoder(
+        dump_with=params._SerializerOrder, style=ORDER_STYLE, explode=ORDER_EXPLODE
+    )
+    assert encoder.encode(item) == expected
+
+
+def test_form_encoder_raises_validation_errors():
+    """Tests that invalid form bodies still raise pydantic's validation errors."""
+    encoder = FormEncoder(
+        dump_with=params._SerializerOrder, style=ORDER_STYLE, explode=ORDER_EXPLODE
+    )
+    with pytest.raises(pydantic.ValidationError):
+        encoder.encode({"status": "lost"})
+
+
+def test_order_create_sends_form_body():
+    """Tests that the order client sends the compiled form body."""
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"id": 10}, headers={"content-type": "application/json"}
+        )
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test",
+    )
+    client.store.order.create(id=10, pet_id=198772, complete=False, status="placed")
+    assert requests[0].headers["content-type"] == "application/x-www-form-urlencoded"
+    assert requests[0].content == b"complete=false&id=10&petId=198772&status=placed"
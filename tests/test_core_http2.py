@@ -0,0 +1,147 @@
+import asyncio
+import socket
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import (
+    AsyncStreamLimitTransport,
+    SyncStreamLimitTransport,
+    pool_limits,
+)
+
+h2_config = pytest.importorskip("h2.config")
+h2_connection = pytest.importorskip("h2.connection")
+h2_events = pytest.importorskip("h2.events")
+
+PET = b'{"id":10,"name":"doggie","photoUrls":[],"status":"available"}'
+
+
+class H2Server:
+    """Cleartext (prior knowledge) HTTP/2 server answering every request with a
+    pet after `delay` seconds, recording connections and concurrent streams."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(128)
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def __enter__(self) -> "H2Server":
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._serve(), self._loop).result()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self.sock.close()
+
+    async def _serve(self) -> None:
+        await asyncio.start_server(self._handle, sock=self.sock)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        conn = h2_connection.H2Connection(
+            config=h2_config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2_events.RequestReceived):
+                    asyncio.ensure_future(self._respond(conn, writer, event.stream_id))
+            writer.write(conn.data_to_send())
+        writer.close()
+
+    async def _respond(
+        self, conn: typing.Any, writer: asyncio.StreamWriter, stream_id: int
+    ) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(PET))),
+            ],
+        )
+        conn.send_data(stream_id, PET, end_stream=True)
+        writer.write(conn.data_to_send())
+
+
+def test_clients_build_http2_transports():
+    """Tests that http2=True multiplexes requests through a stream-limited transport."""
+    client = Client(http2=True, max_concurrent_streams=8)
+    transport = client._base_client.httpx_client._transport
+    assert isinstance(transport, SyncStreamLimitTransport)
+    assert transport.max_concurrent_streams == 8
+    assert transport.transport._pool._http2  # type: ignore[attr-defined]
+
+    async_client = AsyncClient(http2=True)
+    async_transport = async_client._base_client.httpx_client._transport
+    assert isinstance(async_transport, AsyncStreamLimitTransport)
+    assert async_transport.transport._pool._http2  # type: ignore[attr-defined]
+
+    assert not Client()._base_client.httpx_client._transport._pool._http2  # type: ignore
+
+    with pytest.raises(ValueError):
+        Client(http2=True, max_concurrent_streams=0)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_is_multiplexed_with_a_stream_limit():
+    """Tests that concurrent calls share one HTTP/2 connection and never exceed the
+    per-connection stream limit."""
+    with H2Server(delay=0.02) as server:
+        transport = AsyncStreamLimitTransport(
+            httpx.AsyncHTTPTransport(http1=False, http2=True, limits=pool_limits()),
+            max_concurrent_streams=4,
+        )
+        client = AsyncClient(
+            httpx_client=httpx.AsyncClient(transport=transport),
+            base_url=server.url,
+        )
+        pets = await asyncio.gather(*[client.pet.get(pet_id=10) for _ in range(20)])
+        await client._base_client.httpx_client.aclose()
+
+    assert [pet.name for pet in pets] == ["doggie"] * 20
+    assert server.connections == 1
+    assert server.max_active == 4
+
+
+def test_waiting_for_a_stream_respects_the_pool_timeout():
+    """Tests that requests waiting for a free stream raise a pool timeout."""
+    with H2Server(delay=0.5) as server:
+        transport = SyncStreamLimitTransport(
+            httpx.HTTPTransport(http1=False, http2=True), max_concurrent_streams=1
+        )
+        with httpx.Client(transport=transport, timeout=5) as httpx_client:
+            client = Client(httpx_client=httpx_client, base_url=server.url)
+            first = threading.Thread(target=client.pet.get, kwargs={"pet_id": 1})
+            first.start()
+            while server.active == 0:
+                time.sleep(0.001)
+            with pytest.raises(httpx.PoolTimeout):
+                httpx_client.get(server.url, timeout=httpx.Timeout(5, pool=0.05))
+            first.join()
+            # the stream is released once the first response is read
+            assert client.pet.get(pet_id=2).name == "doggie"
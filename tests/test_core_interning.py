@@ -0,0 +1,87 @@
+import json
+import typing
+
+import httpx
+
+from pets_py import Client
+from pets_py.core import Interner
+from pets_py.types import models, records
+
+PETS = [
+    {
+        "id": i,
+        "name": f"pet-{i}",
+        "category": {"id": 1, "name": "Dogs"},
+        "photoUrls": [],
+        "tags": [{"id": i % 2, "name": "good"}],
+        "status": "available",
+    }
+    for i in range(6)
+]
+
+
+def _decode(n: int = 6) -> typing.List[models.Pet]:
+    return [models.Pet.model_validate_json(json.dumps(p)) for p in PETS[:n]]
+
+
+def test_interner_shares_strings_and_flyweights():
+    """Tests that equal strings and equal categories/tags end up as one object."""
+    interner = Interner(flyweight_types=[models.Category, models.Tag])
+    pets = interner.intern(_decode())
+    assert all(p.status is pets[0].status for p in pets)
+    assert all(p.category is pets[0].category for p in pets)
+    assert pets[0].tags[0] is pets[2].tags[0]
+    assert pets[0].tags[0] is not pets[1].tags[0]
+    assert [p.model_dump(by_alias=True) for p in pets] == [
+        p.model_dump(by_alias=True) for p in _decode()
+    ]
+    # names are unique; statuses, category/tag names and instances repeat
+    stats = interner.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (24, 12, 12)
+    assert stats["hit_rate"] == 24 / 36
+
+
+def test_interner_table_is_bounded():
+    """Tests that the flyweight table evicts the least recently used entries."""
+    interner = Interner(flyweight_types=[records.Tag], max_size=2, intern_strings=False)
+    tags = [records.Tag(id=i % 3, name="t") for i in range(6)]
+    shared = interner.intern(tags)
+    assert shared[0] == tags[0]
+    stats = interner.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 4
+    assert stats["hits"] == 0
+
+    interner.clear()
+    assert interner.stats()["size"] == 0
+
+
+def test_interner_fields_set_is_part_of_identity():
+    """Tests that instances differing only in explicitly set fields stay apart."""
+    interner = Interner(flyweight_types=[models.Tag])
+    explicit = interner.intern(models.Tag(id=None, name="x"))
+    implicit = interner.intern(models.Tag(name="x"))
+    assert explicit is not implicit
+    assert implicit.model_dump(exclude_unset=True) == {"name": "x"}
+
+
+def test_client_interns_responses():
+    """Tests that a client configured with an interner applies it to responses."""
+    interner = Interner(flyweight_types=[records.Category, records.Tag])
+    client = Client(
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    content=json.dumps(PETS).encode(),
+                    headers={"content-type": "application/json"},
+                )
+            )
+        ),
+        base_url="http://petstore.test",
+        response_format="record",
+        interner=interner,
+    )
+    pets = client.pet.find_by_status.list()
+    assert all(p.category is pets[0].category for p in pets)
+    assert interner.stats()["hit_rate"] > 0.5
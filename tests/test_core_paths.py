@@ -0,0 +1,91 @@
+import enum
+import typing
+
+import httpx
+import pytest
+
+from pets_py import Client
+from pets_py.core import PathTemplate, SyncBaseClient, path_template
+
+
+class Kind(str, enum.Enum):
+    DOG = "dog"
+
+
+def test_path_template_encodes_parameters():
+    """Tests that parameters are validated and percent-encoded into one segment."""
+    template = PathTemplate("/pet/{petId}/photos/{name}")
+    assert template.names == ("petId", "name")
+    assert template.format({"petId": 10, "name": "a"}) == "pet/10/photos/a"
+    assert (
+        template.format({"petId": Kind.DOG, "name": "a b/c?d#é"})
+        == "pet/dog/photos/a%20b%2Fc%3Fd%23%C3%A9"
+    )
+    assert template.format({"petId": True, "name": 1.5}) == "pet/true/photos/1.5"
+    assert template.format({"petId": ".", "name": ".."}) == "pet/%2E/photos/%2E%2E"
+    assert template.format({"petId": "...", "name": ".a"}) == "pet/.../photos/.a"
+
+    for params in [
+        {"petId": 1},
+        {"petId": 1, "name": ""},
+        {"petId": None, "name": "a"},
+    ]:
+        with pytest.raises(ValueError):
+            template.format(params)
+    with pytest.raises(ValueError):
+        PathTemplate("/pet/{petId")
+    assert path_template("/pet/{petId}") is path_template("/pet/{petId}")
+
+
+def test_base_url_prefixes_are_normalized():
+    """Tests that service prefixes end with exactly one slash."""
+    client = SyncBaseClient(
+        base_url={
+            "__default_service__": "http://petstore.test/v3//",
+            "media": "http://media.petstore.test",
+        },
+        httpx_client=httpx.Client(),
+    )
+    assert client.build_url("/pet/1") == "http://petstore.test/v3/pet/1"
+    assert client.build_url("pet/1", service_name="media") == (
+        "http://media.petstore.test/pet/1"
+    )
+    cfg = client.build_request(
+        method="GET", path=PathTemplate("/pet/{petId}"), path_params={"petId": "a/b"}
+    )
+    assert cfg["url"] == "http://petstore.test/v3/pet/a%2Fb"
+    cfg = client.build_request(
+        method="GET", path=PathTemplate("/pet/{petId}"), path_params={"petId": ".."}
+    )
+    assert httpx.URL(cfg["url"]).raw_path == b"/v3/pet/%2E%2E"
+    cfg = client.build_request(
+        method="GET", path="/pet/{petId}", path_params={"petId": 7}
+    )
+    assert cfg["url"] == "http://petstore.test/v3/pet/7"
+
+
+def test_requests_use_path_templates():
+    """Tests that resource clients send encoded template paths as parsed URLs."""
+    urls: typing.List[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(request.url)
+        return httpx.Response(
+            200,
+            json=[] if request.url.params else {"id": 1},
+            headers={"content-type": "application/json"},
+        )
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test/api/v3/",
+    )
+    options: typing.Any = {"validation": "trusted"}
+    client.pet.get(pet_id=10, request_options=options)
+    client.store.order.get(order_id=3, request_options=options)
+    client.pet.find_by_status.list(status="sold", request_options=options)
+    assert [str(url) for url in urls] == [
+        "http://petstore.test/api/v3/pet/10",
+        "http://petstore.test/api/v3/store/order/3",
+        "http://petstore.test/api/v3/pet/findByStatus?status=sold",
+    ]
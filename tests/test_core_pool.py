@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    client_timeout,
+    pool_limits,
+)
+
+
+def test_clients_use_default_pool_settings():
+    """Tests that clients keep every pooled connection alive by default."""
+    for client in [Client(), AsyncClient()]:
+        httpx_client = client._base_client.httpx_client
+        pool = httpx_client._transport._pool  # type: ignore[union-attr]
+        assert pool._max_connections == DEFAULT_MAX_CONNECTIONS
+        assert pool._max_keepalive_connections == DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        assert pool._keepalive_expiry == DEFAULT_KEEPALIVE_EXPIRY
+        assert httpx_client.timeout.pool == 60
+
+
+def test_clients_apply_pool_settings():
+    """Tests that pool settings are passed to the clients' connection pools."""
+    for client in [
+        Client(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=1.5,
+            pool_timeout=0.25,
+            timeout=10,
+        ),
+        AsyncClient(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=1.5,
+            pool_timeout=0.25,
+            timeout=10,
+        ),
+    ]:
+        httpx_client = client._base_client.httpx_client
+        pool = httpx_client._transport._pool  # type: ignore[union-attr]
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 4
+        assert pool._keepalive_expiry == 1.5
+        assert httpx_client.timeout.pool == 0.25
+        assert httpx_client.timeout.read == 10
+
+
+def test_custom_httpx_client_is_left_unchanged():
+    """Tests that pool settings do not override a user-provided httpx client."""
+    httpx_client = httpx.Client(limits=httpx.Limits(max_connections=3))
+    client = Client(httpx_client=httpx_client, max_connections=8)
+    assert client._base_client.httpx_client is httpx_client
+    assert httpx_client._transport._pool._max_connections == 3  # type: ignore
+
+
+def test_invalid_pool_limits_raise():
+    """Tests that invalid pool limits are rejected."""
+    with pytest.raises(ValueError):
+        pool_limits(max_connections=0)
+    with pytest.raises(ValueError):
+        Client(max_connections=0)
+    limits = pool_limits(max_connections=None, max_keepalive_connections=None)
+    assert limits.max_connections is None
+
+
+def test_keepalive_connections_are_capped_by_max_connections():
+    """Tests that no more connections are kept alive than can be open."""
+    assert pool_limits(max_connections=4).max_keepalive_connections == 4
+    limits = pool_limits(max_connections=4, max_keepalive_connections=None)
+    assert limits.max_keepalive_connections == 4
+    pool = Client(max_connections=8)._base_client.httpx_client._transport._pool  # type: ignore
+    assert pool._max_keepalive_connections == 8
+
+
+def test_pool_timeout_defaults_to_timeout():
+    """Tests that the pool timeout falls back to the request timeout."""
+    assert client_timeout(30).pool == 30
+    assert client_timeout(30, pool_timeout=1).pool == 1
+    assert client_timeout(None).pool is None
@@ -0,0 +1,100 @@
+import typing
+
+import httpx
+import pytest
+
+from pets_py import Client
+from pets_py.core import (
+    QueryParamEncoder,
+    encode_query_param,
+    encode_query_string,
+    query_param_encoder,
+)
+
+CASES: typing.List[
+    typing.Tuple[str, bool, typing.Any, typing.Dict[str, typing.Any]]
+] = [
+    ("form", True, "a b", {"id": "a b"}),
+    ("form", True, [3, 4], {"id": [3, 4]}),
+    ("form", False, [3, "x", True, None, 1.5], {"id": "3,x,true,null,1.5"}),
+    ("form", True, {"k0": 1, "k1": "v"}, {"k0": "1", "k1": "v"}),
+    ("form", False, {"k0": 1, "k1": False}, {"id": "k0,1,k1,false"}),
+    ("spaceDelimited", False, [3, 4], {"id": "3 4"}),
+    ("spaceDelimited", True, [3, 4], {"id": [3, 4]}),
+    ("pipeDelimited", False, [3, 4], {"id": "3|4"}),
+    ("pipeDelimited", False, {"k": 1}, {"id": "k,1"}),
+    (
+        "deepObject",
+        True,
+        {"a": {"b": [1, {"c": "d"}]}, "e": None},
+        {"id[a][b][0]": "1", "id[a][b][1][c]": "d", "id[e]": "null"},
+    ),
+    ("deepObject", True, 5, {"id": 5}),
+]
+
+
+@pytest.mark.parametrize("style,explode,value,expected", CASES)
+def test_query_param_encoder(
+    style: typing.Any, explode: bool, value: typing.Any, expected: typing.Any
+):
+    """Tests the compiled encoding of every style and explode combination."""
+    params: typing.Dict[str, typing.Any] = {}
+    QueryParamEncoder("id", style=style, explode=explode).encode(params, value)
+    assert params == expected
+
+    params = {}
+    encode_query_param(params, "id", value, style=style, explode=explode)
+    assert params == expected
+
+
+def test_query_param_encoder_is_cached():
+    """Tests that encoders are compiled once per name, style and explode."""
+    assert query_param_encoder("id") is query_param_encoder("id")
+    assert query_param_encoder("id") is not query_param_encoder("id", explode=False)
+    with pytest.raises(NotImplementedError):
+        QueryParamEncoder("id", style="matrix")  # type: ignore[arg-type]
+
+
+def test_encode_query_string_matches_httpx():
+    """Tests that final query strings match httpx's encoding of params."""
+    params = {
+        "status": ["available", "sold"],
+        "flag": True,
+        "off": False,
+        "none": None,
+        "n": 1.5,
+        "q": "é &=+/?",
+        "t": ("a", 1),
+    }
+    assert encode_query_string(params) == str(httpx.QueryParams(params))
+
+
+def test_request_sends_final_query_string():
+    """Tests that requests carry the encoded query string, and that params are
+    still merged by httpx when the httpx client has its own."""
+    urls: typing.List[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(request.url)
+        return httpx.Response(
+            200, json=[], headers={"content-type": "application/json"}
+        )
+
+    for client_params in [None, {"trace": "1", "status": "pending"}]:
+        client = Client(
+            httpx_client=httpx.Client(
+                transport=httpx.MockTransport(handler), params=client_params
+            ),
+            base_url="http://petstore.test",
+        )
+        client.pet.find_by_status.list(
+            status="sold",
+            request_options={"additional_params": {"page": 2, "q": "a b"}},
+        )
+
+    assert (
+        str(urls[0]) == "http://petstore.test/pet/findByStatus?status=sold&page=2&q=a+b"
+    )
+    assert urls[1].params == httpx.QueryParams(
+        {"trace": "1", "status": "sold", "page": "2", "q": "a b"}
+    )
@@ -0,0 +1,237 @@
+import concurrent.futures
+import copy
+import json
+import pickle
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import (
+    ApiError,
+    BinaryResponse,
+    JsonArrayDecoder,
+    LazyModel,
+    ResponseValidator,
+    SyncBaseClient,
+)
+from pets_py.types import models
+
+PET = {
+    "id": 10,
+    "name": "doggie",
+    "category": {"id": 1, "name": "Dogs"},
+    "photoUrls": ["string"],
+    "tags": [{"id": 0, "name": "string"}],
+    "status": "available",
+}
+
+
+def _client() -> SyncBaseClient:
+    return SyncBaseClient(base_url="http://petstore.test", httpx_client=httpx.Client())
+
+
+def _json_response(body: typing.Any, content_type: str = "application/json"):
+    return httpx.Response(
+        200, content=json.dumps(body).encode(), headers={"content-type": content_type}
+    )
+
+
+def test_process_response_validates_raw_bytes():
+    """Tests that JSON bodies are validated straight from bytes into models."""
+    pets = _client().process_response(
+        response=_json_response([PET, PET]),
+        cast_to=typing.Union[typing.List[models.Pet], BinaryResponse],
+    )
+    assert len(pets) == 2
+    assert all(isinstance(p, models.Pet) for p in pets)
+    assert pets[0].category == models.Category(id=1, name="Dogs")
+
+
+def test_process_response_non_utf8_charset_falls_back():
+    """Tests that JSON bodies in other charsets are still decoded correctly."""
+    body = json.dumps({"code": 1, "message": "café"}).encode("utf-16")
+    response = httpx.Response(
+        200, content=body, headers={"content-type": "application/json; charset=utf-16"}
+    )
+    result = _client().process_response(response=response, cast_to=models.ApiResponse)
+    assert result == models.ApiResponse(code=1, message="café")
+
+
+def test_trusted_validation_constructs_nested_models():
+    """Tests that trusted mode builds nested models without validating them."""
+    client = SyncBaseClient(
+        base_url="http://petstore.test",
+        httpx_client=httpx.Client(),
+        response_validator=ResponseValidator(mode="trusted"),
+    )
+    pet = client.process_response(
+        response=_json_response({**PET, "id": "not-an-int"}), cast_to=models.Pet
+    )
+    assert isinstance(pet, models.Pet)
+    assert isinstance(pet.category, models.Category)
+    assert isinstance(pet.tags[0], models.Tag)
+    assert pet.id == "not-an-int"
+    assert pet.photo_urls == ["string"]
+
+
+def test_strict_validation_per_request():
+    """Tests that a request can opt into strict validation."""
+    response = _json_response({"code": "1", "message": "ok"})
+    assert _client().process_response(
+        response=response, cast_to=models.ApiResponse
+    ) == models.ApiResponse(code=1, message="ok")
+    with pytest.raises(pydantic.ValidationError):
+        _client().process_response(
+            response=response, cast_to=models.ApiResponse, validation="strict"
+        )
+
+
+def test_sampled_validation_reports_drift():
+    """Tests that sampled mode validates one in N responses and reports drift."""
+    drift: typing.List[typing.Any] = []
+    client = SyncBaseClient(
+        base_url="http://petstore.test",
+        httpx_client=httpx.Client(),
+        response_validator=ResponseValidator(
+            mode="sampled", sample_rate=3, on_drift=lambda e, t: drift.append(t)
+        ),
+    )
+    for _ in range(6):
+        pet = client.process_response(
+            response=_json_response({**PET, "status": "retired"}), cast_to=models.Pet
+        )
+        assert pet.status == "retired"
+
+    assert client.response_validator.stats() == {"sampled": 2, "skipped": 4, "drift": 2}
+    assert drift == [models.Pet, models.Pet]
+
+
+def test_sampled_validation_counts_across_threads():
+    """Tests that concurrent sampled responses are each counted exactly once."""
+    validator = ResponseValidator(mode="sampled", sample_rate=4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(
+            pool.map(
+                lambda _: validator.load_python(data=PET, load_with=models.Pet),
+                range(400),
+            )
+        )
+    assert validator.stats() == {"sampled": 100, "skipped": 300, "drift": 0}
+
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    return _json_response([PET, {**PET, "id": 11, "status": "sold"}])
+
+
+def test_lazy_response_format_sync_client():
+    """Tests that the sync client can return lazily decoded pets."""
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_mock_handler)),
+        base_url="http://petstore.test",
+        response_format="lazy",
+    )
+    pets = client.pet.find_by_status.list(status="available")
+    assert all(isinstance(p, LazyModel) for p in pets)
+    assert [(p.id, p.status) for p in pets] == [(10, "available"), (11, "sold")]
+    # untouched nested fields are never decoded
+    assert "category" not in pets[0]._values
+    assert pets[0].category.name == "Dogs"
+    assert pets[1].model_dump(by_alias=True) == models.Pet.model_validate(
+        {**PET, "id": 11, "status": "sold"}
+    ).model_dump(by_alias=True)
+
+
+@pytest.mark.asyncio
+async def test_lazy_response_format_async_request_option():
+    """Tests that the async client can opt into lazy decoding per request."""
+    client = AsyncClient(
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_mock_handler)),
+        base_url="http://petstore.test",
+    )
+    pets = await client.pet.find_by_status.list(
+        request_options={"response_format": "lazy"}
+    )
+    assert isinstance(pets[0], LazyModel)
+    assert pets[0] == models.Pet.model_validate(PET)
+    assert isinstance((await client.pet.find_by_status.list())[0], models.Pet)
+
+
+def test_lazy_models_copy_and_pickle():
+    """Tests that lazy models survive copy and pickle, keeping decoded fields."""
+    lazy = LazyModel(models.Pet, PET)
+    assert lazy.category.name == "Dogs"
+    for clone in [
+        copy.copy(lazy),
+        copy.deepcopy(lazy),
+        pickle.loads(pickle.dumps(lazy)),
+    ]:
+        assert isinstance(clone, LazyModel)
+        assert clone.name == "doggie"
+        assert clone.category.name == "Dogs"
+        assert clone == models.Pet.model_validate(PET)
+    with pytest.raises(AttributeError):
+        LazyModel.__new__(LazyModel).name
+
+
+def test_json_array_decoder_handles_arbitrary_chunking():
+    """Tests that array elements are split correctly regardless of chunk boundaries."""
+    doc = json.dumps(
+        [PET, {"name": 'a,]}\\"[{', "photoUrls": []}, 1, "é", [], None],
+        ensure_ascii=False,
+    ).encode()
+    for size in range(1, 9):
+        decoder = JsonArrayDecoder()
+        items: typing.List[bytes] = []
+        for i in range(0, len(doc), size):
+            items.extend(decoder.feed(doc[i : i + size]))
+        decoder.close()
+        assert [json.loads(item) for item in items] == json.loads(doc)
+
+
+def test_json_array_decoder_rejects_invalid_documents():
+    """Tests that non-array and truncated documents are reported."""
+    with pytest.raises(ValueError):
+        JsonArrayDecoder().feed(b'{"id": 1}')
+    decoder = JsonArrayDecoder()
+    decoder.feed(b'[{"id": 1},')
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_iter_list_streams_pets_from_chunks():
+    """Tests that iter_list yields validated pets from a chunked body."""
+    body = json.dumps([{**PET, "id": i} for i in range(50)]).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunks = (body[i : i + 7] for i in range(0, len(body), 7))
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json"},
+            content=chunks,
+        )
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test",
+    )
+    pets = list(client.pet.find_by_status.iter_list(status="available"))
+    assert [p.id for p in pets] == list(range(50))
+    assert all(isinstance(p, models.Pet) for p in pets)
+
+
+def test_iter_list_raises_api_error():
+    """Tests that error statuses are raised before any element is decoded."""
+    client = Client(
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(400, json={"message": "bad status"})
+            )
+        ),
+        base_url="http://petstore.test",
+    )
+    with pytest.raises(ApiError) as e:
+        client.pet.find_by_status.iter_list()
+    assert e.value.status_code == 400
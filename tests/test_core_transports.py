@@ -0,0 +1,179 @@
+import asyncio
+import gc
+import http.server
+import threading
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import SharedTransport, TransportRegistry, shared_transports
+
+PET = b'{"id":10,"name":"doggie","photoUrls":[],"status":"available"}'
+
+
+class PetHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: typing.List[typing.Tuple[str, int]] = []
+
+    def do_GET(self) -> None:
+        # the API key and the client port of the connection it came on
+        self.seen.append((self.headers["api_key"], self.client_address[1]))
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(PET)))
+        self.end_headers()
+        self.wfile.write(PET)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> typing.Iterator[str]:
+    PetHandler.seen = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PetHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+    server.shutdown()
+    server.server_close()
+
+
+def _lease(client: typing.Union[Client, AsyncClient]) -> typing.Any:
+    return client._base_client.httpx_client._transport
+
+
+def test_tenants_share_one_pool_with_isolated_credentials(server_url: str):
+    """Tests that clients with different API keys reuse the same connection while
+    each sends its own key."""
+    first = Client(base_url=server_url, api_key="tenant-1", share_transport=True)
+    second = Client(base_url=server_url, api_key="tenant-2", share_transport=True)
+    lease = _lease(first)
+    assert isinstance(lease, SharedTransport)
+    assert _lease(second).transport is lease.transport
+    assert shared_transports.leases(lease.key) == 2
+
+    first.pet.get(pet_id=1)
+    second.pet.get(pet_id=2)
+    first.pet.get(pet_id=3)
+    assert [api_key for api_key, _ in PetHandler.seen] == [
+        "tenant-1",
+        "tenant-2",
+        "tenant-1",
+    ]
+    assert len({port for _, port in PetHandler.seen}) == 1
+
+    # the transport outlives the first client
+    first.close()
+    first.close()
+    assert shared_transports.leases(lease.key) == 1
+    assert second.pet.get(pet_id=4).name == "doggie"
+
+    second.close()
+    assert shared_transports.leases(lease.key) == 0
+    assert lease.transport._pool.connections == []
+
+
+def test_transports_are_shared_per_base_url_and_settings(server_url: str):
+    """Tests that clients only share transports with the same base URL and
+    connection settings."""
+    clients = [
+        Client(base_url=server_url, share_transport=True),
+        Client(base_url=server_url, share_transport=True, max_connections=8),
+        Client(base_url=server_url + "/", share_transport=True),
+    ]
+    assert len({id(_lease(client).transport) for client in clients}) == 3
+    assert not isinstance(_lease(Client(base_url=server_url)), SharedTransport)
+    key = _lease(clients[0]).key
+    assert shared_transports.leases(key) == 1
+    for client in clients:
+        client.close()
+    assert shared_transports.leases(key) == 0
+
+
+def test_closing_leaves_custom_httpx_clients_open(server_url: str):
+    """Tests that clients only close the httpx clients they built."""
+    httpx_client = httpx.Client()
+    with Client(base_url=server_url, httpx_client=httpx_client) as client:
+        client.pet.get(pet_id=1)
+    assert not httpx_client.is_closed
+    httpx_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_transports(server_url: str):
+    """Tests that async clients lease shared transports until they are closed."""
+    async with AsyncClient(
+        base_url=server_url, api_key="tenant-1", share_transport=True
+    ) as first:
+        async with AsyncClient(
+            base_url=server_url, api_key="tenant-2", share_transport=True
+        ) as second:
+            key = _lease(first).key
+            assert _lease(second).transport is _lease(first).transport
+            assert shared_transports.leases(key, is_async=True) == 2
+            await first.pet.get(pet_id=1)
+            await second.pet.get(pet_id=2)
+        assert shared_transports.leases(key, is_async=True) == 1
+    assert shared_transports.leases(key, is_async=True) == 0
+    assert [api_key for api_key, _ in PetHandler.seen] == ["tenant-1", "tenant-2"]
+    assert len({port for _, port in PetHandler.seen}) == 1
+
+
+def test_unclosed_clients_release_their_leases(server_url: str):
+    """Tests that clients garbage collected without being closed release their
+    lease."""
+    client = Client(base_url=server_url, share_transport=True)
+    client.pet.get(pet_id=1)
+    key, transport = _lease(client).key, _lease(client).transport
+    assert shared_transports.leases(key) == 1
+
+    del client
+    gc.collect()
+    assert shared_transports.leases(key) == 0
+    assert transport._pool.connections == []
+
+
+def test_async_clients_lease_a_transport_per_event_loop(server_url: str):
+    """Tests that async clients used from several event loops never share
+    connections between them."""
+    client = AsyncClient(base_url=server_url, share_transport=True)
+    key = _lease(client).key
+    registered = len(shared_transports)
+
+    async def get() -> typing.Any:
+        await client.pet.get(pet_id=1)
+        assert shared_transports.leases(key, is_async=True) == 1
+        return _lease(client).transport
+
+    first, second = asyncio.run(get()), asyncio.run(get())
+    assert first is not second
+    assert len(shared_transports) == registered + 2
+    assert len({port for _, port in PetHandler.seen}) == 2
+
+    asyncio.run(client.close())
+    assert len(shared_transports) == registered
+
+
+def test_registry_reference_counts_transports():
+    """Tests that a transport is created once and closed with its last lease."""
+    registry = TransportRegistry()
+    created: typing.List[httpx.MockTransport] = []
+
+    def factory() -> httpx.MockTransport:
+        created.append(httpx.MockTransport(lambda request: httpx.Response(200)))
+        return created[-1]
+
+    leases = [registry.lease("pets", factory) for _ in range(3)]
+    assert len(created) == 1
+    assert registry.leases("pets") == 3
+    assert len(registry) == 1
+    for lease in leases:
+        lease.close()
+    assert registry.leases("pets") == 0
+    assert len(registry) == 0
+    registry.lease("pets", factory)
+    assert len(created) == 2
@@ -0,0 +1,170 @@
+import io
+import os
+import pathlib
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import AsyncUpload, SyncUpload, to_async_upload, to_upload
+
+BODY = bytes(range(256)) * 1000
+
+
+def _handler(requests: typing.List[httpx.Request]) -> typing.Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"code": 200}, headers={"content-type": "application/json"}
+        )
+
+    return handler
+
+
+class ChunkRecorder(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads: typing.List[int] = []
+
+    def read(self, size: typing.Optional[int] = -1) -> bytes:
+        self.reads.append(-1 if size is None else size)
+        return super().read(size)
+
+
+def test_file_objects_are_read_in_chunks():
+    """Tests that file objects are streamed in fixed-size reads from their position."""
+    file = ChunkRecorder(b"skip" + BODY)
+    file.seek(4)
+    upload = to_upload(file=file, chunk_size=1000)
+    assert isinstance(upload, SyncUpload)
+    assert upload.content_length == len(BODY)
+    assert file.reads == []
+    assert b"".join(upload) == BODY
+    assert set(file.reads) == {1000}
+    # sending the body again (e.g. on redirects) rewinds the file
+    assert b"".join(upload) == BODY
+
+
+def test_non_streamed_bodies():
+    """Tests that in-memory bodies are sent as they are."""
+    assert to_upload(file=b"abc") == b"abc"
+    assert to_upload(file=("a.png", b"abc", "image/png")) == b"abc"
+    assert to_async_upload(file="abc") == "abc"
+    with pytest.raises(ValueError):
+        to_upload(file=io.BytesIO(), chunk_size=0)
+    # bools are not file descriptors
+    upload = to_upload(file=True)  # type: ignore[arg-type]
+    assert isinstance(upload, SyncUpload)
+    assert upload.content_length is None
+    with pytest.raises(TypeError):
+        b"".join(upload)
+
+
+def test_upload_image_streams_sizes_and_iterators(tmp_path: pathlib.Path):
+    """Tests that uploads send a Content-Length when the size is known and use
+    chunked transfer encoding otherwise."""
+    path = tmp_path / "pet.png"
+    path.write_bytes(BODY)
+    requests: typing.List[httpx.Request] = []
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(requests))),
+        base_url="http://petstore.test",
+    )
+
+    with open(path, "rb") as file:
+        client.pet.upload_image.create(data=file, pet_id=1)
+    client.pet.upload_image.create(data=path, pet_id=1)
+    client.pet.upload_image.create(data=("pet.png", io.BytesIO(BODY)), pet_id=1)
+    client.pet.upload_image.create(
+        data=(BODY[i : i + 4096] for i in range(0, len(BODY), 4096)), pet_id=1
+    )
+
+    for request in requests[:3]:
+        assert request.headers["content-length"] == str(len(BODY))
+        assert "transfer-encoding" not in request.headers
+        assert request.content == BODY
+    assert requests[3].headers["transfer-encoding"] == "chunked"
+    assert "content-length" not in requests[3].headers
+    assert requests[3].content == BODY
+
+
+def test_paths_fds_and_buffers_are_mapped(tmp_path: pathlib.Path):
+    """Tests that paths, file descriptors and buffers are sent as zero-copy views."""
+    path = tmp_path / "pet.png"
+    path.write_bytes(BODY)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.lseek(fd, 1000, os.SEEK_SET)
+        for source, expected in [
+            (path, BODY),
+            (fd, BODY[1000:]),
+            (bytearray(BODY), BODY),
+            (memoryview(BODY), BODY),
+        ]:
+            upload = to_upload(file=source, chunk_size=4096)
+            assert isinstance(upload, SyncUpload)
+            assert upload.content_length == len(expected)
+            chunks = list(upload)
+            assert all(isinstance(chunk, memoryview) for chunk in chunks)
+            assert b"".join(chunks) == expected
+            del chunks
+        # the descriptor's offset is left as it was
+        assert os.lseek(fd, 0, os.SEEK_CUR) == 1000
+    finally:
+        os.close(fd)
+
+    empty = tmp_path / "empty.png"
+    empty.write_bytes(b"")
+    assert list(to_upload(file=empty)) == []
+
+
+def test_pipes_are_read_in_chunks():
+    """Tests that descriptors that cannot be mapped are read with chunked encoding."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"abc")
+    os.close(write_fd)
+    try:
+        upload = to_upload(file=read_fd)
+        assert isinstance(upload, SyncUpload)
+        assert upload.content_length is None
+        assert b"".join(upload) == b"abc"
+    finally:
+        os.close(read_fd)
+
+
+@pytest.mark.asyncio
+async def test_async_upload_image_streams(tmp_path: pathlib.Path):
+    """Tests async uploads from file objects, paths and sync and async iterators."""
+    path = tmp_path / "pet.png"
+    path.write_bytes(BODY)
+    requests: typing.List[httpx.Request] = []
+    client = AsyncClient(
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_handler(requests))
+        ),
+        base_url="http://petstore.test",
+    )
+
+    async def chunks() -> typing.AsyncIterator[bytes]:
+        for i in range(0, len(BODY), 4096):
+            yield BODY[i : i + 4096]
+
+    assert isinstance(to_async_upload(file=path), AsyncUpload)
+    with open(path, "rb") as file:
+        await client.pet.upload_image.create(data=file, pet_id=1)
+    await client.pet.upload_image.create(data=path, pet_id=1)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        await client.pet.upload_image.create(data=fd, pet_id=1)
+    finally:
+        os.close(fd)
+    await client.pet.upload_image.create(data=chunks(), pet_id=1)
+    await client.pet.upload_image.create(data=iter([BODY[:10], BODY[10:]]), pet_id=1)
+
+    for request in requests[:3]:
+        assert request.headers["content-length"] == str(len(BODY))
+    for request in requests[3:]:
+        assert request.headers["transfer-encoding"] == "chunked"
+    for request in requests:
+        assert await request.aread() == BODY
@@ -0,0 +1,57 @@
+import typing
+
+import httpx
+import pytest
+
+from pets_py.core import BinaryResponse
+from pets_py.core.utils import (
+    filter_binary_response,
+    get_response_type,
+    is_raw_response_type,
+)
+from pets_py.types import models
+
+
+@pytest.mark.parametrize(
+    "content_type,expected",
+    [
+        ("application/json", "json"),
+        ("application/json; charset=utf-8", "json"),
+        ("application/problem+json", "json"),
+        ("Application/JSON", "json"),
+        ("text/plain", "text"),
+        ("image/png", "binary"),
+        ("", "binary"),
+        ("not a content type", "binary"),
+        (None, "binary"),
+    ],
+)
+def test_get_response_type(content_type: typing.Optional[str], expected: str):
+    """Tests content type classification, including missing and bogus headers."""
+    headers = httpx.Headers(
+        {} if content_type is None else {"content-type": content_type}
+    )
+    assert get_response_type(headers) == expected
+    # served from the cache the second time
+    assert get_response_type(headers) == expected
+
+
+def test_filter_binary_response_is_memoized():
+    """Tests that the filtered union is resolved once and reused."""
+    cast_to = typing.Union[models.Pet, models.Order, BinaryResponse]
+    first = filter_binary_response(cast_to=cast_to)
+    assert first == typing.Union[models.Pet, models.Order]
+    assert filter_binary_response(cast_to=cast_to) is first
+    assert (
+        filter_binary_response(cast_to=typing.Union[models.Pet, BinaryResponse])
+        is models.Pet
+    )
+    assert filter_binary_response(cast_to=models.Pet) is models.Pet
+
+
+def test_is_raw_response_type():
+    """Tests raw response detection for classes, generics and unions."""
+    assert is_raw_response_type(httpx.Response)
+    assert not is_raw_response_type(models.Pet)
+    assert not is_raw_response_type(typing.List[models.Pet])
+    assert not is_raw_response_type(typing.Union[models.Pet, BinaryResponse])
@@ -0,0 +1,95 @@
+import http.server
+import threading
+import typing
+
+import httpx
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import SyncBaseClient
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("content-length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> typing.Iterator[str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+    server.shutdown()
+    server.server_close()
+
+
+def _pooled(client: typing.Union[Client, AsyncClient]) -> int:
+    transport = client._base_client.httpx_client._transport
+    return len(transport._pool.connections)  # type: ignore[attr-defined]
+
+
+def test_warmup_opens_and_keeps_connections(server_url: str):
+    """Tests that a warmup opens the requested connections and reports their setup."""
+    client = Client(base_url=server_url)
+    setups = client.warmup(connections=3)
+    assert len(setups) == 3
+    assert _pooled(client) == 3
+    for setup in setups:
+        assert setup["service_name"] is None
+        assert setup["base_url"] == server_url
+        assert setup["tls"] is None
+        assert 0 < setup["connect"] == setup["total"]
+
+    # warm connections are reused rather than opened again
+    assert client.warmup(connections=1) == []
+
+
+def test_warmup_opens_many_connections(server_url: str):
+    """Tests that a warmup opens every requested connection, however many."""
+    client = Client(base_url=server_url, max_connections=64)
+    assert len(client.warmup(connections=40)) == 40
+    assert _pooled(client) == 40
+
+
+def test_warmup_covers_every_service(server_url: str):
+    """Tests that every configured base URL is warmed up."""
+    base_client = SyncBaseClient(
+        base_url={
+            "pets": server_url,
+            "store": server_url.replace("127.0.0.1", "localhost"),
+        },
+        httpx_client=httpx.Client(),
+    )
+    setups = base_client.warmup(connections=1)
+    assert sorted(setup["service_name"] for setup in setups) == ["pets", "store"]
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_opens_connections_concurrently(server_url: str):
+    """Tests that an async warmup opens one connection per concurrent request."""
+    client = AsyncClient(base_url=server_url)
+    setups = await client.warmup(connections=4)
+    assert len(setups) == 4
+    assert _pooled(client) == 4
+    await client._base_client.httpx_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warmup_errors():
+    """Tests that invalid counts and unreachable base URLs raise."""
+    with pytest.raises(ValueError):
+        Client().warmup(connections=0)
+    client = AsyncClient(base_url="http://127.0.0.1:1")
+    with pytest.raises(httpx.ConnectError):
+        await client.warmup(connections=2)
+    with pytest.raises(httpx.ConnectError):
+        Client(base_url="http://127.0.0.1:1").warmup(connections=2)
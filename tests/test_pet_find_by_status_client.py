@@ -128,3 +128,55 @@ async def test_await_list_200_success_all_params():
         is_valid_response_json = False
     is_valid_binary = isinstance(response, BinaryResponse)
     assert any([is_valid_response_json, is_valid_binary]), "failed response type check"
+
+
+def test_iter_list_200_success_required_only():
+    """Tests a streamed GET request to the /pet/findByStatus endpoint.
+
+    Operation: iter_list
+    Test Case ID: success_required_only
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.Iterator[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - The JSON array is decoded element by element
+    - Each element matches the expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests streaming the sync method with example data
+    client = Client(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    with client.pet.find_by_status.iter_list() as stream:
+        pets = list(stream)
+    assert all(
+        isinstance(pet, models.Pet) for pet in pets
+    ), "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_aiter_list_200_success_required_only():
+    """Tests a streamed GET request to the /pet/findByStatus endpoint.
+
+    Operation: aiter_list
+    Test Case ID: success_required_only
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.AsyncIterator[models.Pet]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - The JSON array is decoded element by element
+    - Each element matches the expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests streaming the async method with example data
+    client = AsyncClient(api_key="API_KEY", environment=Environment.MOCK_SERVER)
+    pets = [pet async for pet in await client.pet.find_by_status.aiter_list()]
+    assert all(
+        isinstance(pet, models.Pet) for pet in pets
+    ), "failed response type check"
@@ -0,0 +1,111 @@
+import json
+import typing
+
+import httpx
+import pytest
+
+from pets_py import Client, PetFrame
+from pets_py.types import models
+
+PETS = [
+    {
+        "id": i,
+        "name": f"pet-{i}",
+        "category": {"id": 1, "name": "Dogs"} if i % 2 else None,
+        "photoUrls": [f"https://img.example.com/{i}.jpg"] * (i % 3),
+        "tags": [{"id": i, "name": "good"}] if i % 4 == 0 else [],
+        "status": ["available", "pending", "sold"][i % 3],
+    }
+    for i in range(12)
+]
+
+
+def test_frame_round_trips_models():
+    """Tests that pets survive conversion to and from the columnar layout."""
+    pets = [models.Pet.model_validate(p) for p in PETS]
+    pets.append(models.Pet(name="no-id", photo_urls=[]))
+    frame = PetFrame.from_models(pets)
+    assert len(frame) == 13
+    assert frame.to_models() == pets
+    assert frame[-1].id is None and frame[-1].tags is None
+    assert PetFrame.from_json(PETS).to_models() == pets[:-1]
+
+
+def test_frame_filters():
+    """Tests status, id and tag filters and their combination."""
+    frame = PetFrame.from_json(PETS)
+    assert [p.id for p in frame.where(status=["sold"])] == [2, 5, 8, 11]
+    assert [p.id for p in frame.where(ids=[1, 4, 99])] == [1, 4]
+    assert [p.id for p in frame.where(tag_names=["good"], status=["available"])] == [0]
+    assert len(frame.where()) == len(frame)
+
+
+def test_frame_rejects_invalid_values():
+    """Tests that values are type checked while being packed."""
+    with pytest.raises(ValueError):
+        PetFrame.from_json([{**PETS[0], "status": "retired"}])
+    with pytest.raises(TypeError):
+        PetFrame.from_json([{**PETS[0], "id": "10"}])
+
+
+def test_frame_rolls_back_failed_rows():
+    """Tests that a row failing partway through leaves the columns aligned."""
+    frame = PetFrame.from_json(PETS[:2])
+    with pytest.raises(ValueError):
+        # every column before status has already taken the row's value
+        frame.extend([PETS[2], {**PETS[3], "status": "retired"}, PETS[4]])
+    assert {len(column) for column in frame.columns.values()} == {3}
+    assert frame.to_models() == PetFrame.from_json(PETS[:3]).to_models()
+
+
+def test_frame_response_format():
+    """Tests that bulk responses can be returned as a PetFrame."""
+    client = Client(
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    content=json.dumps(PETS).encode(),
+                    headers={"content-type": "application/json"},
+                )
+            )
+        ),
+        base_url="http://petstore.test",
+    )
+    frame = typing.cast(
+        PetFrame,
+        client.pet.find_by_status.list(request_options={"response_format": "frame"}),
+    )
+    assert isinstance(frame, PetFrame)
+    assert list(frame.ids.values) == list(range(12))
+
+
+def test_frame_response_format_falls_back_to_models():
+    """Tests that a client defaulting to frames returns models from endpoints
+    that do not return arrays of a model with a frame."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/findByStatus"):
+            body: typing.Any = PETS
+        elif request.url.path.startswith("/store/order/"):
+            body = {"id": 3, "petId": 1, "quantity": 2, "status": "placed"}
+        else:
+            body = PETS[1]
+        return httpx.Response(
+            200,
+            content=json.dumps(body).encode(),
+            headers={"content-type": "application/json"},
+        )
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_url="http://petstore.test",
+        response_format="frame",
+    )
+    assert isinstance(client.pet.find_by_status.list(), PetFrame)
+    pet = client.pet.get(pet_id=1)
+    assert isinstance(pet, models.Pet) and pet.name == "pet-1"
+    order = client.store.order.get(order_id=3)
+    assert isinstance(order, models.Order) and order.quantity == 2
+    created = client.pet.create(name="pet-1", photo_urls=[])
+    assert isinstance(created, models.Pet)
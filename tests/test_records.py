@@ -0,0 +1,89 @@
+import json
+import pickle
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from pets_py import AsyncClient, Client
+from pets_py.core import record_for
+from pets_py.types import models, records
+
+PET = {
+    "id": 10,
+    "name": "doggie",
+    "category": {"id": 1, "name": "Dogs"},
+    "photoUrls": ["string"],
+    "tags": [{"id": 0, "name": "string"}],
+    "status": "available",
+}
+
+
+def _transport(body: typing.Any) -> httpx.MockTransport:
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            content=json.dumps(body).encode(),
+            headers={"content-type": "application/json"},
+        )
+    )
+
+
+def test_record_round_trips_models():
+    """Tests that records convert to and from the pydantic models losslessly."""
+    pet = models.Pet.model_validate(PET)
+    record = records.Pet.from_model(pet)
+    assert record == records.Pet.from_json(PET)
+    assert record.photo_urls == ("string",)
+    assert record.category == records.Category(id=1, name="Dogs")
+    assert record.tags == (records.Tag(id=0, name="string"),)
+    assert record.to_model() == pet
+    assert record_for(models.Order) is records.Order
+
+
+def test_record_is_compact_and_immutable():
+    """Tests that records carry no __dict__, reject writes and are hashable."""
+    record = records.Pet.from_json(PET)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.name = "cat"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        record.extra = 1  # type: ignore[attr-defined]
+    assert len({record, records.Pet.from_json(dict(PET))}) == 1
+    assert pickle.loads(pickle.dumps(record)) == record
+    with pytest.raises(TypeError):
+        records.Tag(id=1, label="x")  # type: ignore[call-arg]
+
+
+def test_record_response_format_sync_client():
+    """Tests that the sync client returns validated records when asked."""
+    client = Client(
+        httpx_client=httpx.Client(transport=_transport([PET, PET])),
+        base_url="http://petstore.test",
+        response_format="record",
+    )
+    pets = client.pet.find_by_status.list(status="available")
+    assert all(isinstance(p, records.Pet) for p in pets)
+    assert pets[0] == pets[1]
+
+    invalid = Client(
+        httpx_client=httpx.Client(transport=_transport({**PET, "id": "x"})),
+        base_url="http://petstore.test",
+        response_format="record",
+    )
+    with pytest.raises(pydantic.ValidationError):
+        invalid.pet.get(pet_id=10)
+
+
+@pytest.mark.asyncio
+async def test_record_response_format_async_trusted():
+    """Tests that trusted record responses are built straight from the JSON."""
+    client = AsyncClient(
+        httpx_client=httpx.AsyncClient(transport=_transport({**PET, "id": "x"})),
+        base_url="http://petstore.test",
+        validation="trusted",
+    )
+    pet = await client.pet.get(pet_id=10, request_options={"response_format": "record"})
+    assert isinstance(pet, records.Pet)
+    assert pet.id == "x"